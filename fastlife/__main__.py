@@ -17,12 +17,27 @@ CLI program for running fastlife benchmarks and simulations.
 ## Imports
 ##########################################################################
 
+import os
 import argparse
 
+from functools import partial
+
+from . import bench as micro
 from .utils import sprofile
+from .census import Census
 from .version import get_version
 from .exceptions import ConsoleError
 from .sequential import SequentialLife
+from .vectorized import VectorizedLife
+from .ltl import LargerThanLife, BOSCO
+from .autotune import AutoLife
+from .tiled import TiledLife
+from .rle import RunLengthLife
+from .memoized import MemoizedLife
+from .static import StaticLife
+from .topology import TopologyLife, TOPOLOGIES, CONWAY
+from .differential import diverge, describe
+from .distributed import DistributedLife, serve
 
 
 ##########################################################################
@@ -34,6 +49,19 @@ DESCRIPTION = "experiments in Conway's Game of Life performance"
 EPILOG = "please report any bugs on GitHub issues"
 VERSION = f"{PROG} v{get_version()}"
 
+ENGINES = {
+    "sequential": SequentialLife,
+    "vectorized": VectorizedLife,
+    "distributed": DistributedLife,
+    "ltl": LargerThanLife,
+    "tiled": TiledLife,
+    "memoized": MemoizedLife,
+    "rle": RunLengthLife,
+    "topology": TopologyLife,
+    "static": StaticLife,
+    "auto": AutoLife,
+}
+
 
 ##########################################################################
 ## Console Commands
@@ -43,24 +71,126 @@ def run(args):
     """
     Run a game of life simulation.
     """
-    sim = SequentialLife(args.width, args.height)
+    kwargs = {}
+    if args.engine == "distributed":
+        if args.connect and not args.authkey:
+            raise ConsoleError("specify the --authkey of the workers to --connect to")
+        kwargs = {
+            "workers": args.workers, "halo": args.halo,
+            "addresses": args.connect, "authkey": args.authkey,
+        }
+    elif args.engine == "ltl":
+        kwargs = {"rule": args.rule or BOSCO}
+    elif args.engine == "topology":
+        kwargs = {
+            "topology": args.topology, "rule": args.rule or CONWAY, "wrap": args.wrap,
+            "twist": args.twist, "flip": args.flip,
+        }
+    elif args.engine == "tiled":
+        kwargs = {"tile": args.tile, "depth": args.depth}
+    elif args.engine == "memoized":
+        kwargs = {"block": args.block, "capacity": args.cache_size}
+    elif args.engine == "static":
+        kwargs = {"period": args.period}
+    elif args.engine == "auto":
+        kwargs = {"cache": args.tuning_cache}
+
+    sim = ENGINES[args.engine](args.width, args.height, **kwargs)
     if args.file:
         sim.load(args.file)
     else:
         sim.randomize(args.seed)
 
-    runner = sim.animate if args.animate else sim.run
+    if args.animate:
+        runner = sim.animate
+    elif args.tty:
+        runner = partial(sim.tty, fps=args.fps)
+    else:
+        runner = sim.run
+
     runner = sprofile(runner) if args.profile else runner
     runner(steps=args.steps)
 
+    if args.engine in ("distributed", "auto"):
+        print(sim.report())
+        sim.close()
+    elif args.engine in ("memoized", "static"):
+        print(sim.report())
+
 
 def bench(args):
     """
     Run game of life benchmarks.
     """
-    raise ConsoleError("not implemented yet")
+    if not args.micro:
+        raise ConsoleError("only micro benchmarks are implemented, specify --micro")
+
+    os.makedirs(args.output, exist_ok=True)
+    results = micro.run(sizes=args.sizes, repeat=args.repeat, groups=args.groups)
+    micro.write(results, os.path.join(args.output, "micro_benchmarks.csv"))
+    print(micro.report(results))
+
+    profiles = {}
+    if args.memory:
+        profiles = micro.profile(args.output, size=args.memory_size, groups=args.groups)
+
+    if args.figures:
+        for path in micro.figures(results, profiles, args.output):
+            print(f"saved {path}")
 
 
+def verify(args):
+    """
+    Run several engines in lockstep and report the first generation they diverge.
+    """
+    engines = {name: ENGINES[name] for name in args.engines}
+    divergence = diverge(
+        engines, args.width, args.height, args.steps, seed=args.seed, path=args.file,
+        stride=args.stride,
+    )
+
+    if divergence is not None:
+        raise ConsoleError(describe(divergence))
+    print(f"{len(engines)} engines agree for {args.steps} generations")
+
+
+def census(args):
+    """
+    Run random soups to stabilization and tally the remaining objects.
+    """
+    tally = Census(
+        args.output, size=args.size, margin=args.margin,
+        max_generations=args.max_generations,
+    )
+
+    seeds = range(args.start, args.start + args.soups)
+    rate = tally.run(seeds, processes=args.processes)
+
+    print(f"{tally.soups} soups in {args.output} ({rate:0.1f} soups/sec this run)")
+    for name, count in tally.objects.most_common(args.top):
+        print(f"  {name:<20} {count:>10}")
+
+
+def worker(args):
+    """
+    Serve a domain of a distributed simulation to a coordinator.
+    """
+    try:
+        serve(args.bind, authkey=args.authkey)
+    except KeyboardInterrupt:
+        pass
+
+
+def address(val):
+    """
+    Parse a host:port address for argparse.
+    """
+    host, _, port = val.rpartition(":")
+    try:
+        return (host or "localhost", int(port))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{val}' is not a valid host:port address")
+
 
 ##########################################################################
 ## Main Method and Argument Parsing
@@ -99,7 +229,11 @@ def main():
                 },
                 ("-f", "--file"): {
                     "type": str, "default": None, "metavar": "PATH",
-                    "help": "initialize the simulation from a data file",
+                    "help": "initialize the simulation from a data or RLE file",
+                },
+                ("-e", "--engine"): {
+                    "type": str, "default": "sequential", "choices": list(ENGINES),
+                    "help": "the simulation implementation to run",
                 },
                 ("-S", "--seed"): {
                     "type": int, "default": None, "metavar": "N",
@@ -109,6 +243,14 @@ def main():
                     "action": "store_true",
                     "help": "animate the progress of the simulation",
                 },
+                ("-t", "--tty"): {
+                    "action": "store_true",
+                    "help": "draw the progress of the simulation in the terminal",
+                },
+                ("--fps",): {
+                    "type": float, "default": 10, "metavar": "F",
+                    "help": "maximum frames per second to draw with --tty",
+                },
                 ("-P", "--profile"): {
                     "action": "store_true",
                     "help": "profile stack calls for the simulation",
@@ -117,13 +259,194 @@ def main():
                     "type": int, "default": 150, "metavar": "T",
                     "help": "maximum number of steps to simulate",
                 },
+                ("-w", "--workers"): {
+                    "type": int, "default": 4, "metavar": "N",
+                    "help": "number of local workers for the distributed engine",
+                },
+                ("-c", "--connect"): {
+                    "type": address, "default": None, "nargs": "+", "metavar": "ADDR",
+                    "help": "host:port of running workers for the distributed engine",
+                },
+                ("-k", "--authkey"): {
+                    "type": str.encode, "default": None, "metavar": "KEY",
+                    "help": "shared secret to authenticate with distributed workers",
+                },
+                ("-r", "--rule"): {
+                    "type": str, "default": None, "metavar": "RULE",
+                    "help": "the ltl rule in Evans' notation or topology rule in B/S",
+                },
+                ("--topology",): {
+                    "choices": list(TOPOLOGIES), "default": "moore",
+                    "help": "the lattice stepped by the topology engine",
+                },
+                ("--wrap",): {
+                    "action": "store_true", "default": False,
+                    "help": "wrap the lattice of the topology engine into a torus",
+                },
+                ("--twist",): {
+                    "type": int, "default": 0, "metavar": "N",
+                    "help": "columns shifted across the edge of a wrapped lattice",
+                },
+                ("--flip",): {
+                    "action": "store_true", "default": False,
+                    "help": "mirror columns across the top of a wrapped lattice",
+                },
+                ("--halo",): {
+                    "type": int, "default": 1, "metavar": "K",
+                    "help": "halo depth (generations per exchange) of distributed runs",
+                },
+                ("--tile",): {
+                    "type": int, "default": 512, "metavar": "T",
+                    "help": "width and height of the tiles of the tiled engine",
+                },
+                ("--depth",): {
+                    "type": int, "default": 8, "metavar": "K",
+                    "help": "generations per pass (halo depth) of the tiled engine",
+                },
+                ("--block",): {
+                    "type": int, "default": 8, "metavar": "B",
+                    "help": "width and height of the blocks of the memoized engine",
+                },
+                ("--cache-size",): {
+                    "type": int, "default": 65536, "metavar": "N",
+                    "help": "maximum block transitions cached by the memoized engine",
+                },
+                ("--period",): {
+                    "type": int, "default": 6, "metavar": "N",
+                    "help": "period of the tiles that the static engine stops stepping",
+                },
+                ("--tuning-cache",): {
+                    "type": str, "default": None, "metavar": "PATH",
+                    "help": "cache of autotuned configurations for the auto engine",
+                },
             },
         },
         "bench": {
             "func": bench,
             "description": "run game of life benchmarks",
-            "args": {},
-        }
+            "args": {
+                ("-m", "--micro"): {
+                    "action": "store_true",
+                    "help": "time the grid access paths and engine kernels",
+                },
+                ("-g", "--groups"): {
+                    "type": str, "nargs": "+", "default": ["access", "engine"],
+                    "choices": [micro.ACCESS, micro.ENGINE],
+                    "help": "the groups of micro benchmarks to run",
+                },
+                ("-s", "--sizes"): {
+                    "type": int, "nargs": "+", "default": list(micro.SIZES),
+                    "metavar": "N", "help": "the widths and heights of the worlds",
+                },
+                ("-r", "--repeat"): {
+                    "type": int, "default": 3, "metavar": "R",
+                    "help": "the number of timed calls of each benchmark",
+                },
+                ("-o", "--output"): {
+                    "type": str, "default": "benchmarks", "metavar": "DIR",
+                    "help": "directory to write results, profiles and figures to",
+                },
+                ("-M", "--memory"): {
+                    "action": "store_true",
+                    "help": "write mprofile memory curves of each benchmark",
+                },
+                ("--memory-size",): {
+                    "type": int, "default": 128, "metavar": "N",
+                    "help": "the width and height of the world to profile memory on",
+                },
+                ("-F", "--figures"): {
+                    "action": "store_true",
+                    "help": "regenerate the comparison figures in the output directory",
+                },
+            },
+        },
+        "verify": {
+            "func": verify,
+            "description": "check that engines compute identical generations",
+            "args": {
+                ("-e", "--engines"): {
+                    "type": str, "nargs": "+", "choices": list(ENGINES),
+                    "default": ["sequential", "vectorized"],
+                    "help": "the engines to compare, the first is the reference",
+                },
+                ("-W", "--width"): {
+                    "type": int, "default": 75, "metavar": "W",
+                    "help": "the number of columns in the simulation",
+                },
+                ("-H", "--height"): {
+                    "type": int, "default": 75, "metavar": "H",
+                    "help": "the number of rows in the simulation",
+                },
+                ("-f", "--file"): {
+                    "type": str, "default": None, "metavar": "PATH",
+                    "help": "initialize the simulations from a data file",
+                },
+                ("-S", "--seed"): {
+                    "type": int, "default": None, "metavar": "N",
+                    "help": "random seed to load randomized worlds with",
+                },
+                ("-s", "--steps"): {
+                    "type": int, "default": 150, "metavar": "T",
+                    "help": "number of generations to compare",
+                },
+                ("--stride",): {
+                    "type": int, "default": 1, "metavar": "K",
+                    "help": "compare fingerprints every K generations",
+                },
+            },
+        },
+        "census": {
+            "func": census,
+            "description": "tally the objects left behind by random soups",
+            "args": {
+                ("-n", "--soups"): {
+                    "type": int, "default": 1000, "metavar": "N",
+                    "help": "the number of soups (consecutive seeds) to run",
+                },
+                ("-S", "--start"): {
+                    "type": int, "default": 0, "metavar": "SEED",
+                    "help": "the seed of the first soup",
+                },
+                ("-o", "--output"): {
+                    "type": str, "default": "census.json", "metavar": "PATH",
+                    "help": "results file to merge tallies into and resume from",
+                },
+                ("-p", "--processes"): {
+                    "type": int, "default": None, "metavar": "N",
+                    "help": "number of worker processes, defaults to the cpu count",
+                },
+                ("--size",): {
+                    "type": int, "default": 16, "metavar": "S",
+                    "help": "the width and height of each soup",
+                },
+                ("--margin",): {
+                    "type": int, "default": 48, "metavar": "M",
+                    "help": "empty cells around the soup in its bounded world",
+                },
+                ("--max-generations",): {
+                    "type": int, "default": 10000, "metavar": "T",
+                    "help": "generations before a soup is counted as unstable",
+                },
+                ("--top",): {
+                    "type": int, "default": 10, "metavar": "K",
+                    "help": "the number of most common objects to print",
+                },
+            },
+        },
+        "worker": {
+            "func": worker,
+            "description": "serve domains to distributed simulations",
+            "args": {
+                ("-b", "--bind"): {
+                    "type": address, "default": ("localhost", 7331), "metavar": "ADDR",
+                    "help": "the host:port to listen for coordinators on",
+                },
+                ("-k", "--authkey"): {
+                    "type": str.encode, "required": True, "metavar": "KEY",
+                    "help": "shared secret that coordinators must authenticate with",
+                },
+            },
+        },
     }
 
     parser = argparse.ArgumentParser(prog=PROG, description=DESCRIPTION, epilog=EPILOG)
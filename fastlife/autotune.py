@@ -0,0 +1,457 @@
+# fastlife.autotune
+# Calibrates the engines on the actual world and runs the fastest configuration.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 27 10:05:41 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: autotune.py [] benjamin@bengfort.com $
+
+"""
+Calibrates the engines on the actual world and runs the fastest configuration.
+
+The fastest engine depends on the machine (the number of cores and the size of its
+caches) as well as on the world (its size and how many cells are alive), so rather
+than choosing by hand, each candidate configuration is run for a few generations on
+the world itself and the fastest is kept. Decisions are cached on disk keyed by the
+machine and the characteristics of the world so that calibration only happens once
+per kind of job, and the world is re-tuned whenever its density drifts far from the
+density it was tuned for, e.g. when a dense soup decays into sparse ash.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import glob
+import json
+import math
+import time
+import hashlib
+import platform
+import numpy as np
+
+from tqdm import tqdm
+from collections import namedtuple
+
+from .sequential import SequentialLife
+from .tiled import TiledLife
+from .vectorized import VectorizedLife
+from .distributed import DistributedLife
+from .exceptions import FastlifeError, FastlifeValueError
+
+
+CANDIDATE_ENGINES = {
+    "vectorized": VectorizedLife,
+    "tiled": TiledLife,
+    "distributed": DistributedLife,
+}
+
+# Worlds with fewer cells than these are never worth tiling or distributing
+MIN_TILED_CELLS = 1024 * 1024
+MIN_DISTRIBUTED_CELLS = 512 * 512
+
+DEFAULT_CACHE = os.path.join("~", ".cache", "fastlife", "autotune.json")
+
+
+Config = namedtuple("Config", "engine, options")
+Config.__doc__ = "An engine name and a tuple of sorted (keyword, value) options"
+
+
+def make_config(engine, **options):
+    """
+    Returns a hashable Config for the engine constructed with the keyword options.
+    """
+    if engine not in CANDIDATE_ENGINES:
+        raise FastlifeValueError(f"'{engine}' cannot be autotuned")
+    return Config(engine, tuple(sorted(options.items())))
+
+
+def describe(config):
+    """
+    Returns a short human readable description of the configuration.
+    """
+    options = " ".join(f"{key}={val}" for key, val in config.options)
+    return f"{config.engine} {options}".strip()
+
+
+##########################################################################
+## Machine and World Characteristics
+##########################################################################
+
+def cache_sizes():
+    """
+    Returns the size of each level of the CPU cache as reported by Linux sysfs, or an
+    empty dict on platforms that do not report them.
+    """
+    sizes = {}
+    for index in sorted(glob.glob("/sys/devices/system/cpu/cpu0/cache/index*")):
+        try:
+            with open(os.path.join(index, "level")) as f:
+                level = f.read().strip()
+            with open(os.path.join(index, "type")) as f:
+                kind = f.read().strip()
+            with open(os.path.join(index, "size")) as f:
+                size = f.read().strip()
+        except OSError:
+            continue
+
+        if kind != "Instruction":
+            sizes[f"L{level}"] = size
+    return sizes
+
+
+def cpus():
+    """
+    Returns the number of CPUs this process may run on.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def machine():
+    """
+    Returns the characteristics of this machine that affect which engine is fastest.
+    """
+    return {
+        "node": platform.node(),
+        "arch": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": cpus(),
+        "caches": cache_sizes(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+
+
+def density_bucket(density):
+    """
+    Returns the power of two bucket of the fraction of live cells, so that worlds
+    with similar densities share a bucket.
+    """
+    if density <= 0:
+        return -32
+    return max(-32, round(math.log2(density)))
+
+
+def world_key(world, node=None):
+    """
+    Returns the cache key of the world on the machine, made from a hash of the
+    machine's characteristics, the shape of the world and the bucket of its density.
+    """
+    node = node or machine()
+    digest = hashlib.sha1(json.dumps(node, sort_keys=True).encode("utf-8"))
+    height, width = world.shape
+    bucket = density_bucket(np.count_nonzero(world) / world.size)
+    return f"{digest.hexdigest()[:16]}:{height}x{width}:d{bucket}"
+
+
+##########################################################################
+## Calibration
+##########################################################################
+
+def candidates(shape, ncpus=None):
+    """
+    Returns the configurations worth calibrating for a world of the specified shape
+    on a machine with the specified number of CPUs.
+    """
+    ncpus = ncpus or cpus()
+    configs = [make_config("vectorized")]
+
+    height, width = shape
+    if height * width >= MIN_TILED_CELLS:
+        for tile in (256, 512, 1024):
+            configs.append(make_config("tiled", tile=tile, depth=8))
+
+    if height * width >= MIN_DISTRIBUTED_CELLS:
+        workers = 2
+        while workers <= ncpus:
+            for halo in (1, 4):
+                configs.append(make_config("distributed", workers=workers, halo=halo))
+            workers *= 2
+    return configs
+
+
+def build(config, world):
+    """
+    Constructs the engine for the configuration initialized with the world.
+    """
+    height, width = world.shape
+    sim = CANDIDATE_ENGINES[config.engine](width, height, **dict(config.options))
+    sim.populate(world)
+    return sim
+
+
+def close(sim):
+    if hasattr(sim, "close"):
+        sim.close()
+
+
+def calibrate(world, configs, steps=8):
+    """
+    Runs each configuration on a copy of the world for the specified number of
+    generations after a single warm up generation (which absorbs the cost of
+    starting workers and allocating buffers) and returns a list of the (seconds per
+    generation, config) pairs from fastest to slowest.
+    """
+    if steps < 1:
+        raise FastlifeValueError("calibration requires at least one generation")
+
+    timings = []
+    for config in configs:
+        sim = build(config, world)
+        try:
+            sim.run(1, progress=False)
+            start = time.perf_counter()
+            sim.run(steps, progress=False)
+            if hasattr(sim, "gather"):
+                sim.gather()
+            timings.append(((time.perf_counter() - start) / steps, config))
+        finally:
+            close(sim)
+
+    return sorted(timings, key=lambda timing: timing[0])
+
+
+class TuningCache(object):
+    """
+    Stores the fastest configuration for each world key in a JSON file on disk that
+    is atomically replaced whenever a decision is added.
+
+    Parameters
+    ----------
+    path : str, default: "~/.cache/fastlife/autotune.json"
+        The JSON file of cached decisions, created if it does not exist.
+    """
+
+    def __init__(self, path=None):
+        self.path = os.path.expanduser(path or DEFAULT_CACHE)
+        self.decisions = {}
+        if os.path.exists(self.path):
+            self.load()
+
+    def load(self):
+        with open(self.path, "r") as f:
+            self.decisions = json.load(f)
+
+    def save(self):
+        """
+        Atomically replace the cache file so that concurrent jobs never see a partial
+        write (the last writer wins if two jobs tune at the same time).
+        """
+        dirname = os.path.dirname(self.path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.decisions, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def get(self, key):
+        """
+        Returns the cached Config for the key or None if it has not been tuned.
+        """
+        decision = self.decisions.get(key)
+        if decision is None:
+            return None
+        return make_config(decision["engine"], **decision["options"])
+
+    def put(self, key, config, seconds):
+        self.decisions[key] = {
+            "engine": config.engine,
+            "options": dict(config.options),
+            "seconds": seconds,
+        }
+        self.save()
+
+    def __contains__(self, key):
+        return key in self.decisions
+
+
+##########################################################################
+## Autotuned Simulation
+##########################################################################
+
+class AutoLife(SequentialLife):
+    """
+    A Game of Life simulation that runs the fastest engine configuration for the
+    world on this machine. The configuration is looked up in the tuning cache or
+    calibrated on the world when the simulation first runs, and the live density is
+    checked periodically so that the world can be re-tuned (and moved to another
+    engine) when its density changes by more than the tolerance.
+
+    Parameters
+    ----------
+    width, height : int
+        The shape of the world.
+
+    cache : str, default: "~/.cache/fastlife/autotune.json"
+        The path of the tuning cache.
+
+    steps : int, default: 8
+        The number of generations each candidate is timed for during calibration.
+
+    interval : int, default: 64
+        The number of generations between checks of the live density.
+
+    tolerance : float, default: 4.0
+        Re-tune when the density has grown or shrunk by more than this factor since
+        the world was last tuned.
+
+    configs : list of Config, default: None
+        The configurations to calibrate, by default all of the candidates for the
+        shape of the world and the number of CPUs.
+    """
+
+    def __init__(self, width=512, height=512, cache=None, steps=8, interval=64,
+                 tolerance=4.0, configs=None):
+        super(AutoLife, self).__init__(width, height)
+        if interval < 1:
+            raise FastlifeValueError("the density check interval must be at least 1")
+        if tolerance <= 1:
+            raise FastlifeValueError("the density tolerance must be greater than 1")
+
+        self.cache = TuningCache(cache)
+        self.steps = steps
+        self.interval = interval
+        self.tolerance = tolerance
+        self.configs = configs
+
+        self.engine = None
+        self.config = None
+        self.density = None
+        self.checked = 0
+        self.switches = []
+
+    @property
+    def cframe(self):
+        if self.engine is not None:
+            return self.engine.cframe
+        return self.frames[self.frame]
+
+    @property
+    def nframe(self):
+        if self.engine is not None:
+            return self.engine.nframe
+        return self.frames[1-self.frame]
+
+    def load(self, path):
+        self._detach()
+        super(AutoLife, self).load(path)
+
+    def randomize(self, seed=None):
+        self._detach()
+        super(AutoLife, self).randomize(seed)
+
+    def populate(self, world):
+        self._detach()
+        super(AutoLife, self).populate(world)
+
+    def tune(self):
+        """
+        Choose the configuration for the current world, calibrating the candidates if
+        the decision is not cached, and move the world to its engine.
+        """
+        world = np.array(self.cframe._world)
+        key = world_key(world)
+        config = self.cache.get(key)
+
+        if config is None:
+            configs = self.configs or candidates(world.shape)
+            seconds, config = calibrate(world, configs, self.steps)[0]
+            self.cache.put(key, config, seconds)
+
+        self.density = np.count_nonzero(world) / world.size
+        self.checked = self.now
+        if config != self.config:
+            self._switch(config, world)
+        return config
+
+    def check(self):
+        """
+        Re-tune if the density has drifted beyond the tolerance since the last tuning
+        and return True if the world was moved to another engine.
+        """
+        world = self.cframe._world
+        density = np.count_nonzero(world) / world.size
+        self.checked = self.now
+
+        lo, hi = sorted((density, self.density))
+        if hi == 0 or (lo > 0 and hi / lo <= self.tolerance):
+            return False
+
+        config = self.config
+        return self.tune() != config
+
+    def step(self):
+        """
+        Execute the next step in the simulation with the tuned engine.
+        """
+        self.run(1, progress=False)
+
+    def run(self, steps=100, progress=True):
+        """
+        Run the simulation for the specified number of steps from the current state,
+        handing the tuned engine as many generations at a time as possible between
+        density checks.
+        """
+        if not self.initialized:
+            raise FastlifeError("the game of life simulation has not been initialized")
+
+        if self.engine is None:
+            self.tune()
+
+        with tqdm(total=steps, disable=not progress) as pbar:
+            remaining = steps
+            while remaining > 0:
+                generations = min(remaining, self.checked + self.interval - self.now)
+                self.engine.run(generations, progress=False)
+                self.now += generations
+                pbar.update(generations)
+                remaining -= generations
+
+                if self.now - self.checked >= self.interval:
+                    self.check()
+
+    def report(self):
+        """
+        Returns a summary of the configurations the simulation ran with.
+        """
+        lines = [f"{len(self.switches)} autotuned configurations:"]
+        for now, config in self.switches:
+            lines.append(f"  from generation {now}: {describe(config)}")
+        return "\n".join(lines)
+
+    def close(self):
+        """
+        Close the current engine, moving the world back to this simulation.
+        """
+        self._detach()
+
+    def _switch(self, config, world):
+        engine = build(config, world)
+        self._detach(keep=False)
+        self.engine, self.config = engine, config
+        self.switches.append((self.now, config))
+
+    def _detach(self, keep=True):
+        # Copy the world out of the engine so that it remains the current frame
+        if self.engine is None:
+            return
+
+        if keep:
+            self.frames[self.frame]._world[:] = self.engine.cframe._world
+            self.frames[self.frame].invalidate()
+        close(self.engine)
+        self.engine, self.config = None, None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
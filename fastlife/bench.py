@@ -0,0 +1,300 @@
+# fastlife.bench
+# Micro-benchmarks of the grid access paths and engine kernels.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 26 09:48:12 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: bench.py [] benjamin@bengfort.com $
+
+"""
+Micro-benchmarks of the grid access paths and engine kernels.
+
+Every benchmark is timed across a range of world sizes so that the performance claims
+in the documentation can be checked on any machine. The memory used by each benchmark
+is sampled with memory_profiler and written in the mprofile format so that the curves
+can be loaded with :func:`~fastlife.utils.load_mprofile` and plotted together.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import csv
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+
+from tqdm import tqdm
+from collections import namedtuple
+from memory_profiler import memory_usage
+
+from .grid import Grid
+from .utils import load_mprofile
+from .ltl import LargerThanLife
+from .tiled import TiledLife
+from .rle import RunLengthLife
+from .topology import TopologyLife
+from .memoized import MemoizedLife
+from .static import StaticLife
+from .sequential import SequentialLife
+from .vectorized import VectorizedLife
+from .exceptions import FastlifeValueError
+
+
+ACCESS = "access"
+ENGINE = "engine"
+
+SIZES = (32, 64, 128, 256)
+
+Result = namedtuple("Result", "group, name, size, repeat, best, mean, per_cell")
+Result.__doc__ = "The best and mean seconds of a benchmark and the best per cell"
+
+
+##########################################################################
+## Benchmarks
+##########################################################################
+
+def _sweep(method):
+    """
+    Returns a benchmark that calls the access method for every cell of the grid.
+    """
+    def sweep(grid):
+        height, width = grid.shape
+        for i in range(height):
+            for j in range(width):
+                method(grid, i, j)
+    return sweep
+
+
+# Each access path is used the way the sequential engine would use it, i.e. the
+# neighborhood has to be summed by the caller unless the method returns the sum.
+ACCESS_PATHS = {
+    "neighborhood": _sweep(lambda grid, i, j: sum(grid.neighborhood(i, j))),
+    "neighborhood_sum": _sweep(lambda grid, i, j: grid.neighborhood_sum(i, j)),
+    "neighborhood_array": _sweep(
+        lambda grid, i, j: grid.neighborhood_array(i, j).sum()
+    ),
+}
+
+ENGINES = {
+    "sequential": SequentialLife,
+    "vectorized": VectorizedLife,
+    "ltl": LargerThanLife,
+    "tiled": TiledLife,
+    "memoized": MemoizedLife,
+    "rle": RunLengthLife,
+    "topology": TopologyLife,
+    "static": StaticLife,
+}
+
+
+def setup(group, name, size, seed=42):
+    """
+    Returns a function with no arguments that runs a single iteration of the named
+    benchmark on a randomized square world of the specified size. All allocation
+    happens here so that only the access path or kernel itself is measured.
+    """
+    if group == ACCESS:
+        if name not in ACCESS_PATHS:
+            raise FastlifeValueError(f"unknown access path '{name}'")
+        grid = Grid(size, size)
+        grid._world[:] = np.random.default_rng(seed).integers(0, 2, grid.shape)
+        sweep = ACCESS_PATHS[name]
+        return lambda: sweep(grid)
+
+    if group == ENGINE:
+        if name not in ENGINES:
+            raise FastlifeValueError(f"unknown engine '{name}'")
+        sim = ENGINES[name](size, size)
+        sim.randomize(seed)
+        return sim.step
+
+    raise FastlifeValueError(f"unknown benchmark group '{group}'")
+
+
+def timeit(func, repeat=3):
+    """
+    Returns the wall clock seconds of each of repeat calls to the function.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def benchmarks(groups=(ACCESS, ENGINE)):
+    """
+    Returns the (group, name) of every benchmark in the specified groups.
+    """
+    names = {ACCESS: ACCESS_PATHS, ENGINE: ENGINES}
+    for group in groups:
+        if group not in names:
+            raise FastlifeValueError(f"unknown benchmark group '{group}'")
+    return [(group, name) for group in groups for name in names[group]]
+
+
+def run(sizes=SIZES, repeat=3, groups=(ACCESS, ENGINE), seed=42, progress=True):
+    """
+    Times every benchmark in the groups on each world size and returns a list of
+    results. Each benchmark is called once before it is timed to warm up any lazily
+    allocated buffers.
+    """
+    cases = [(g, name, size) for g, name in benchmarks(groups) for size in sizes]
+
+    results = []
+    for group, name, size in tqdm(cases, disable=not progress):
+        func = setup(group, name, size, seed)
+        func()
+
+        times = timeit(func, repeat)
+        best = min(times)
+        results.append(Result(
+            group, name, size, repeat, best, sum(times) / len(times), best / size**2,
+        ))
+    return results
+
+
+def write(results, path):
+    """
+    Write the benchmark results to a CSV file.
+    """
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(Result._fields)
+        writer.writerows(results)
+
+
+def report(results):
+    """
+    Returns a table of the results for printing.
+    """
+    lines = [f"{'benchmark':<28} {'size':>6} {'best (s)':>12} {'per cell (µs)':>14}"]
+    for r in results:
+        name = f"{r.group}:{r.name}"
+        lines.append(
+            f"{name:<28} {r.size:>6} {r.best:>12.6f} {r.per_cell*1e6:>14.4f}"
+        )
+    return "\n".join(lines)
+
+
+##########################################################################
+## Memory Profiles
+##########################################################################
+
+def mprofile(group, name, size, path, iterations=1, interval=0.01, seed=42):
+    """
+    Samples the memory used while the benchmark is run for the number of iterations
+    and writes the samples to path in the mprofile format. The world is allocated
+    while sampling so that the curve includes the memory of the world itself.
+    """
+    def target():
+        func = setup(group, name, size, seed)
+        for _ in range(iterations):
+            func()
+
+    samples = memory_usage((target, (), {}), interval=interval, timestamps=True)
+    with open(path, "w") as f:
+        f.write(f"CMDLINE {group}:{name} {size}x{size}\n")
+        for mem, ts in samples:
+            f.write(f"MEM {mem:0.6f} {ts:0.4f}\n")
+    return path
+
+
+def profile(outdir, size=128, groups=(ACCESS, ENGINE), iterations=1, interval=0.01):
+    """
+    Writes a memory profile of every benchmark in the groups to the output directory
+    and returns a dict of the paths by (group, name).
+    """
+    paths = {}
+    for group, name in benchmarks(groups):
+        path = os.path.join(outdir, f"mprofile_{group}_{name}_{size}.dat")
+        paths[(group, name)] = mprofile(group, name, size, path, iterations, interval)
+    return paths
+
+
+##########################################################################
+## Figures
+##########################################################################
+
+def plot_timings(results, group, ax=None):
+    """
+    Plot the best seconds per cell of each benchmark in the group by world size.
+    """
+    if ax is None:
+        _, ax = plt.subplots(figsize=(9, 6))
+
+    for name in sorted({r.name for r in results if r.group == group}):
+        rows = sorted(
+            (r.size, r.per_cell) for r in results
+            if r.group == group and r.name == name
+        )
+        sizes, per_cell = zip(*rows)
+        ax.plot(sizes, np.asarray(per_cell) * 1e6, marker="o", label=name)
+
+    ax.set_xscale("log", base=2)
+    ax.set_yscale("log")
+    ax.set_xlabel("world width and height (cells)")
+    ax.set_ylabel("µs per cell")
+    ax.set_title(f"{group} benchmarks")
+    ax.legend()
+    return ax
+
+
+def plot_memory(paths, ax=None):
+    """
+    Plot the memory profiles in the mprofile files against time.
+    """
+    if ax is None:
+        _, ax = plt.subplots(figsize=(9, 6))
+
+    for path in paths:
+        series = load_mprofile(path)
+        ax.plot(series.index, series.values, label=series.name)
+
+    ax.set_xlabel("time (seconds)")
+    ax.set_ylabel("memory used (MiB)")
+    ax.set_title("memory usage")
+    ax.legend()
+    return ax
+
+
+def figures(results, profiles, outdir):
+    """
+    Regenerates the comparison figures in the output directory from the timing
+    results and the (group, name) to mprofile path dict, returning the saved paths.
+    """
+    saved = []
+    groups = [g for g in (ACCESS, ENGINE) if any(r.group == g for r in results)]
+    if groups:
+        fig, axes = plt.subplots(
+            1, len(groups), figsize=(9*len(groups), 6), squeeze=False
+        )
+        for group, ax in zip(groups, axes[0]):
+            plot_timings(results, group, ax)
+        saved.append(os.path.join(outdir, "micro_benchmarks.png"))
+        fig.tight_layout()
+        fig.savefig(saved[-1])
+        plt.close(fig)
+
+    names = {
+        ACCESS: "neighborhood_memory_usage.png",
+        ENGINE: "engine_memory_usage.png",
+    }
+    for group, fname in names.items():
+        paths = [path for (g, _), path in sorted(profiles.items()) if g == group]
+        if not paths:
+            continue
+
+        fig, ax = plt.subplots(figsize=(9, 6))
+        plot_memory(paths, ax)
+        saved.append(os.path.join(outdir, fname))
+        fig.savefig(saved[-1])
+        plt.close(fig)
+
+    return saved
@@ -0,0 +1,318 @@
+# fastlife.census
+# Runs random soups to stabilization and tallies the objects they leave behind.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 22 09:40:31 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: census.py [] benjamin@bengfort.com $
+
+"""
+Runs random soups to stabilization and tallies the objects they leave behind.
+
+Soups are identified by their seed and distributed across a process pool. As each
+soup finishes its tally is merged into a JSON results file that is atomically
+replaced, so the file can be read while the census is running and a census that is
+restarted with the same results file skips the seeds that have already been run.
+Spaceships that escape from a soup are removed and counted before they reach the
+boundary of the world, where they would otherwise crash into still lifes.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import json
+import time
+import numpy as np
+import multiprocessing as mp
+
+from tqdm import tqdm
+from functools import partial
+from collections import Counter, namedtuple, deque
+
+from .grid import Workspace
+from .patterns import SPACESHIPS, classify, objects
+from .vectorized import life_step
+from .exceptions import FastlifeValueError
+
+
+# Spaceships are removed once they are this close to the boundary of the world
+ESCAPE_DISTANCE = 8
+
+# The number of generations between checks for spaceships near the boundary
+ESCAPE_INTERVAL = 4
+
+SoupResult = namedtuple("SoupResult", "seed, tally, generations, period")
+SoupResult.__doc__ = "The objects left by a soup, when it stabilized and its period"
+
+
+##########################################################################
+## Soups
+##########################################################################
+
+def soup(seed, size=16, density=0.5):
+    """
+    Returns a random square soup of the specified size for the seed.
+    """
+    rng = np.random.default_rng(seed)
+    return (rng.random((size, size)) < density).astype(np.int8)
+
+
+def escape(world, distance=ESCAPE_DISTANCE):
+    """
+    Removes the spaceships within the distance of the boundary of the world from the
+    world and returns a Counter of the spaceships that were removed. Spaceships that
+    started far from the boundary can only be leaving the world, and would otherwise
+    collide with its boundary and turn into still lifes.
+    """
+    escaped = Counter()
+    height, width = world.shape
+    d = distance
+    if not (world[:d].any() or world[-d:].any() or
+            world[:, :d].any() or world[:, -d:].any()):
+        return escaped
+
+    for obj in objects(world):
+        if obj.name not in SPACESHIPS:
+            continue
+
+        rows, cols = obj.pattern.shape
+        if (obj.top < d or obj.left < d or
+                obj.top + rows > height - d or obj.left + cols > width - d):
+            box = world[obj.top:obj.top+rows, obj.left:obj.left+cols]
+            box[obj.pattern != 0] = 0
+            escaped[obj.name] += 1
+    return escaped
+
+
+def stabilize(world, max_generations=10000, max_period=None, escapes=None):
+    """
+    Steps the world in place until it repeats a previous state, i.e. every object left
+    in the world is a still life or oscillator. Note that spaceships never stabilize
+    unless they collide with the boundary of the world or another object, or they are
+    removed as they escape.
+
+    Parameters
+    ----------
+    world : ndarray of int8
+        The world to step, which is modified in place.
+
+    max_generations : int, default: 10000
+        Give up if the world has not stabilized after this many generations.
+
+    max_period : int, default: None
+        Only remember this many previous states, which bounds the memory used but
+        means oscillators with a longer period are not detected.
+
+    escapes : Counter, default: None
+        If specified, spaceships near the boundary of the world are removed every few
+        generations and counted in the Counter (see ``escape``), so the world should
+        not start with spaceships near its boundary.
+
+    Returns
+    -------
+    generations : int
+        The number of generations the world was stepped.
+
+    period : int or None
+        The period of the stable world or None if it did not stabilize.
+    """
+    scratch = np.zeros_like(world)
+    workspace = Workspace(world.shape)
+    src, dst = world, scratch
+    key = hash(src.tobytes())
+    seen, history = {key: 0}, deque([key])
+
+    period = None
+    for gen in range(1, max_generations+1):
+        life_step(src, dst, workspace)
+        src, dst = dst, src
+
+        if escapes is not None and gen % ESCAPE_INTERVAL == 0:
+            escapes.update(escape(src))
+
+        key = hash(src.tobytes())
+        if key in seen:
+            period = gen - seen[key]
+            break
+
+        seen[key] = gen
+        history.append(key)
+        if max_period is not None and len(history) > max_period:
+            seen.pop(history.popleft(), None)
+
+    if src is not world:
+        world[...] = src
+    return gen, period
+
+
+def run_soup(seed, size=16, margin=48, max_generations=10000):
+    """
+    Runs the soup for the seed in the middle of an empty world with the specified
+    margin on every side until it stabilizes and classifies the remaining objects,
+    along with the spaceships that escaped from the soup.
+    """
+    world = np.pad(soup(seed, size), margin)
+    escapes = Counter()
+    generations, period = stabilize(world, max_generations, escapes=escapes)
+
+    tally = classify(world)
+    tally.update(escapes)
+    return SoupResult(seed, tally, generations, period)
+
+
+##########################################################################
+## Census
+##########################################################################
+
+def compact(seeds):
+    """
+    Compacts a sorted sequence of integer seeds into a list of inclusive [lo, hi] runs.
+    """
+    runs = []
+    for seed in seeds:
+        if runs and seed == runs[-1][1] + 1:
+            runs[-1][1] = seed
+        else:
+            runs.append([seed, seed])
+    return runs
+
+
+def expand(runs):
+    """
+    Expands a list of inclusive [lo, hi] runs into a set of seeds.
+    """
+    return {seed for lo, hi in runs for seed in range(lo, hi+1)}
+
+
+class Census(object):
+    """
+    Maintains the tally of a census of random soups in a results file on disk.
+
+    Parameters
+    ----------
+    path : str
+        The JSON results file, which is loaded if it exists so that a census can be
+        resumed after it is interrupted.
+
+    size : int, default: 16
+        The width and height of every soup.
+
+    margin : int, default: 48
+        The number of empty cells around the soup in the bounded world it runs in.
+
+    max_generations : int, default: 10000
+        Soups that have not stabilized after this many generations are counted as
+        unstable, but the objects they contain are still tallied.
+    """
+
+    def __init__(self, path, size=16, margin=48, max_generations=10000):
+        self.path = path
+        self.size = size
+        self.margin = margin
+        self.max_generations = max_generations
+
+        self.seeds = set()
+        self.objects = Counter()
+        self.generations = 0
+        self.unstable = 0
+        self.elapsed = 0.0
+
+        if os.path.exists(path):
+            self.load()
+
+    @property
+    def soups(self):
+        return len(self.seeds)
+
+    def load(self):
+        with open(self.path, "r") as f:
+            data = json.load(f)
+
+        for key in ("size", "margin", "max_generations"):
+            if data[key] != getattr(self, key):
+                raise FastlifeValueError(
+                    f"census {key} {getattr(self, key)} does not match "
+                    f"{data[key]} in {self.path}"
+                )
+
+        self.seeds = expand(data["seeds"])
+        self.objects = Counter(data["objects"])
+        self.generations = data["generations"]
+        self.unstable = data["unstable"]
+        self.elapsed = data["elapsed"]
+
+    def save(self):
+        """
+        Atomically replace the results file so that readers never see a partial write.
+        """
+        data = {
+            "size": self.size,
+            "margin": self.margin,
+            "max_generations": self.max_generations,
+            "soups": self.soups,
+            "generations": self.generations,
+            "unstable": self.unstable,
+            "elapsed": self.elapsed,
+            "objects": dict(self.objects.most_common()),
+            "seeds": compact(sorted(self.seeds)),
+        }
+
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def merge(self, result):
+        """
+        Add the result of a single soup to the tally.
+        """
+        self.seeds.add(result.seed)
+        self.objects.update(result.tally)
+        self.generations += result.generations
+        if result.period is None:
+            self.unstable += 1
+
+    def run(self, seeds, processes=None, flush=1.0, progress=True):
+        """
+        Run the soups for all seeds that are not already in the census across a
+        process pool, merging results as they complete and saving the results file
+        at most every ``flush`` seconds as well as when the census stops.
+
+        Returns the number of soups per second that were run.
+        """
+        pending = [seed for seed in seeds if seed not in self.seeds]
+        if not pending:
+            return 0.0
+
+        func = partial(
+            run_soup, size=self.size, margin=self.margin,
+            max_generations=self.max_generations,
+        )
+
+        processes = processes or os.cpu_count()
+        chunksize = max(1, min(64, len(pending) // (processes * 8)))
+
+        start = last = time.perf_counter()
+        completed = 0
+        with mp.get_context().Pool(processes) as pool:
+            try:
+                results = pool.imap_unordered(func, pending, chunksize=chunksize)
+                for result in tqdm(results, total=len(pending), disable=not progress):
+                    self.merge(result)
+                    completed += 1
+
+                    now = time.perf_counter()
+                    if now - last >= flush:
+                        self.elapsed += now - last
+                        last = now
+                        self.save()
+            finally:
+                self.elapsed += time.perf_counter() - last
+                self.save()
+
+        return completed / (time.perf_counter() - start)
@@ -0,0 +1,182 @@
+# fastlife.differential
+# Runs several engines in lockstep to find the first generation where they diverge.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Fri Oct 30 09:52:36 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: differential.py [] benjamin@bengfort.com $
+
+"""
+Runs several engines in lockstep to find the first generation where they diverge.
+
+Every engine is initialized from the same seed or data file and the fingerprints of
+their worlds are compared every ``stride`` generations, which costs about a
+millisecond per million cells. When the fingerprints differ, the engines are run
+again up to the last generation at which they agreed and stepped one generation at
+a time to find the exact generation and the region of the world that diverged.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+
+from collections import namedtuple
+
+from .grid import fingerprint
+from .exceptions import FastlifeValueError
+
+
+Divergence = namedtuple("Divergence", "generation, reference, engine, region, cells")
+Divergence.__doc__ = (
+    "The first generation at which an engine differs from the reference engine, the "
+    "(r0, r1, c0, c1) bounding box of the cells that differ and how many differ"
+)
+
+
+##########################################################################
+## Helpers
+##########################################################################
+
+def initialize(sim, seed=None, path=None):
+    """
+    Load the simulation from the data file if specified, otherwise randomize it from
+    the seed.
+    """
+    if path is not None:
+        sim.load(path)
+    else:
+        sim.randomize(seed)
+    return sim
+
+
+def close(sim):
+    if hasattr(sim, "close"):
+        sim.close()
+
+
+def region(a, b):
+    """
+    Returns the (r0, r1, c0, c1) bounding box of the cells that differ between two
+    worlds and the number of cells that differ.
+    """
+    rows, cols = np.nonzero((np.asarray(a) != 0) != (np.asarray(b) != 0))
+    if len(rows) == 0:
+        return None, 0
+    box = (int(rows.min()), int(rows.max())+1, int(cols.min()), int(cols.max())+1)
+    return box, len(rows)
+
+
+def describe(divergence):
+    """
+    Returns a human readable description of a divergence.
+    """
+    r0, r1, c0, c1 = divergence.region
+    return (
+        f"{divergence.engine} diverged from {divergence.reference} at generation "
+        f"{divergence.generation}: {divergence.cells} cells differ in rows "
+        f"{r0}:{r1} and columns {c0}:{c1}"
+    )
+
+
+##########################################################################
+## Differential Testing
+##########################################################################
+
+def diverge(engines, width, height, generations, seed=None, path=None, stride=1):
+    """
+    Runs the engines from the same initial state for the specified number of
+    generations and returns the first Divergence from the first (reference) engine,
+    or None if every engine computed bit-identical generations.
+
+    Parameters
+    ----------
+    engines : dict
+        Maps the name of each engine to a callable that constructs it from the width
+        and height of the world, e.g. the simulation class. The first engine is the
+        reference that the others are compared to.
+
+    width, height : int
+        The shape of the world.
+
+    generations : int
+        The number of generations to run every engine for.
+
+    seed : int, default: None
+        The seed to randomize the initial state with if no path is given.
+
+    path : str, default: None
+        A data file to load the initial state from, e.g. ``fixtures/life1.dat.gz``.
+
+    stride : int, default: 1
+        Compare the engines every stride generations; engines that support it advance
+        several generations at a time between comparisons, and the exact generation
+        of a divergence is found by replaying the last stride one step at a time.
+        Note that divergences that disappear again within a stride are not found.
+    """
+    if len(engines) < 2:
+        raise FastlifeValueError("at least two engines are required to compare")
+    if stride < 1:
+        raise FastlifeValueError("the stride must be at least one generation")
+    if seed is None and path is None:
+        # Every engine must start from the same random state
+        seed = np.random.randint(2**31)
+
+    names = list(engines)
+    sims = {
+        name: initialize(engines[name](width, height), seed, path) for name in names
+    }
+
+    try:
+        previous = now = 0
+        while True:
+            prints = {n: fingerprint(s.cframe._world) for n, s in sims.items()}
+            for name in names[1:]:
+                if prints[name] != prints[names[0]]:
+                    return _locate(
+                        engines, (names[0], name), width, height, seed, path,
+                        previous, now,
+                    )
+
+            if now >= generations:
+                return None
+
+            previous, now = now, min(now + stride, generations)
+            for sim in sims.values():
+                sim.run(now - previous, progress=False)
+    finally:
+        for sim in sims.values():
+            close(sim)
+
+
+def _locate(engines, names, width, height, seed, path, start, stop):
+    """
+    Replays the pair of engines from the initial state to the last generation at
+    which they agreed and steps them one generation at a time until they diverge.
+    """
+    a, b = (initialize(engines[name](width, height), seed, path) for name in names)
+    try:
+        if start:
+            a.run(start, progress=False)
+            b.run(start, progress=False)
+
+        for generation in range(start, stop+1):
+            if generation > start:
+                a.step()
+                b.step()
+
+            box, cells = region(a.cframe._world, b.cframe._world)
+            if cells:
+                return Divergence(generation, names[0], names[1], box, cells)
+
+        raise FastlifeValueError(
+            f"{names[1]} diverged from {names[0]} by generation {stop} but did not "
+            "diverge when replayed one generation at a time"
+        )
+    finally:
+        close(a)
+        close(b)
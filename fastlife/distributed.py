@@ -0,0 +1,589 @@
+# fastlife.distributed
+# Implements a Game of Life cellular automata split across worker processes.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 09:31:18 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: distributed.py [] benjamin@bengfort.com $
+
+"""
+Implements a Game of Life cellular automata split across worker processes.
+
+The coordinator divides the world into a grid of rectangular domains and assigns each
+domain to a worker process that is reachable over TCP. Every round the coordinator
+relays the halo (the border rows and columns of the neighboring domains) to each
+worker, which then advances its domain by up to ``halo`` generations without any
+further communication. Deeper halos trade redundant computation on the border for
+fewer round trips. The coordinator never holds the world: workers generate or receive
+only their own domain, and the world is only gathered when the current frame is read.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import gzip
+import math
+import time
+import numpy as np
+import multiprocessing as mp
+
+from tqdm import tqdm
+from multiprocessing.connection import Listener, Client
+
+from .grid import MOORE, Grid, Workspace
+from .vectorized import life_step
+from .sequential import SequentialLife
+from .exceptions import FastlifeError, FastlifeValueError, FastlifeTypeError
+from .exceptions import WorkerError
+
+
+# Directions of neighboring domains as (row, col) offsets in the domain layout
+N, S, W, E = (-1, 0), (1, 0), (0, -1), (0, 1)
+NW, NE, SW, SE = (-1, -1), (-1, 1), (1, -1), (1, 1)
+
+# The number of random values drawn at a time when a worker generates its domain
+RANDOM_CHUNK = 1 << 20
+
+
+##########################################################################
+## Domain Decomposition
+##########################################################################
+
+def layout(n):
+    """
+    Returns the (rows, cols) arrangement of n domains that is closest to square.
+    """
+    rows = int(math.sqrt(n))
+    while n % rows != 0:
+        rows -= 1
+    return rows, n // rows
+
+
+def decompose(shape, rows, cols):
+    """
+    Splits a world of the given (height, width) shape into rows x cols rectangular
+    domains, returning a dictionary that maps the (row, col) position of each domain
+    in the layout to its (r0, r1, c0, c1) bounds in the world.
+    """
+    height, width = shape
+    if rows > height or cols > width:
+        raise FastlifeValueError(
+            f"cannot split a {height}x{width} world into {rows}x{cols} domains"
+        )
+
+    ri = np.linspace(0, height, rows+1).astype(int)
+    ci = np.linspace(0, width, cols+1).astype(int)
+    return {
+        (r, c): (ri[r], ri[r+1], ci[c], ci[c+1])
+        for r in range(rows) for c in range(cols)
+    }
+
+
+def random_domain(seed, shape, region):
+    """
+    Returns the (r0, r1, c0, c1) region of the world that ``SequentialLife.randomize``
+    creates from the seed for a world of the specified shape, without allocating the
+    world. Every cell consumes exactly one value of the random stream, so the rows
+    are drawn a chunk at a time and only the columns of the region are kept.
+    """
+    height, width = shape
+    r0, r1, c0, c1 = region
+    rng = np.random.RandomState(seed)
+    rows = max(1, RANDOM_CHUNK // width)
+
+    # The values of the rows above the region must be drawn to advance the stream
+    for i in range(0, r0, rows):
+        rng.randint(2, size=(min(rows, r0-i), width))
+
+    domain = np.empty((r1-r0, c1-c0), dtype=np.int8)
+    for i in range(r0, r1, rows):
+        n = min(rows, r1-i)
+        domain[i-r0:i-r0+n] = rng.randint(2, size=(n, width))[:, c0:c1]
+    return domain
+
+
+def make_domain(source):
+    """
+    Returns the cells of a domain from the source sent by the coordinator, which is
+    either the array of the domain, ("random", seed, shape, region) to generate the
+    region of a random world (see ``random_domain``), or ("cells", coords, shape) to
+    create a domain of the shape with live cells at the (n, 2) coordinates.
+    """
+    if isinstance(source, np.ndarray):
+        return source
+
+    kind, *args = source
+    if kind == "random":
+        return random_domain(*args)
+
+    if kind == "cells":
+        coords, shape = args
+        domain = np.zeros(shape, dtype=np.int8)
+        domain[coords[:, 0], coords[:, 1]] = 1
+        return domain
+
+    raise FastlifeValueError(f"unknown domain source '{kind}'")
+
+
+##########################################################################
+## Worker Process
+##########################################################################
+
+class DomainWorker(object):
+    """
+    Holds a single domain of the world padded on all sides by the halo and advances
+    it in response to messages from the coordinator. Sides of the domain that are on
+    the boundary of the world are kept dead at every generation.
+    """
+
+    def __init__(self, domain, halo=1, adjacency=MOORE, bounds=(False,)*4):
+        k = self.halo = halo
+        self.adjacency = adjacency
+        self.bounds = bounds
+
+        height, width = domain.shape
+        self.frames = [
+            np.zeros((height+2*k, width+2*k), dtype=np.int8),
+            np.zeros((height+2*k, width+2*k), dtype=np.int8),
+        ]
+        self.workspace = Workspace(self.frames[0].shape)
+        self.frame = 0
+        self.domain[...] = domain
+
+    @property
+    def domain(self):
+        k = self.halo
+        return self.frames[self.frame][k:-k, k:-k]
+
+    def edges(self):
+        """
+        Returns the top, bottom, left and right strips of the domain that neighboring
+        domains need as their halo.
+        """
+        k, domain = self.halo, self.domain
+        return domain[:k], domain[-k:], domain[:, :k], domain[:, -k:]
+
+    def advance(self, halo, generations):
+        """
+        Writes the halo into the padded domain and steps it the specified number of
+        generations, which must not be more than the depth of the halo.
+        """
+        k, world = self.halo, self.frames[self.frame]
+        world[:k], world[-k:], world[k:-k, :k], world[k:-k, -k:] = halo
+
+        for _ in range(generations):
+            src, dst = self.frames[self.frame], self.frames[1-self.frame]
+            life_step(src, dst, self.workspace, self.adjacency)
+
+            # Cells beyond the boundary of the world can never come alive
+            top, bottom, left, right = self.bounds
+            if top:
+                dst[:k] = 0
+            if bottom:
+                dst[-k:] = 0
+            if left:
+                dst[:, :k] = 0
+            if right:
+                dst[:, -k:] = 0
+            self.frame = 1 - self.frame
+
+
+def handle(conn):
+    """
+    Handle messages from a coordinator until it asks the worker to stop or
+    disconnects. The coordinator assigns a domain to the worker with an "init" message
+    and may reassign it at any time, e.g. when the world is reloaded.
+    """
+    worker = None
+    while True:
+        try:
+            cmd, *args = conn.recv()
+        except EOFError:
+            return
+
+        try:
+            if cmd == "stop":
+                return
+            elif cmd == "init":
+                source, *params = args
+                worker = DomainWorker(make_domain(source), *params)
+                conn.send(("ok", worker.edges()))
+            elif worker is None:
+                raise FastlifeError(f"cannot {cmd} before a domain is assigned")
+            elif cmd == "step":
+                start = time.perf_counter()
+                worker.advance(*args)
+                conn.send(("ok", time.perf_counter() - start, worker.edges()))
+            elif cmd == "gather":
+                conn.send(("ok", worker.domain))
+            else:
+                raise FastlifeValueError(f"unknown command '{cmd}'")
+        except Exception as e:
+            conn.send(("error", f"{e.__class__.__name__}: {e}"))
+
+
+def serve(address=("localhost", 0), authkey=None, ready=None, once=False):
+    """
+    Runs a worker that listens on the specified address for coordinators, serving
+    one coordinator at a time until it disconnects.
+
+    Parameters
+    ----------
+    address : tuple, default: ("localhost", 0)
+        The host and port to bind; port 0 binds to any available port.
+
+    authkey : bytes
+        The shared secret used to authenticate the coordinator, which is required
+        since workers unpickle the messages they receive.
+
+    ready : Queue, default: None
+        If specified, the bound address is put on the queue once the worker listens.
+
+    once : bool, default: False
+        Exit after serving a single coordinator rather than waiting for the next one.
+    """
+    if not authkey:
+        raise FastlifeValueError("workers require an authkey to authenticate with")
+
+    with Listener(address, authkey=authkey) as listener:
+        if ready is not None:
+            ready.put(listener.address)
+
+        while True:
+            with listener.accept() as conn:
+                handle(conn)
+
+            if once:
+                return
+
+
+##########################################################################
+## Distributed Life Simulation
+##########################################################################
+
+class DistributedLife(SequentialLife):
+    """
+    A Game of Life simulation whose world is split into rectangular domains, each of
+    which is stepped by a worker process reachable over TCP. Workers are either
+    started locally or connected to at the specified addresses (see ``serve``). The
+    coordinator does not allocate the world: workers generate their own domains of
+    random worlds and receive only their own cells of loaded worlds, and the world is
+    gathered into the current frame only when it is accessed. The gathered frame is
+    read-only since writes to it would never reach the workers, so the world must be
+    changed with ``populate``.
+
+    Parameters
+    ----------
+    width, height : int
+        The shape of the world.
+
+    workers : int, default: 4
+        The number of local worker processes to start if no addresses are given.
+
+    halo : int, default: 1
+        The depth of the halo exchanged with each domain, which is also the number of
+        generations that are computed between each exchange.
+
+    addresses : list of tuple, default: None
+        The (host, port) addresses of already running workers to connect to.
+
+    authkey : bytes, default: None
+        The shared secret for the workers, which is required to connect to running
+        workers and generated for locally started workers.
+    """
+
+    def __init__(self, width=512, height=512, workers=4, halo=1, addresses=None,
+                 authkey=None):
+        # The dense frames of the other engines are never allocated
+        if halo < 1:
+            raise FastlifeValueError("the halo must be at least one cell deep")
+        if addresses and not authkey:
+            raise FastlifeValueError("an authkey is required to connect to workers")
+
+        self.initialized = False
+        self.shape = (height, width)
+        self.adjacency = MOORE
+        self.frame = 0
+        self.now = 0
+
+        self.halo = halo
+        self.addresses = list(addresses) if addresses else None
+        self.workers = len(self.addresses) if self.addresses else workers
+        self.authkey = authkey or os.urandom(16)
+
+        self.domains = None
+        self._grid = None
+        self._conns = {}
+        self._procs = []
+        self._edges = {}
+        self._stale = False
+        self.reset_stats()
+
+    @property
+    def cframe(self):
+        # The local world is only updated from the workers when it is accessed
+        if self._grid is None or self._stale:
+            self.gather()
+        return self._grid
+
+    @property
+    def nframe(self):
+        raise FastlifeTypeError("distributed simulations have no local next frame")
+
+    def load(self, path):
+        """
+        Load the simulation from a file on disk, sending each worker only the live
+        cells of its domain.
+        """
+        with gzip.open(path, 'rb') as f:
+            cells = [tuple(map(int, line.split())) for line in f if line.strip()]
+
+        cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+        if ((cells < 0) | (cells >= self.shape)).any():
+            raise FastlifeValueError(f"'{path}' has cells outside of the world")
+
+        def source(region):
+            r0, r1, c0, c1 = region
+            inside = (
+                (cells[:, 0] >= r0) & (cells[:, 0] < r1) &
+                (cells[:, 1] >= c0) & (cells[:, 1] < c1)
+            )
+            return ("cells", cells[inside] - (r0, c0), (r1-r0, c1-c0))
+
+        self.scatter(source)
+
+    def randomize(self, seed=None):
+        """
+        Create a random initial state from a seed value (the same state as the dense
+        engines for the same seed), which each worker generates for its own domain.
+        """
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        self.scatter(lambda region: ("random", seed, self.shape, region))
+
+    def populate(self, world):
+        """
+        Initialize the simulation from an array the shape of the world.
+        """
+        world = np.asarray(world)
+        if world.shape != self.shape:
+            raise FastlifeValueError(
+                f"cannot populate a {self.shape} world from a {world.shape} array"
+            )
+
+        def source(region):
+            r0, r1, c0, c1 = region
+            return np.ascontiguousarray(world[r0:r1, c0:c1], dtype=np.int8)
+
+        self.scatter(source)
+
+    def reset_stats(self):
+        self.stats = {"rounds": 0, "compute": 0.0, "communication": 0.0}
+
+    def start(self):
+        """
+        Start local workers if necessary and connect to all of them.
+        """
+        if self._conns:
+            return
+
+        if self.addresses is None:
+            ctx = mp.get_context()
+            ready = ctx.Queue()
+            for _ in range(self.workers):
+                proc = ctx.Process(
+                    target=serve, args=(("localhost", 0), self.authkey, ready, True),
+                    daemon=True,
+                )
+                proc.start()
+                self._procs.append(proc)
+            self.addresses = [ready.get(timeout=30) for _ in self._procs]
+
+        rows, cols = layout(len(self.addresses))
+        self.domains = decompose(self.shape, rows, cols)
+        for key, address in zip(self.domains, self.addresses):
+            self._conns[key] = Client(address, authkey=self.authkey)
+
+    def scatter(self, source):
+        """
+        Assign each worker its domain, created from the source that the function
+        returns for the (r0, r1, c0, c1) region of the domain (see ``make_domain``).
+        """
+        self.start()
+        height, width = self.shape
+        for key, (r0, r1, c0, c1) in self.domains.items():
+            if min(r1-r0, c1-c0) < self.halo:
+                raise FastlifeValueError(
+                    f"a halo of {self.halo} is deeper than the {r1-r0}x{c1-c0} domain"
+                )
+
+            bounds = (r0 == 0, r1 == height, c0 == 0, c1 == width)
+            self._conns[key].send((
+                "init", source((r0, r1, c0, c1)), self.halo, self.adjacency, bounds,
+            ))
+
+        for key in self.domains:
+            self._edges[key] = self._recv(key)[0]
+
+        self._stale = True
+        self.initialized = True
+
+    def gather(self):
+        """
+        Collect the domains from the workers into the current frame, which is only
+        allocated the first time the world is gathered, and return it.
+        """
+        if self._grid is None:
+            height, width = self.shape
+            self._grid = Grid(width, height, self.adjacency)
+
+        grid = self._grid
+        for conn in self._conns.values():
+            conn.send(("gather",))
+
+        grid._world.flags.writeable = True
+        try:
+            for key, (r0, r1, c0, c1) in (self.domains or {}).items():
+                grid._world[r0:r1, c0:c1] = self._recv(key)[0]
+        finally:
+            grid._world.flags.writeable = False
+
+        grid.invalidate()
+        self._stale = False
+        return grid
+
+    def halo_for(self, key):
+        """
+        Assemble the top, bottom, left and right halo of a domain from the edges that
+        its neighbors reported at the end of the last round.
+        """
+        k = self.halo
+        r0, r1, c0, c1 = self.domains[key]
+        height, width = r1-r0, c1-c0
+
+        def edge(offset, side, index=slice(None)):
+            # Neighbors beyond the boundary of the world contribute dead cells
+            nkey = (key[0]+offset[0], key[1]+offset[1])
+            if nkey not in self._edges:
+                return 0
+            return self._edges[nkey][side][:, index]
+
+        # Edges are reported by each worker as (top, bottom, left, right)
+        top = np.zeros((k, width+2*k), dtype=np.int8)
+        top[:, :k] = edge(NW, 1, slice(-k, None))
+        top[:, k:-k] = edge(N, 1)
+        top[:, -k:] = edge(NE, 1, slice(None, k))
+
+        bottom = np.zeros((k, width+2*k), dtype=np.int8)
+        bottom[:, :k] = edge(SW, 0, slice(-k, None))
+        bottom[:, k:-k] = edge(S, 0)
+        bottom[:, -k:] = edge(SE, 0, slice(None, k))
+
+        left = np.zeros((height, k), dtype=np.int8)
+        left[:] = edge(W, 3)
+
+        right = np.zeros((height, k), dtype=np.int8)
+        right[:] = edge(E, 2)
+        return top, bottom, left, right
+
+    def advance(self, generations):
+        """
+        Execute one round of halo exchange and advance every domain by the specified
+        number of generations, which must not be more than the depth of the halo.
+        """
+        if not 1 <= generations <= self.halo:
+            raise FastlifeValueError(
+                f"can only advance 1 to {self.halo} generations per round"
+            )
+
+        if self.domains is None:
+            raise FastlifeError("the game of life simulation has not been initialized")
+
+        start = time.perf_counter()
+        for key, conn in self._conns.items():
+            conn.send(("step", self.halo_for(key), generations))
+
+        compute = 0.0
+        for key in self.domains:
+            elapsed, self._edges[key] = self._recv(key)
+            compute = max(compute, elapsed)
+
+        # Workers compute concurrently so the slowest worker bounds the compute time
+        self.stats["rounds"] += 1
+        self.stats["compute"] += compute
+        self.stats["communication"] += time.perf_counter() - start - compute
+
+        self.now += generations
+        self._stale = True
+
+    def step(self):
+        """
+        Execute the next step in the simulation on all of the workers.
+        """
+        self.advance(1)
+
+    def run(self, steps=100, progress=True):
+        """
+        Run the simulation for the specified number of steps from the current state,
+        advancing by the depth of the halo in every round.
+        """
+        if not self.initialized:
+            raise FastlifeError("the game of life simulation has not been initialized")
+
+        with tqdm(total=steps, disable=not progress) as pbar:
+            remaining = steps
+            while remaining > 0:
+                generations = min(self.halo, remaining)
+                self.advance(generations)
+                pbar.update(generations)
+                remaining -= generations
+
+    def report(self):
+        """
+        Returns a summary of the time spent computing and communicating.
+        """
+        compute, comm = self.stats["compute"], self.stats["communication"]
+        total = (compute + comm) or 1.0
+        return (
+            f"{self.stats['rounds']} rounds across {len(self._conns)} workers: "
+            f"{compute:0.3f}s compute ({compute/total:0.1%}), "
+            f"{comm:0.3f}s communication ({comm/total:0.1%})"
+        )
+
+    def close(self, gather=False):
+        """
+        Disconnect from the workers and wait for any local workers to exit. If gather
+        is True, the final world is first collected into the current frame.
+        """
+        if gather and self._stale and self._conns:
+            self.gather()
+
+        for conn in self._conns.values():
+            try:
+                conn.send(("stop",))
+            except OSError:
+                pass
+            conn.close()
+
+        for proc in self._procs:
+            proc.join(timeout=5)
+
+        self._conns, self._procs, self._edges = {}, [], {}
+        self.domains = None
+
+    def _recv(self, key):
+        status, *reply = self._conns[key].recv()
+        if status == "error":
+            raise WorkerError(f"worker for domain {key} failed: {reply[0]}")
+        return reply
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -33,6 +33,10 @@ class ConsoleError(FastlifeError):
     pass
 
 
+class WorkerError(FastlifeError):
+    pass
+
+
 
 ##########################################################################
 ## Warnings Hierarchy
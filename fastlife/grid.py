@@ -17,10 +17,12 @@ A wrapper for the matrix that describes the game of life grid world.
 ## Imports
 ##########################################################################
 
+import hashlib
 import numpy as np
 import matplotlib.pyplot as plt
 
-from .exceptions import FastlifeValueError, FastlifeTypeError
+from .pyramid import DensityPyramid
+from .exceptions import FastlifeError, FastlifeValueError, FastlifeTypeError
 
 
 VON_NEUMANN = "von neumann"
@@ -32,6 +34,95 @@ MRIP = np.asarray([-1, -1, 0, 1, 1, 1, 0, -1])
 MRJP = np.asarray([0, 1, 1, 1, 0, -1, -1, -1])
 
 
+def fingerprint(world):
+    """
+    Returns a stable hex digest of the state of a world, computed from its shape and
+    its live cells packed into bits, so the fingerprint does not depend on the dtype
+    or memory layout of the array and is the same in every process and session.
+    """
+    world = np.asarray(world)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.asarray(world.shape, dtype=np.int64).tobytes())
+    digest.update(np.packbits(world != 0).tobytes())
+    return digest.hexdigest()
+
+
+def _shared_memory():
+    """
+    Imports shared memory lazily since it is only available on Python 3.8 and later,
+    so that grids that are not shared work on every supported version of Python.
+    """
+    try:
+        from multiprocessing import resource_tracker
+        from multiprocessing.shared_memory import SharedMemory
+    except ImportError:
+        raise FastlifeError("shared memory grids require Python 3.8 or later")
+    return SharedMemory, resource_tracker
+
+
+def _attach(name):
+    """
+    Attach to an existing block of shared memory without registering it with the
+    resource tracker, which would otherwise unlink it when the attaching process exits.
+    """
+    SharedMemory, resource_tracker = _shared_memory()
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no track argument and always registers the block
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _unpickle_grid(handle, adjacency):
+    """
+    Reconstruct a grid from the handle to its world created by ``Grid.__reduce__``.
+    """
+    kind, source, shape = handle
+    grid = Grid(0, 0, adjacency)
+    if kind == "shm":
+        grid._shm = _attach(source)
+        grid._world = np.ndarray(shape, dtype=np.int8, buffer=grid._shm.buf)
+    elif kind == "memmap":
+        grid._world = np.load(source, mmap_mode="r+")
+        grid._path = source
+    else:
+        grid._world = source
+    return grid
+
+
+class Workspace(object):
+    """
+    A set of preallocated arrays the same shape as a grid world that engines write into
+    using ``out=`` style numpy operations, so that computing a generation does not
+    allocate any full-size temporary arrays.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        The (height, width) of the grid world the workspace computes steps for.
+    """
+
+    __slots__ = ["counts", "born", "survive"]
+
+    def __init__(self, shape):
+        self.counts = np.zeros(shape, dtype=np.int8)
+        self.born = np.zeros(shape, dtype=bool)
+        self.survive = np.zeros(shape, dtype=bool)
+
+    @property
+    def shape(self):
+        return self.counts.shape
+
+    @property
+    def nbytes(self):
+        return self.counts.nbytes + self.born.nbytes + self.survive.nbytes
+
+
 class Grid(object):
     """
     The game of life world is a 2-dimensional grid that is represented by a numpy matrix
@@ -48,12 +139,107 @@ class Grid(object):
         The type of neighborhood, either "von neumann" or "moore"
     """
 
-    __slots__ = ["_world", "_adjacency"]
+    __slots__ = [
+        "_world", "_adjacency", "_workspace", "_pyramid", "_shm", "_owner", "_path",
+    ]
 
     def __init__(self, width=100, height=100, adjacency=MOORE):
         self._world = np.zeros((height, width), dtype=np.int8)
+        self._workspace = None
+        self._pyramid = None
+        self._shm = None
+        self._owner = False
+        self._path = None
         self.adjacency = adjacency
 
+    @classmethod
+    def shared(cls, width=100, height=100, adjacency=MOORE):
+        """
+        Create an empty grid whose world is stored in a new block of shared memory.
+        Pickling the grid only sends the name of the block, so the grid can be passed
+        to other processes on the same machine without copying the world. The grid
+        that created the block must ``close`` it when it is no longer needed. Shared
+        memory requires Python 3.8 or later.
+        """
+        SharedMemory, _ = _shared_memory()
+        grid = cls(0, 0, adjacency)
+        grid._shm = SharedMemory(create=True, size=max(1, width*height))
+        grid._owner = True
+        grid._world = np.ndarray((height, width), dtype=np.int8, buffer=grid._shm.buf)
+        grid._world.fill(0)
+        return grid
+
+    @classmethod
+    def memmap(cls, path, width=None, height=None, adjacency=MOORE):
+        """
+        Open the grid stored in a .npy file as a memory-mapped world, or create an
+        empty one if the width and height are specified. Pickling the grid only sends
+        the path of the file, which other processes map into their own memory.
+        """
+        grid = cls(0, 0, adjacency)
+        if width is not None and height is not None:
+            grid._world = np.lib.format.open_memmap(
+                path, mode="w+", dtype=np.int8, shape=(height, width)
+            )
+        else:
+            grid._world = np.load(path, mmap_mode="r+")
+            if grid._world.dtype != np.int8 or grid._world.ndim != 2:
+                raise FastlifeValueError(f"'{path}' does not contain a 2D int8 world")
+        grid._path = path
+        return grid
+
+    def share(self):
+        """
+        Move the world into a new block of shared memory and return the grid.
+        """
+        if self._shm is None:
+            height, width = self.shape
+            world = self._world
+            shared = Grid.shared(width, height, self.adjacency)
+            shared._world[...] = world
+            self._world, self._shm, self._owner = shared._world, shared._shm, True
+            self._path = None
+        return self
+
+    def close(self):
+        """
+        Release the shared memory or memory map that backs the world, keeping a private
+        copy of the world in the grid. The grid that created a block of shared memory
+        also unlinks it, so it should be closed after all other processes are done.
+        """
+        if self._shm is not None:
+            self._world = self._world.copy()
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+            self._shm, self._owner = None, False
+
+        if self._path is not None:
+            self._world = np.array(self._world)
+            self._path = None
+
+    def __reduce__(self):
+        if self._shm is not None:
+            handle = ("shm", self._shm.name, self.shape)
+        elif self._path is not None:
+            self._world.flush()
+            handle = ("memmap", self._path, self.shape)
+        else:
+            handle = ("array", self._world, self.shape)
+        return (_unpickle_grid, (handle, self.adjacency))
+
+    def __array__(self, dtype=None, copy=None):
+        convert = dtype is not None and np.dtype(dtype) != self._world.dtype
+        if copy is False and convert:
+            raise ValueError(f"cannot view the int8 world as {np.dtype(dtype)}")
+        if copy or convert:
+            return np.array(self._world, dtype=dtype)
+        return self._world
+
+    def __buffer__(self, flags):
+        # Python < 3.12 ignores this hook, use memoryview(np.asarray(grid)) instead
+        return memoryview(self._world)
+
     @property
     def adjacency(self):
         return self._adjacency
@@ -69,6 +255,44 @@ class Grid(object):
     def shape(self):
         return self._world.shape
 
+    @property
+    def workspace(self):
+        """
+        The scratch buffers used by vectorized engines to compute the next generation
+        from this grid. The workspace is allocated on first access and reused for every
+        subsequent step so long as the shape of the world does not change.
+        """
+        if self._workspace is None or self._workspace.shape != self.shape:
+            self._workspace = Workspace(self.shape)
+        return self._workspace
+
+    @property
+    def pyramid(self):
+        """
+        The density pyramid of the world used to plot it, see ``DensityPyramid``. The
+        pyramid is built on first access and kept up to date with the regions that are
+        set through the grid; code that writes to the world directly must call
+        ``invalidate`` with the regions it changed (engines do so when they swap frames,
+        see ``SequentialLife.swap``).
+        """
+        if self._pyramid is None or self._pyramid.world is not self._world:
+            self._pyramid = DensityPyramid(self._world)
+        return self._pyramid
+
+    def invalidate(self, region=None):
+        """
+        Mark the (r0, r1, c0, c1) region of the world (or all of it) as changed so
+        that the density pyramid, if it has been built, is updated before it is read.
+        """
+        if self._pyramid is not None:
+            self._pyramid.mark(region)
+
+    def fingerprint(self):
+        """
+        Returns a stable hex digest of the state of the world, see ``fingerprint``.
+        """
+        return fingerprint(self._world)
+
     def neighborhood(self, i, j):
         """
         Returns the neighborhood of the cell specified at the x, y coords as a generator
@@ -84,6 +308,11 @@ class Grid(object):
         ip, jp = (MRIP, MRJP) if self.adjacency == MOORE else (VNIP, VNJP)
 
         for id, jd in zip(ip, jp):
+            # Negative indices would wrap around to the other side of the world
+            if i+id < 0 or j+jd < 0:
+                yield 0
+                continue
+
             try:
                 yield self._world[i+id,j+jd]
             except IndexError:
@@ -104,6 +333,10 @@ class Grid(object):
         ip, jp = (MRIP, MRJP) if self.adjacency == MOORE else (VNIP, VNJP)
 
         for id, jd in zip(ip, jp):
+            # Negative indices would wrap around to the other side of the world
+            if i+id < 0 or j+jd < 0:
+                continue
+
             try:
                 total += self._world[i+id,j+jd]
             except IndexError:
@@ -138,23 +371,141 @@ class Grid(object):
 
         return vals
 
-    def plot(self, ax=None):
+    def plot(self, ax=None, window=None, pixels=800):
+        """
+        Plot the (r0, r1, c0, c1) window of the world, by default all of it. Windows
+        with more cells than pixels are shown as the density of live cells rendered
+        from the density pyramid, so the time to plot depends on the number of pixels
+        rather than on the size of the world.
+
+        Parameters
+        ----------
+        ax : matplotlib Axes, default: None
+            The axes to plot on, created if not specified.
+
+        window : tuple of int, default: None
+            The rows and columns of the world to show, used to zoom and pan.
+
+        pixels : int, default: 800
+            The resolution of the image along the longer side of the window.
+        """
         if ax is None:
             _, ax = plt.subplots(figsize=(8,8))
-        ax.imshow(self._world, aspect="equal")
+
+        height, width = self.shape
+        r0, r1, c0, c1 = window or (0, height, 0, width)
+        if max(r1 - r0, c1 - c0) <= pixels:
+            # Small windows do not need a pyramid to be built
+            image, extent = self._world[r0:r1, c0:c1], (c0, c1, r1, r0)
+        else:
+            image, extent = self.pyramid.render(window, pixels)
+
+        ax.imshow(
+            image, aspect="equal", extent=extent, vmin=0, vmax=1,
+            interpolation="nearest",
+        )
         ax.set_xticks([])
         ax.set_yticks([])
         return ax
 
-    def __getitem__(self, ij):
-        if not isinstance(ij, tuple) or len(ij) != 2:
-            raise FastlifeTypeError("specify i, j position as a two-tuple")
-        return self._world[ij[0], ij[1]]
+    def _index(self, key):
+        """
+        Normalizes a key into an index of the world: an (i, j) tuple of ints, slices
+        or coordinate arrays, a boolean mask the shape of the world, or an (n, 2)
+        array of (i, j) coordinates.
+        """
+        if isinstance(key, tuple) and len(key) == 2:
+            return key
+
+        if isinstance(key, (list, np.ndarray)):
+            key = np.asarray(key)
+            if key.dtype == bool:
+                if key.shape != self.shape:
+                    raise FastlifeTypeError("the mask must be the shape of the world")
+                return key
 
-    def __setitem__(self, ij, val):
-        if not isinstance(ij, tuple) or len(ij) != 2:
-            raise FastlifeTypeError("specify i, j position as a two-tuple")
+            if key.dtype.kind in "iu" and key.ndim == 2 and key.shape[1] == 2:
+                return key[:, 0], key[:, 1]
 
-        if not isinstance(val, (int, np.int8)) or val > 127 or val < -128:
+        raise FastlifeTypeError(
+            "specify an i, j position, slices, a boolean mask or (n, 2) coordinates"
+        )
+
+    @staticmethod
+    def _validate(val):
+        """
+        Checks that a value or array of values can be stored in the int8 world without
+        loss, using a single vectorized range check for arrays.
+        """
+        if type(val) is int:
+            if val > 127 or val < -128:
+                raise FastlifeValueError("invalid game of life value")
+            return val
+
+        arr = np.asarray(val)
+        if arr.dtype.kind not in "biu":
             raise FastlifeValueError("invalid game of life value")
-        self._world[ij[0], ij[1]] = val
+
+        if arr.dtype.kind != "b" and arr.dtype != np.int8 and arr.size:
+            if arr.min() < -128 or arr.max() > 127:
+                raise FastlifeValueError("invalid game of life value")
+        return arr
+
+    def _region(self, index):
+        """
+        Returns the (r0, r1, c0, c1) bounding box of the cells selected by a
+        normalized index, used to mark the changed region of the density pyramid.
+        """
+        if isinstance(index, np.ndarray):
+            rows = np.flatnonzero(index.any(axis=1))
+            cols = np.flatnonzero(index.any(axis=0))
+            if not len(rows):
+                return 0, 0, 0, 0
+            return rows[0], rows[-1]+1, cols[0], cols[-1]+1
+
+        bounds = []
+        for key, size in zip(index, self.shape):
+            if isinstance(key, slice):
+                start, stop, step = key.indices(size)
+                if step < 0:
+                    start, stop = stop+1, start+1
+                bounds.extend((start, stop))
+                continue
+
+            key = np.asarray(key) % size
+            if not key.size:
+                return 0, 0, 0, 0
+            bounds.extend((key.min(), key.max()+1))
+        return tuple(bounds)
+
+    def __getitem__(self, key):
+        """
+        Returns the value of a single cell, or the values at slices (a view of the
+        world), a boolean mask or an array of coordinates (copies of the values).
+        """
+        # Single cells are the hot path of the sequential engine
+        if type(key) is tuple and len(key) == 2:
+            return self._world[key]
+        return self._world[self._index(key)]
+
+    def __setitem__(self, key, val):
+        """
+        Sets the value of a single cell or the values at slices, a boolean mask or an
+        array of coordinates to a value or an array of values that can be broadcast.
+        """
+        if type(key) is tuple and len(key) == 2 and type(val) is int:
+            if val > 127 or val < -128:
+                raise FastlifeValueError("invalid game of life value")
+            self._world[key] = val
+            if self._pyramid is not None:
+                i, j = key
+                if type(i) is int and type(j) is int:
+                    self._pyramid.mark_cell(i, j)
+                else:
+                    self._pyramid.mark(self._region(key))
+            return
+
+        index = self._index(key)
+        self._world[index] = self._validate(val)
+        if self._pyramid is not None:
+            self._pyramid.mark(self._region(index))
@@ -0,0 +1,105 @@
+# fastlife.lightcone
+# Evaluates a window of the world at a future generation from its light cone.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Sun Nov 01 10:37:15 2026 -0500
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: lightcone.py [] benjamin@bengfort.com $
+
+"""
+Evaluates a window of the world at a future generation from its light cone.
+
+Information travels at most one cell per generation (the "speed of light" of the
+Game of Life), so the state of a window after N generations only depends on the
+window expanded by N cells on every side. Rather than stepping the entire world,
+only that region is copied and stepped, and after every generation the cells that
+are no longer exact are cropped off, so the stepped region shrinks back to the
+window. The cost depends on the size of the window and the number of generations,
+not on the size of the world.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+
+from .grid import Grid, MOORE, Workspace
+from .vectorized import life_step
+from .exceptions import FastlifeValueError
+
+
+##########################################################################
+## Light Cones
+##########################################################################
+
+def light_cone(shape, window, generations):
+    """
+    Returns the (r0, r1, c0, c1) region of a world of the specified shape that can
+    influence the (r0, r1, c0, c1) window after the number of generations.
+    """
+    height, width = shape
+    r0, r1, c0, c1 = window
+    if not (0 <= r0 < r1 <= height and 0 <= c0 < c1 <= width):
+        raise FastlifeValueError(f"window {window} is not inside the {shape} world")
+    if generations < 0:
+        raise FastlifeValueError("the number of generations cannot be negative")
+
+    n = generations
+    return max(r0-n, 0), min(r1+n, height), max(c0-n, 0), min(c1+n, width)
+
+
+def evaluate(world, window, generations, adjacency=None):
+    """
+    Returns the state of the window of the world after the specified number of
+    generations by stepping only the light cone of the window. The world itself is
+    not modified.
+
+    Parameters
+    ----------
+    world : simulation, Grid or ndarray
+        The current state of the world; for a simulation its current frame is used.
+
+    window : tuple of int
+        The (r0, r1, c0, c1) rows and columns of the window to evaluate.
+
+    generations : int
+        The number of generations in the future to evaluate the window at.
+
+    adjacency : str, default: None
+        The type of neighborhood, by default the adjacency of the grid or "moore".
+
+    Returns
+    -------
+    window : ndarray of int8
+        An array of the shape of the window with the state of its cells.
+    """
+    if hasattr(world, "cframe"):
+        world = world.cframe
+    if isinstance(world, Grid):
+        adjacency = adjacency or world.adjacency
+        world = world._world
+    adjacency = adjacency or MOORE
+
+    world = np.asarray(world)
+    cone = light_cone(world.shape, window, generations)
+    top, bottom, left, right = cone
+    cur = np.array(world[top:bottom, left:right], dtype=np.int8)
+
+    height, width = world.shape
+    for _ in range(generations):
+        nxt = np.empty_like(cur)
+        life_step(cur, nxt, Workspace(cur.shape), adjacency)
+
+        # The outermost cells are missing neighbors beyond the cone and are cropped,
+        # unless the side of the cone is on the boundary of the world where it is exact
+        ct, cl = int(top > 0), int(left > 0)
+        cb, cr = int(bottom < height), int(right < width)
+        cur = nxt[ct:nxt.shape[0]-cb, cl:nxt.shape[1]-cr]
+        top, bottom, left, right = top+ct, bottom-cb, left+cl, right-cr
+
+    r0, r1, c0, c1 = window
+    return cur[r0-top:r1-top, c0-left:c1-left].copy()
@@ -0,0 +1,276 @@
+# fastlife.ltl
+# Implements Larger than Life cellular automata with large radius neighborhoods.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Sun Oct 25 11:14:26 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: ltl.py [] benjamin@bengfort.com $
+
+"""
+Implements Larger than Life cellular automata with large radius neighborhoods.
+
+Summing a neighborhood of radius r for every cell costs O(r^2) per cell. Instead the
+neighbor counts for the whole world are computed from a summed-area table (integral
+image) of the world, so that each count is four lookups no matter the radius. Box
+(Moore) neighborhoods use a summed-area table of the world directly; diamond (von
+Neumann) neighborhoods are updated row by row from prefix sums along the diagonals of
+the world, which are the edges of the diamonds.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import re
+import numpy as np
+
+from collections import namedtuple
+from numpy.lib.stride_tricks import as_strided
+
+from .sequential import SequentialLife
+from .grid import MOORE, VON_NEUMANN
+from .exceptions import FastlifeValueError
+
+
+Rule = namedtuple("Rule", "radius, middle, survive, birth, adjacency")
+Rule.__doc__ = "A Larger than Life rule with inclusive (lo, hi) count ranges"
+
+RULE_RE = re.compile(
+    r"^R(?P<radius>\d+),C(?P<states>\d+),M(?P<middle>[01]),"
+    r"S(?P<slo>\d+)\.\.(?P<shi>\d+),B(?P<blo>\d+)\.\.(?P<bhi>\d+),N(?P<n>[MN])$",
+    re.I,
+)
+
+BOSCO = "R5,C0,M1,S34..58,B34..45,NM"
+MAJORITY = "R4,C0,M1,S41..81,B41..81,NM"
+CONWAY = "R1,C0,M0,S2..3,B3..3,NM"
+
+
+def parse_rule(rule):
+    """
+    Parses a rule in Evans' notation, e.g. "R5,C0,M1,S34..58,B34..45,NM" (Bosco's rule)
+    where M1 counts the cell itself as part of its neighborhood and NM and NN are the
+    box (Moore) and diamond (von Neumann) neighborhoods.
+    """
+    if isinstance(rule, Rule):
+        return rule
+
+    match = RULE_RE.match(rule.replace(" ", ""))
+    if match is None:
+        raise FastlifeValueError(f"'{rule}' is not a valid larger than life rule")
+
+    if int(match.group("states")) > 2:
+        raise FastlifeValueError("only two state (C0 or C2) rules are supported")
+
+    radius = int(match.group("radius"))
+    if radius < 1:
+        raise FastlifeValueError("the radius of the neighborhood must be at least 1")
+
+    return Rule(
+        radius=radius,
+        middle=match.group("middle") == "1",
+        survive=(int(match.group("slo")), int(match.group("shi"))),
+        birth=(int(match.group("blo")), int(match.group("bhi"))),
+        adjacency=MOORE if match.group("n").upper() == "M" else VON_NEUMANN,
+    )
+
+
+##########################################################################
+## Summed-Area Neighbor Counts
+##########################################################################
+
+def skew(table, row, col, shape, slope):
+    """
+    Returns a view of the 2D table where view[a, b] is table[row + a, col + slope*a + b]
+    so that every column of the view follows a diagonal of the table. The view is not
+    bounds checked, so the caller must ensure it stays inside the table.
+    """
+    s0, s1 = table.strides
+    start = table.reshape(-1)[row * table.shape[1] + col:]
+    return as_strided(start, shape=shape, strides=(s0 + slope*s1, s1))
+
+
+class NeighborhoodCounter(object):
+    """
+    Computes the number of live cells in the box or diamond neighborhood of a fixed
+    radius around every cell of worlds of a fixed shape, including the cell itself.
+    The summed-area table and all other buffers are allocated once so that counting
+    does not allocate any full-size arrays.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        The (height, width) of the worlds to count.
+
+    radius : int
+        The radius of the neighborhood.
+
+    adjacency : str, default: "moore"
+        Either "moore" for box neighborhoods or "von neumann" for diamonds.
+    """
+
+    def __init__(self, shape, radius, adjacency=MOORE):
+        if adjacency not in (MOORE, VON_NEUMANN):
+            raise FastlifeValueError(f"'{adjacency}' is not a valid adjacency")
+
+        self.shape = shape
+        self.radius = radius
+        self.adjacency = adjacency
+        height, width = shape
+        r, d = radius, 2*radius + 1
+
+        if adjacency == MOORE:
+            self.counts = np.zeros(shape, dtype=np.int32)
+
+            # The table has a leading row and column of zeros and the world padded by r
+            self.table = np.zeros((height + 2*r + 1, width + 2*r + 1), dtype=np.int32)
+            self.padded = self.table[1+r:1+r+height, 1+r:1+r+width]
+            self.corners = (
+                self.table[d:, d:], self.table[:-d, d:],
+                self.table[d:, :-d], self.table[:-d, :-d],
+            )
+        else:
+            # The diamond is symmetric, so tall worlds are counted transposed to keep
+            # the sheared tables the size of the world times its shorter side
+            self.transpose = height > width
+            h, w = (width, height) if self.transpose else (height, width)
+
+            # Row p of the tables is shifted by p columns so that the diagonals of the
+            # world padded by k are columns that are summed with a single cumsum
+            k = self.pad = 2*r + 2
+            size = (h + 2*k, w + 2*k + h + 2*k)
+            self.diagonals = np.zeros(size, dtype=np.int32)
+            self.antidiagonals = np.zeros(size, dtype=np.int32)
+            self.delta = np.zeros((h + r, w), dtype=np.int32)
+            self.counts = self.delta[r:].T if self.transpose else self.delta[r:]
+
+            hp = size[0]
+            self.world = (
+                skew(self.diagonals, k, hp, (h, w), -1),
+                skew(self.antidiagonals, k, 2*k, (h, w), 1),
+            )
+
+            # Moving a diamond down a row adds the cells on its lower edges and removes
+            # the cells on the upper edges of the diamond above it, and every edge is
+            # the difference of the prefix sums at its (end, start) along a diagonal
+            rows = (h + r, w)
+            edges = (
+                (1, self.antidiagonals, (k, 2*k), (k-r-1, 2*k), 1),
+                (1, self.diagonals, (k-1, hp), (k-r-1, hp), -1),
+                (-1, self.diagonals, (k-r-1, hp+2*r+1), (k-2*r-2, hp+2*r+1), -1),
+                (-1, self.antidiagonals, (k-r-1, 2*k-2*r-1), (k-2*r-1, 2*k-2*r-1), 1),
+            )
+
+            self.edges = []
+            for sign, table, end, start, slope in edges:
+                end = skew(table, *end, rows, slope)
+                start = skew(table, *start, rows, slope)
+                self.edges.append((end, start) if sign > 0 else (start, end))
+
+    @property
+    def nbytes(self):
+        if self.adjacency == MOORE:
+            return self.table.nbytes + self.counts.nbytes
+        return self.diagonals.nbytes + self.antidiagonals.nbytes + self.delta.nbytes
+
+    def __call__(self, world):
+        """
+        Returns the neighborhood counts of the world, which are overwritten by the next
+        call. The cost does not depend on the radius of the neighborhood.
+        """
+        counts = self.counts
+        if self.adjacency == MOORE:
+            self.table.fill(0)
+            self.padded[...] = world
+            np.cumsum(self.table, axis=0, out=self.table)
+            np.cumsum(self.table, axis=1, out=self.table)
+
+            a, b, c, d = self.corners
+            np.subtract(a, b, out=counts)
+            np.subtract(counts, c, out=counts)
+            np.add(counts, d, out=counts)
+            return counts
+
+        world = world.T if self.transpose else world
+        for table, view in zip((self.diagonals, self.antidiagonals), self.world):
+            table.fill(0)
+            view[...] = world
+            np.cumsum(table, axis=0, out=table)
+
+        # Each edge is the difference of the prefix sums at its ends, and the change
+        # of the counts from row to row is accumulated from rows with empty diamonds
+        delta = self.delta
+        delta.fill(0)
+        for plus, minus in self.edges:
+            np.add(delta, plus, out=delta)
+            np.subtract(delta, minus, out=delta)
+        np.cumsum(delta, axis=0, out=delta)
+        return counts
+
+
+##########################################################################
+## Larger than Life Simulation
+##########################################################################
+
+class LargerThanLife(SequentialLife):
+    """
+    A Larger than Life simulation: a cell survives if the number of live cells in its
+    neighborhood is in the survive range and is born if it is in the birth range. The
+    neighborhood is a box or diamond of any radius and all neighborhood counts are
+    computed with a summed-area table, so the cost of a generation does not depend on
+    the radius.
+
+    Parameters
+    ----------
+    width, height : int
+        The shape of the world.
+
+    rule : str or Rule, default: Bosco's rule
+        The rule in Evans' notation, e.g. "R5,C0,M1,S34..58,B34..45,NM".
+    """
+
+    def __init__(self, width=512, height=512, rule=BOSCO):
+        super(LargerThanLife, self).__init__(width, height)
+        self.rule = parse_rule(rule)
+        for grid in self.frames:
+            grid.adjacency = self.rule.adjacency
+
+        shape = self.frames[0].shape
+        self.counter = NeighborhoodCounter(shape, self.rule.radius, self.rule.adjacency)
+        self.survive = np.zeros(shape, dtype=bool)
+        self.born = np.zeros(shape, dtype=bool)
+        self.mask = np.zeros(shape, dtype=bool)
+
+    def step(self):
+        """
+        Execute the next step in the simulation and swap the current grid.
+        """
+        world = self.cframe._world
+        counts = self.counter(world)
+        if not self.rule.middle:
+            np.subtract(counts, world, out=counts)
+
+        survive, born, mask = self.survive, self.born, self.mask
+        (slo, shi), (blo, bhi) = self.rule.survive, self.rule.birth
+
+        # Live cells survive with a count in the survive range
+        np.greater_equal(counts, slo, out=survive)
+        np.less_equal(counts, shi, out=mask)
+        np.logical_and(survive, mask, out=survive)
+        np.logical_and(survive, world, out=survive)
+
+        # Dead cells are born with a count in the birth range
+        np.greater_equal(counts, blo, out=born)
+        np.less_equal(counts, bhi, out=mask)
+        np.logical_and(born, mask, out=born)
+        np.equal(world, 0, out=mask)
+        np.logical_and(born, mask, out=born)
+
+        np.logical_or(survive, born, out=born)
+        np.copyto(self.nframe._world, born, casting="unsafe")
+
+        # Swap the current frame to the next frame and increment the number of steps
+        self.swap()
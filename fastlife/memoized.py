@@ -0,0 +1,287 @@
+# fastlife.memoized
+# Implements a Game of Life simulation that memoizes the transitions of small blocks.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Oct 28 09:31:07 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: memoized.py [] benjamin@bengfort.com $
+
+"""
+Implements a Game of Life simulation that memoizes the transitions of small blocks.
+
+The world is divided into square blocks and the next generation of each block only
+depends on the block and the ring of cells around it. Late-stage worlds are mostly
+empty space with the same few still lifes and oscillators repeated everywhere, so
+the same blocks recur over and over: each block is packed into a bit string key and
+the next generations of all of the blocks are looked up in a bounded LRU cache at
+once, so only the transitions that have not been seen recently are computed. Blocks
+that are the same as they were two generations ago, and whose neighbors are too, are
+not looked up at all since the next frame already holds their next generation (see
+``StaticLife``), so the world that is read is read-only and must be changed with
+``populate``.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+
+from .static import StaticLife
+from .exceptions import FastlifeValueError
+
+
+# Odd multiplier that mixes the words of a key into its hash (2**64 / golden ratio)
+MIXER = np.uint64(0x9E3779B97F4A7C15)
+
+# The last use of slots that are free or being filled, so they are never evicted
+FREE = np.iinfo(np.int64).max
+
+# The fraction of the capacity that is evicted at once when the cache is full
+EVICT = 8
+
+
+##########################################################################
+## Helpers
+##########################################################################
+
+def digest(keys):
+    """
+    Returns a 64-bit hash of each row of the (n, nbytes) array of packed keys. Distinct
+    keys may share a hash, so matches must be confirmed by comparing the keys.
+    """
+    n, nbytes = keys.shape
+    words = np.zeros((n, -(-nbytes // 8) * 8), dtype=np.uint8)
+    words[:, :nbytes] = keys
+    words = words.view(np.uint64)
+
+    hashes = np.zeros(n, dtype=np.uint64)
+    for k in range(words.shape[1]):
+        hashes ^= words[:, k]
+        hashes *= MIXER
+    return hashes
+
+
+##########################################################################
+## Block Transition Cache
+##########################################################################
+
+class TransitionCache(object):
+    """
+    A bounded least recently used table of packed blocks (with their border) and the
+    next generation of the block, which keeps count of its hits and misses. Keys and
+    values are looked up and stored in bulk: the keys are found with a binary search
+    of their sorted hashes, and when the cache is full the transitions that have not
+    been used for the most generations are evicted, an eighth of the capacity at a
+    time so that finding them is shared by many insertions.
+
+    Parameters
+    ----------
+    capacity : int, default: 65536
+        The maximum number of transitions to keep before evicting the least recently
+        used transitions.
+    """
+
+    def __init__(self, capacity=65536):
+        if capacity < 1:
+            raise FastlifeValueError("the cache must hold at least one transition")
+
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # The slots of the keys and values and the generation each was last used
+        self.keys = None
+        self.values = None
+        self.used = None
+        self.filled = 0
+        self.free = np.zeros(0, dtype=np.intp)
+        self.clock = 0
+
+        # The sorted hashes of the cached keys and the slot of each hash
+        self.index = np.zeros(0, dtype=np.uint64)
+        self.slots = np.zeros(0, dtype=np.intp)
+
+    def get(self, keys):
+        """
+        Looks up the (n, nbytes) array of packed keys and returns a mask of the keys
+        that are cached and the slots of their next generation in ``values``.
+        """
+        self.clock += 1
+        found = np.zeros(len(keys), dtype=bool)
+        slots = np.zeros(len(keys), dtype=np.intp)
+
+        if len(self.index):
+            hashes = digest(keys)
+            pos = np.searchsorted(self.index, hashes)
+            np.minimum(pos, len(self.index) - 1, out=pos)
+            slots = self.slots[pos]
+            found = self.index[pos] == hashes
+            found[found] = (self.keys[slots[found]] == keys[found]).all(axis=1)
+            self.used[slots[found]] = self.clock
+
+        hits = np.count_nonzero(found)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return found, slots
+
+    def put(self, keys, values):
+        """
+        Caches the next generation of each of the (n, nbytes) array of distinct packed
+        keys that are not cached, evicting the least recently used transitions.
+        """
+        keys, values = keys[-self.capacity:], values[-self.capacity:]
+        fresh = min(len(keys), self.capacity - self.filled)
+        self._grow(keys, values, self.filled + fresh)
+
+        # Fill the slots that have never been used first and then the evicted slots
+        slots = np.arange(self.filled, self.filled + fresh)
+        self.filled += fresh
+        self.used[slots] = FREE
+
+        taken = len(keys) - fresh
+        if taken > len(self.free):
+            # Evict at least an eighth of the capacity but not the slots being filled
+            count = max(taken - len(self.free), self.capacity // EVICT)
+            self._evict(min(count, self.filled - fresh - len(self.free)))
+        slots = np.concatenate([slots, self.free[:taken]])
+        self.free = self.free[taken:]
+
+        self.keys[slots] = keys
+        self.values[slots] = values
+        self.used[slots] = self.clock
+
+        hashes = digest(keys)
+        order = np.argsort(hashes)
+        pos = np.searchsorted(self.index, hashes[order])
+        self.index = np.insert(self.index, pos, hashes[order])
+        self.slots = np.insert(self.slots, pos, slots[order])
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def nbytes(self):
+        """
+        The memory used by the keys, values and the index of the cache.
+        """
+        nbytes = self.index.nbytes + self.slots.nbytes
+        if self.keys is not None:
+            nbytes += self.keys.nbytes + self.values.nbytes + self.used.nbytes
+        return nbytes
+
+    def __len__(self):
+        return self.filled - len(self.free)
+
+    def _grow(self, keys, values, size):
+        # The slots are allocated when the shape of the keys and values is known and
+        # doubled as they fill up, rather than allocating the full capacity at once
+        if self.keys is not None and len(self.keys) >= size:
+            return
+
+        slots = min(max(size, 2 * self.filled, 1024), self.capacity)
+        grown = (
+            np.zeros((slots, keys.shape[1]), dtype=np.uint8),
+            np.zeros((slots,) + values.shape[1:], dtype=values.dtype),
+            np.zeros(slots, dtype=np.int64),
+        )
+        if self.keys is not None:
+            for array, old in zip(grown, (self.keys, self.values, self.used)):
+                array[:self.filled] = old[:self.filled]
+        self.keys, self.values, self.used = grown
+
+    def _evict(self, count):
+        # Free the least recently used slots and remove their keys from the index
+        victims = np.argpartition(self.used[:self.filled], count - 1)[:count]
+        evicted = np.zeros(self.filled, dtype=bool)
+        evicted[victims] = True
+        keep = ~evicted[self.slots]
+        self.index, self.slots = self.index[keep], self.slots[keep]
+
+        self.used[victims] = FREE
+        self.free = np.concatenate([self.free, victims])
+        self.evictions += count
+
+
+##########################################################################
+## Memoized Life Simulation
+##########################################################################
+
+class MemoizedLife(StaticLife):
+    """
+    A Game of Life simulation that computes the next generation of each block of the
+    world by looking up the transition of the block (including its 1-cell border) in
+    a bounded LRU cache, only computing the transitions that have not been seen
+    recently. Blocks that have settled into still lifes and period 2 oscillators are
+    skipped entirely. This is much faster than ``VectorizedLife`` on repetitive,
+    mostly settled worlds such as the ash left behind by random soups, but slower on
+    busy worlds where most blocks are awake and many transitions are new.
+
+    Parameters
+    ----------
+    width, height : int
+        The shape of the world.
+
+    block : int, default: 8
+        The width and height of the core of each block.
+
+    capacity : int, default: 65536
+        The maximum number of block transitions to cache.
+    """
+
+    def __init__(self, width=512, height=512, block=8, capacity=65536):
+        if block < 1:
+            raise FastlifeValueError("the block size must be at least one cell")
+
+        super(MemoizedLife, self).__init__(width, height, tile=block, period=2)
+        self.block = block
+        self.cache = TransitionCache(capacity)
+
+    @property
+    def skipped(self):
+        """
+        The number of blocks that were not looked up because they had settled.
+        """
+        return self.rows * self.cols * self.now - self.stepped
+
+    def report(self):
+        """
+        Returns a summary of the cache hit rate and memory use.
+        """
+        cache = self.cache
+        return (
+            f"{len(cache)} cached {self.block}x{self.block} transitions "
+            f"({cache.nbytes / 2**20:0.2f} MiB): {cache.hit_rate:0.1%} hit rate, "
+            f"{cache.evictions} evictions, {self.skipped} settled blocks skipped"
+        )
+
+    def _step_world(self, src, dst):
+        # Every block is looked up even when most of them are awake
+        rows, cols = np.nonzero(self.awake)
+        return self._step_tiles(src, dst, rows, cols)
+
+    def _step_tiles(self, src, dst, rows, cols):
+        windows = self.windows[src, rows, cols]
+        keys = np.packbits(windows.reshape(len(rows), -1), axis=1)
+        found, slots = self.cache.get(keys)
+
+        cores = np.empty((len(rows), self.block, self.block), dtype=np.int8)
+        cores[found] = self.cache.values[slots[found]] if found.any() else 0
+
+        # Only the first occurrence of each distinct missing block is computed
+        missing = np.flatnonzero(~found)
+        if len(missing):
+            unique, first, inverse = np.unique(
+                keys[missing], axis=0, return_index=True, return_inverse=True
+            )
+            computed = self.compute(windows[missing[first]])
+            cores[missing] = computed[inverse.ravel()]
+            self.cache.put(unique, computed)
+
+        return self._settle(dst, rows, cols, cores)
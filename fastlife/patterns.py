@@ -0,0 +1,366 @@
+# fastlife.patterns
+# Searches grid worlds for known patterns and classifies the objects in them.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Oct 21 10:17:52 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: patterns.py [] benjamin@bengfort.com $
+
+"""
+Searches grid worlds for known patterns and classifies the objects in them.
+
+Both operations are vectorized so that they can be run on every checkpoint of a
+multi-megacell world: pattern search gathers sliding window views anchored on the
+live cells of the world and compares them to every orientation of a pattern at once,
+and objects are separated with a union-find connected component labeling that hooks
+and compresses the labels of all live cells in each pass.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+
+from collections import namedtuple, Counter
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .grid import Grid, Workspace
+from .vectorized import life_step
+from .exceptions import FastlifeValueError
+
+
+# The most window cells that are gathered at a time to compare with a pattern
+SEARCH_CELLS = 1 << 22
+
+# The number of live cells of a pattern checked before its windows are gathered
+SEARCH_PROBES = 4
+
+# The library of known objects described by their first phase and their period, where
+# "o" is a live cell and any other character is a dead cell.
+LIBRARY = {
+    "block": (["oo", "oo"], 1),
+    "beehive": ([".oo.", "o..o", ".oo."], 1),
+    "loaf": ([".oo.", "o..o", ".o.o", "..o."], 1),
+    "boat": (["oo.", "o.o", ".o."], 1),
+    "ship": (["oo.", "o.o", ".oo"], 1),
+    "tub": ([".o.", "o.o", ".o."], 1),
+    "pond": ([".oo.", "o..o", "o..o", ".oo."], 1),
+    "barge": ([".o..", "o.o.", ".o.o", "..o."], 1),
+    "long boat": (["oo..", "o.o.", ".o.o", "..o."], 1),
+    "snake": (["oo.o", "o.oo"], 1),
+    "aircraft carrier": (["oo..", "o..o", "..oo"], 1),
+    "mango": ([".oo..", "o..o.", ".o..o", "..oo."], 1),
+    "eater": (["oo..", "o.o.", "..o.", "..oo"], 1),
+    "blinker": (["ooo"], 2),
+    "toad": ([".ooo", "ooo."], 2),
+    "beacon": (["oo..", "oo..", "..oo", "..oo"], 2),
+    "clock": (["..o.", "o.o.", ".o.o", ".o.."], 2),
+    "pulsar": ([
+        "..ooo...ooo..",
+        ".............",
+        "o....o.o....o",
+        "o....o.o....o",
+        "o....o.o....o",
+        "..ooo...ooo..",
+        ".............",
+        "..ooo...ooo..",
+        "o....o.o....o",
+        "o....o.o....o",
+        "o....o.o....o",
+        ".............",
+        "..ooo...ooo..",
+    ], 3),
+    "glider": ([".o.", "..o", "ooo"], 4),
+    "lwss": ([".o..o", "o....", "o...o", "oooo."], 4),
+}
+
+# The objects of the library that travel across the world rather than staying put
+SPACESHIPS = frozenset(["glider", "lwss"])
+
+
+Object = namedtuple("Object", "name, top, left, pattern")
+Object.__doc__ = "An object separated from the world with its bounding box and cells"
+
+
+##########################################################################
+## Pattern Helpers
+##########################################################################
+
+def parse(rows):
+    """
+    Returns an int8 array from a list of strings where "o" marks a live cell.
+    """
+    return np.asarray([[c == "o" for c in row] for row in rows], dtype=np.int8)
+
+
+def crop(pattern):
+    """
+    Returns the pattern trimmed to the bounding box of its live cells.
+    """
+    rows, cols = np.nonzero(pattern)
+    if len(rows) == 0:
+        return pattern[:0, :0]
+    return pattern[rows.min():rows.max()+1, cols.min():cols.max()+1]
+
+
+def phases(pattern, period):
+    """
+    Returns the cropped phases of a pattern by stepping it in isolation for one period.
+    """
+    pattern = crop(np.asarray(pattern, dtype=np.int8))
+    pad = period + 1
+    world = np.pad(pattern, pad)
+    scratch = np.zeros_like(world)
+    workspace = Workspace(world.shape)
+
+    results = [pattern]
+    for _ in range(period-1):
+        life_step(world, scratch, workspace)
+        world, scratch = scratch, world
+        results.append(crop(world).copy())
+    return results
+
+
+def orientations(pattern):
+    """
+    Returns the distinct rotations and reflections of the pattern.
+    """
+    seen, results = set(), []
+    for flipped in (pattern, np.fliplr(pattern)):
+        for k in range(4):
+            rotated = np.ascontiguousarray(np.rot90(flipped, k))
+            key = (rotated.shape, rotated.tobytes())
+            if key not in seen:
+                seen.add(key)
+                results.append(rotated)
+    return results
+
+
+def canonical(pattern):
+    """
+    Returns a hashable key for the pattern that is the same for all of its rotations
+    and reflections.
+    """
+    pattern = crop(np.asarray(pattern, dtype=np.int8))
+    return min((o.shape, o.tobytes()) for o in orientations(pattern))
+
+
+def _index(library):
+    """
+    Maps every orientation of every phase of every library pattern to its name so
+    that objects can be looked up without computing their canonical form.
+    """
+    index = {}
+    for name, (rows, period) in library.items():
+        for phase in phases(parse(rows), period):
+            for orientation in orientations(phase):
+                index[(orientation.shape, orientation.tobytes())] = name
+    return index
+
+
+_LIBRARY_INDEX = None
+
+
+def library_index():
+    """
+    Returns the (cached) index of the orientations and phases of the library.
+    """
+    global _LIBRARY_INDEX
+    if _LIBRARY_INDEX is None:
+        _LIBRARY_INDEX = _index(LIBRARY)
+    return _LIBRARY_INDEX
+
+
+def _world(grid):
+    if isinstance(grid, Grid):
+        grid = grid._world
+    return np.asarray(grid)
+
+
+##########################################################################
+## Pattern Search
+##########################################################################
+
+def search(grid, pattern, period=1):
+    """
+    Finds every isolated occurrence of the pattern in the grid, in any of its
+    rotations, reflections and (if the period is greater than one) phases. An
+    occurrence is isolated if all of the cells bordering its bounding box are dead.
+
+    Only windows anchored on live cells are compared, so the cost depends on the
+    population of the world rather than on its size, and windows are compared a chunk
+    at a time so the memory used does not grow with the population.
+
+    Parameters
+    ----------
+    grid : Grid or ndarray
+        The world to search.
+
+    pattern : str, list of str or ndarray
+        The name of a pattern in the library, the rows of the pattern where "o" marks
+        a live cell, or an array of the pattern.
+
+    period : int, default: 1
+        The period of the pattern if it is not in the library.
+
+    Returns
+    -------
+    positions : ndarray of shape (n, 2)
+        The top left (i, j) of the bounding box of each occurrence.
+    """
+    if isinstance(pattern, str):
+        if pattern not in LIBRARY:
+            raise FastlifeValueError(f"unknown pattern '{pattern}'")
+        pattern, period = LIBRARY[pattern]
+    if not isinstance(pattern, np.ndarray):
+        pattern = parse(pattern)
+
+    templates, seen = [], set()
+    for phase in phases(pattern, period):
+        for orientation in orientations(phase):
+            key = (orientation.shape, orientation.tobytes())
+            if key not in seen:
+                seen.add(key)
+                templates.append(np.pad(orientation, 1))
+
+    # Pad the world so that patterns on the boundary have a dead border
+    world = np.pad(_world(grid).astype(np.int8, copy=False), 1)
+    live = np.nonzero(world)
+
+    found = []
+    for template in templates:
+        th, tw = template.shape
+        ai, aj = np.argwhere(template)[0]
+        ti, tj = live[0] - ai, live[1] - aj
+        valid = (ti >= 0) & (tj >= 0)
+        valid &= (ti <= world.shape[0] - th) & (tj <= world.shape[1] - tw)
+        ti, tj = ti[valid], tj[valid]
+
+        # A few more live cells of the template rule out most anchors cheaply
+        for pi, pj in np.argwhere(template)[1:SEARCH_PROBES+1]:
+            keep = world[ti+pi, tj+pj] != 0
+            ti, tj = ti[keep], tj[keep]
+
+        # Windows are gathered a chunk of anchors at a time to bound their memory
+        windows = sliding_window_view(world, template.shape)
+        matches = np.zeros(len(ti), dtype=bool)
+        chunk = max(1, SEARCH_CELLS // template.size)
+        for k in range(0, len(ti), chunk):
+            window = windows[ti[k:k+chunk], tj[k:k+chunk]]
+            matches[k:k+chunk] = (window == template).all(axis=(1, 2))
+
+        # Padded window coordinates are the top left of the pattern in the world
+        found.append(np.column_stack((ti[matches], tj[matches])))
+
+    if not found:
+        return np.zeros((0, 2), dtype=int)
+    return np.unique(np.concatenate(found), axis=0)
+
+
+##########################################################################
+## Connected Components and Classification
+##########################################################################
+
+def label(grid, distance=1):
+    """
+    Labels the connected components of live cells in the grid, where two live cells
+    are connected if they are within the specified chessboard distance of each other.
+
+    Parameters
+    ----------
+    grid : Grid or ndarray
+        The world to label.
+
+    distance : int, default: 1
+        The maximum chessboard distance between connected cells; 1 connects cells in
+        the Moore neighborhood, 2 also joins objects separated by a single dead cell.
+
+    Returns
+    -------
+    labels : ndarray of int
+        An array the shape of the world with 0 for dead cells and the 1-based label of
+        the component for live cells.
+
+    count : int
+        The number of components.
+    """
+    world = _world(grid) != 0
+    height, width = world.shape
+    n = int(world.sum())
+
+    dtype = np.int32 if n < 2**31 - 1 else np.int64
+    ids = np.full(world.shape, -1, dtype=dtype)
+    ids[world] = np.arange(n, dtype=dtype)
+
+    # Collect the edges between live cells in the forward half of the neighborhood
+    sources, targets = [], []
+    offsets = [(0, dj) for dj in range(1, distance+1)]
+    offsets += [
+        (di, dj) for di in range(1, distance+1) for dj in range(-distance, distance+1)
+    ]
+    for di, dj in offsets:
+        a = ids[:height-di, max(0, -dj):width-max(0, dj)]
+        b = ids[di:, max(0, dj):width-max(0, -dj)]
+        mask = (a >= 0) & (b >= 0)
+        sources.append(a[mask])
+        targets.append(b[mask])
+    sources, targets = np.concatenate(sources), np.concatenate(targets)
+
+    # Hook the larger root of every edge onto the smaller and compress until stable
+    parent = np.arange(n, dtype=dtype)
+    while True:
+        ps, pt = parent[sources], parent[targets]
+        changed = ps != pt
+        if not changed.any():
+            break
+
+        lo, hi = np.minimum(ps, pt)[changed], np.maximum(ps, pt)[changed]
+        np.minimum.at(parent, hi, lo)
+        while True:
+            grandparent = parent[parent]
+            if (grandparent == parent).all():
+                break
+            parent = grandparent
+
+    roots, components = np.unique(parent, return_inverse=True)
+    labels = np.zeros(world.shape, dtype=dtype)
+    labels[world] = components.reshape(-1) + 1
+    return labels, len(roots)
+
+
+def objects(grid, distance=2):
+    """
+    Separates the world into its connected components and yields each of them as an
+    Object with its name from the library (or None if it is not a known object), its
+    bounding box and its cropped cells. By default cells separated by a single dead
+    cell are part of the same object, since some oscillators (e.g. the toad and the
+    beacon) have phases that are not connected and objects that close can interact.
+    """
+    labels, count = label(grid, distance)
+    if count == 0:
+        return
+
+    index = library_index()
+    rows, cols = np.nonzero(labels)
+    ids = labels[rows, cols]
+    order = np.argsort(ids, kind="stable")
+    rows, cols, ids = rows[order], cols[order], ids[order]
+    splits = np.flatnonzero(np.diff(ids)) + 1
+
+    for crows, ccols in zip(np.split(rows, splits), np.split(cols, splits)):
+        top, left = crows.min(), ccols.min()
+        pattern = np.zeros((crows.max()-top+1, ccols.max()-left+1), dtype=np.int8)
+        pattern[crows-top, ccols-left] = 1
+        yield Object(index.get((pattern.shape, pattern.tobytes())), top, left, pattern)
+
+
+def classify(grid, distance=2):
+    """
+    Returns a Counter of the number of each kind of object in the world. Objects that
+    are not in the library are counted as "unknown".
+    """
+    return Counter(obj.name or "unknown" for obj in objects(grid, distance))
@@ -0,0 +1,260 @@
+# fastlife.pyramid
+# A multi-resolution pyramid of block population counts for plotting giant worlds.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Nov 03 10:18:52 2026 -0500
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: pyramid.py [] benjamin@bengfort.com $
+
+"""
+A multi-resolution pyramid of block population counts for plotting giant worlds.
+
+Showing a world with hundreds of millions of cells with ``imshow`` requires
+matplotlib to resample the entire world on every draw. Instead, like a mipmap, the
+pyramid stores the number of live cells in blocks of 2x2 cells, the number in blocks
+of 4x4 cells, and so on, and a window of the world is rendered from the coarsest
+level that still has at least as many blocks as there are pixels to fill, so the
+cost of rendering depends on the number of pixels rather than the size of the world.
+Changed regions of the world are marked as dirty and only the blocks that cover
+them are recounted when the pyramid is next read.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+
+from .exceptions import FastlifeValueError
+
+
+# The width and height in cells of the regions that are marked as changed
+TILE = 256
+
+
+def count_dtype(area):
+    """
+    Returns the smallest unsigned integer dtype that can hold the population of a
+    block of the specified area.
+    """
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if area <= np.iinfo(dtype).max:
+            return dtype
+    return np.uint64
+
+
+def block_sums(src, factor, dtype, r0=0, r1=None, c0=0, c1=None):
+    """
+    Returns the sums of the factor x factor blocks of src covering rows r0:r1 and
+    columns c0:c1 of the blocks (partial blocks at the edges are summed as well).
+    Every block is summed by adding strided views of src, one for each of the
+    positions within a block, which is much faster than a reduction over small axes.
+    """
+    height, width = src.shape
+    r1 = -(-height // factor) if r1 is None else r1
+    c1 = -(-width // factor) if c1 is None else c1
+
+    # Adding int8 cells to unsigned counts would otherwise use a wider loop
+    if src.dtype == np.int8 or src.dtype == bool:
+        src = src.view(np.uint8)
+
+    sub = src[r0*factor:min(r1*factor, height), c0*factor:min(c1*factor, width)]
+    out = np.zeros((r1 - r0, c1 - c0), dtype=dtype)
+    for i in range(factor):
+        for j in range(factor):
+            view = sub[i::factor, j::factor]
+            dst = out[:view.shape[0], :view.shape[1]]
+            np.add(dst, view, out=dst, casting="unsafe")
+    return out
+
+
+##########################################################################
+## Density Pyramid
+##########################################################################
+
+class DensityPyramid(object):
+    """
+    The population counts of the blocks of a world at every power of two resolution,
+    from blocks of ``block`` cells up to a single block covering the entire world.
+
+    Parameters
+    ----------
+    world : ndarray
+        The 2D world whose live cells are counted; the pyramid keeps a reference to
+        the world and recounts it when regions are marked as changed.
+
+    block : int, default: 2
+        The width and height of the blocks of the finest level of the pyramid.
+
+    tile : int, default: 256
+        The width and height in cells of the tiles that are marked as changed, which
+        is a multiple of the block size; every block of a changed tile is recounted.
+    """
+
+    def __init__(self, world, block=2, tile=TILE):
+        if block < 2:
+            raise FastlifeValueError("the blocks of the pyramid must be at least 2x2")
+        if tile < block or tile % block:
+            raise FastlifeValueError("the tile size must be a multiple of the block")
+
+        self.world = world
+        self.block = block
+        self.tile = tile
+        self.levels = []
+        self.dirty = None
+        self.rebuild()
+
+    def rebuild(self):
+        """
+        Recount every level of the pyramid from the world.
+        """
+        self.levels = [block_sums(self.world, self.block, self._dtype(0))]
+        while max(self.levels[-1].shape) > 1:
+            level = len(self.levels)
+            self.levels.append(block_sums(self.levels[-1], 2, self._dtype(level)))
+        height, width = self.shape
+        self.dirty = np.zeros((-(-height // self.tile), -(-width // self.tile)), bool)
+
+    @property
+    def shape(self):
+        return self.world.shape
+
+    @property
+    def nbytes(self):
+        return sum(level.nbytes for level in self.levels) + self.dirty.nbytes
+
+    def blocksize(self, level):
+        """
+        Returns the width and height in cells of the blocks of the level.
+        """
+        return self.block * 2**level
+
+    def mark(self, region=None):
+        """
+        Mark the (r0, r1, c0, c1) region of the world (or all of it) as changed so
+        that the blocks covering it are recounted when the pyramid is next read.
+        """
+        if region is None:
+            self.dirty.fill(True)
+            return
+
+        r0, r1, c0, c1 = region
+        if r1 <= r0 or c1 <= c0:
+            return
+        t = self.tile
+        self.dirty[max(r0, 0)//t:-(-r1//t), max(c0, 0)//t:-(-c1//t)] = True
+
+    def mark_cell(self, i, j):
+        """
+        Mark the tile of the cell at i, j (negative indices count from the end of the
+        world) as changed, using integer arithmetic only since it is called for every
+        cell that is set through a grid.
+        """
+        height, width = self.world.shape
+        self.dirty[(i % height) // self.tile, (j % width) // self.tile] = True
+
+    def refresh(self):
+        """
+        Recount the blocks of every level that cover the tiles marked as changed.
+        """
+        if not self.dirty.any():
+            return
+
+        height, width = self.shape
+        for t0, t1, u0, u1 in self._spans(self.dirty):
+            cells = (t0*self.tile, min(t1*self.tile, height))
+            cols = (u0*self.tile, min(u1*self.tile, width))
+
+            # Each level is recounted from the level below over the blocks that cover
+            # the changed cells, which the level below has already recounted
+            for level in range(len(self.levels)):
+                b = self.blocksize(level)
+                r0, r1 = cells[0] // b, -(-cells[1] // b)
+                c0, c1 = cols[0] // b, -(-cols[1] // b)
+                if level == 0:
+                    src, factor = self.world, self.block
+                else:
+                    src, factor = self.levels[level-1], 2
+                self.levels[level][r0:r1, c0:c1] = block_sums(
+                    src, factor, self._dtype(level), r0, r1, c0, c1
+                )
+
+        self.dirty.fill(False)
+
+    def select(self, window, pixels):
+        """
+        Returns the coarsest level that has at least the specified number of blocks
+        along the longer side of the (r0, r1, c0, c1) window, or -1 if even the finest
+        level has fewer blocks than pixels and the cells should be shown directly.
+        """
+        r0, r1, c0, c1 = window
+        size = max(r1 - r0, c1 - c0)
+        level = -1
+        while level + 1 < len(self.levels) and size / self.blocksize(level+1) >= pixels:
+            level += 1
+        return level
+
+    def density(self, level, window=None):
+        """
+        Returns the fraction of live cells in every block of the level that covers the
+        (r0, r1, c0, c1) window and the (r0, r1, c0, c1) cells covered by those blocks.
+        """
+        self.refresh()
+        height, width = self.shape
+        r0, r1, c0, c1 = window or (0, height, 0, width)
+        b = self.blocksize(level)
+
+        br0, br1, bc0, bc1 = r0//b, -(-r1//b), c0//b, -(-c1//b)
+        counts = self.levels[level][br0:br1, bc0:bc1]
+
+        # Blocks at the bottom and right edges of the world may be partial
+        rows = np.minimum(np.arange(br0+1, br1+1) * b, height) - np.arange(br0, br1) * b
+        cols = np.minimum(np.arange(bc0+1, bc1+1) * b, width) - np.arange(bc0, bc1) * b
+        area = np.outer(rows, cols).astype(np.float32)
+
+        cells = (br0*b, min(br1*b, height), bc0*b, min(bc1*b, width))
+        return counts / area, cells
+
+    def render(self, window=None, pixels=800):
+        """
+        Returns an image of the (r0, r1, c0, c1) window of the world with at least the
+        specified number of pixels along its longer side (when the world has that many
+        cells) and the (left, right, bottom, top) extent of the image in cells, which
+        can be passed directly to ``imshow``.
+        """
+        height, width = self.shape
+        window = window or (0, height, 0, width)
+        r0, r1, c0, c1 = window
+        if not (0 <= r0 < r1 <= height and 0 <= c0 < c1 <= width):
+            raise FastlifeValueError(f"window {window} is not inside the world")
+
+        level = self.select(window, pixels)
+        if level < 0:
+            image, cells = self.world[r0:r1, c0:c1], window
+        else:
+            image, cells = self.density(level, window)
+
+        r0, r1, c0, c1 = cells
+        return image, (c0, c1, r1, r0)
+
+    def _dtype(self, level):
+        return count_dtype(self.blocksize(level)**2)
+
+    @staticmethod
+    def _spans(dirty):
+        """
+        Yields (r0, r1, c0, c1) rectangles of tiles that cover every dirty tile, one
+        for every run of consecutive rows that contain dirty tiles.
+        """
+        rows = np.flatnonzero(dirty.any(axis=1))
+        if not len(rows):
+            return
+
+        breaks = np.flatnonzero(np.diff(rows) > 1) + 1
+        for run in np.split(rows, breaks):
+            r0, r1 = run[0], run[-1] + 1
+            cols = np.flatnonzero(dirty[r0:r1].any(axis=0))
+            yield r0, r1, cols[0], cols[-1] + 1
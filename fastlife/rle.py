@@ -0,0 +1,400 @@
+# fastlife.rle
+# Implements a run-length encoded world for huge, sparse, row-structured patterns.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Sat Oct 31 10:14:58 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: rle.py [] benjamin@bengfort.com $
+
+"""
+Implements a run-length encoded world for huge, sparse, row-structured patterns.
+
+Each row of the world is stored as the sorted [start, end) column intervals of its
+live cells and only rows with live cells are stored at all, so the memory used
+depends on the number of runs rather than on the width and height of the world.
+Generations are computed on the runs directly: the number of live cells in the 3x3
+block around each cell is a piecewise constant function of the column that only
+changes near the ends of the runs of the row and its neighbors, so each row of the
+next generation is computed from the sorted ends of at most three rows of runs.
+
+The runs also map directly onto the RLE file format used by most Game of Life
+software, which is the compact on-disk encoding of these worlds.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import re
+import gzip
+import numpy as np
+
+from .grid import Grid
+from .sequential import SequentialLife
+from .exceptions import FastlifeValueError, FastlifeTypeError
+
+
+EMPTY = np.zeros((0, 2), dtype=np.int64)
+
+RLE_HEADER = re.compile(r"^x\s*=\s*(?P<x>\d+)\s*,\s*y\s*=\s*(?P<y>\d+)", re.I)
+RLE_TOKEN = re.compile(r"(\d*)([bo$!])")
+
+
+def _open(path, mode="rt"):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+##########################################################################
+## Run-Length Encoded Rows
+##########################################################################
+
+def next_row(above, row, below, width):
+    """
+    Computes the runs of the next generation of a row from the runs of the row and
+    the rows above and below it, where each argument is an (n, 2) array of sorted,
+    disjoint [start, end) intervals of live cells.
+    """
+    positions, counts, alive = [], [], []
+    for runs in (above, row, below):
+        if not len(runs):
+            continue
+
+        # A run changes the 3-wide window sum one cell before and after its ends
+        starts, ends = runs[:, 0], runs[:, 1]
+        for offset in (-1, 0, 1):
+            positions += [starts + offset, ends + offset]
+            counts += [np.ones(len(runs)), -np.ones(len(runs))]
+            alive += [np.zeros(len(runs)), np.zeros(len(runs))]
+
+    if len(row):
+        positions += [row[:, 0], row[:, 1]]
+        counts += [np.zeros(len(row)), np.zeros(len(row))]
+        alive += [np.ones(len(row)), -np.ones(len(row))]
+
+    if not positions:
+        return EMPTY
+
+    # The total and the state are constant between consecutive distinct positions
+    breaks, inverse = np.unique(np.concatenate(positions), return_inverse=True)
+    total = np.cumsum(np.bincount(inverse, np.concatenate(counts), len(breaks)))
+    state = np.cumsum(np.bincount(inverse, np.concatenate(alive), len(breaks)))
+
+    # The total includes the cell itself, so live cells survive with a total of 3 or 4
+    live = np.rint(total) == 3
+    live |= (np.rint(total) == 4) & (np.rint(state) > 0)
+    live[-1] = False
+
+    edges = np.diff(np.concatenate(([False], live, [False])).astype(np.int8))
+    starts = breaks[np.flatnonzero(edges == 1)]
+    ends = breaks[np.flatnonzero(edges == -1)]
+
+    starts, ends = np.maximum(starts, 0), np.minimum(ends, width)
+    keep = starts < ends
+    return np.column_stack((starts[keep], ends[keep])).astype(np.int64)
+
+
+class RowGrid(object):
+    """
+    A Game of Life world stored as the run-length encoded live cells of each row,
+    which is an alternative to the dense Grid for huge, mostly empty worlds. Cells
+    outside of the world are dead and the neighborhood is always the Moore
+    neighborhood.
+
+    Parameters
+    ----------
+    width, height : int
+        The shape of the world.
+
+    rows : dict, default: None
+        Maps the index of every row with live cells to an (n, 2) int64 array of the
+        sorted, disjoint and non-adjacent [start, end) runs of live cells in the row.
+    """
+
+    def __init__(self, width=100, height=100, rows=None):
+        self.width = width
+        self.height = height
+        self.rows = rows or {}
+
+    @classmethod
+    def from_array(klass, world):
+        """
+        Encode a dense array of the world, where any nonzero cell is alive.
+        """
+        world = np.asarray(world) != 0
+        height, width = world.shape
+
+        edges = np.diff(np.pad(world, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+        starts, ends = np.nonzero(edges == 1), np.nonzero(edges == -1)
+
+        # Starts and ends are in row-major order, so they pair up within each row
+        runs = np.column_stack((starts[1], ends[1])).astype(np.int64)
+        rows, splits = np.unique(starts[0], return_index=True)
+        rows = dict(zip(rows.tolist(), np.split(runs, splits[1:])))
+        return klass(width, height, rows)
+
+    @classmethod
+    def from_cells(klass, cells, width, height):
+        """
+        Encode the live cells specified by a sequence of (i, j) coordinates.
+        """
+        cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+        if len(cells) and (
+            cells.min() < 0 or cells[:, 0].max() >= height or
+            cells[:, 1].max() >= width
+        ):
+            raise FastlifeValueError("live cells must be inside the world")
+
+        cells = np.unique(cells, axis=0)
+        rows = {}
+        for i in np.unique(cells[:, 0]):
+            cols = cells[cells[:, 0] == i, 1]
+            breaks = np.flatnonzero(np.diff(cols) != 1) + 1
+            starts = cols[np.concatenate(([0], breaks))]
+            ends = cols[np.concatenate((breaks - 1, [len(cols) - 1]))] + 1
+            rows[int(i)] = np.column_stack((starts, ends))
+        return klass(width, height, rows)
+
+    @property
+    def shape(self):
+        return (self.height, self.width)
+
+    @property
+    def runs(self):
+        """
+        The number of runs of live cells in the world.
+        """
+        return sum(len(runs) for runs in self.rows.values())
+
+    @property
+    def population(self):
+        return int(sum((runs[:, 1] - runs[:, 0]).sum() for runs in self.rows.values()))
+
+    @property
+    def nbytes(self):
+        return sum(runs.nbytes for runs in self.rows.values())
+
+    def to_array(self):
+        """
+        Decode the world into a dense int8 array.
+        """
+        world = np.zeros((self.height, self.width + 1), dtype=np.int8)
+        for i, runs in self.rows.items():
+            np.add.at(world[i], runs[:, 0], 1)
+            np.add.at(world[i], runs[:, 1], -1)
+        np.cumsum(world, axis=1, out=world)
+        return np.ascontiguousarray(world[:, :-1])
+
+    def step(self):
+        """
+        Returns the next generation of the world as a new RowGrid. Only the rows with
+        live cells and the rows next to them are computed.
+        """
+        candidates = set()
+        for i in self.rows:
+            candidates.update((i-1, i, i+1))
+
+        rows = {}
+        for i in sorted(candidates):
+            if i < 0 or i >= self.height:
+                continue
+
+            runs = next_row(
+                self.rows.get(i-1, EMPTY), self.rows.get(i, EMPTY),
+                self.rows.get(i+1, EMPTY), self.width,
+            )
+            if len(runs):
+                rows[i] = runs
+        return RowGrid(self.width, self.height, rows)
+
+    def to_rle(self, rule="B3/S23"):
+        """
+        Returns the world in the RLE file format, e.g. "x = 3, y = 3, ..." followed by
+        "bo$2bo$3o!" for a glider.
+        """
+        tokens, last = [], 0
+        for i in sorted(self.rows):
+            if i > last:
+                gap = i - last
+                tokens.append(f"{gap if gap > 1 else ''}$")
+            last, col = i, 0
+            for start, end in self.rows[i]:
+                for tag, count in (("b", start - col), ("o", end - start)):
+                    if count:
+                        tokens.append(f"{count if count > 1 else ''}{tag}")
+                col = end
+        tokens.append("!")
+
+        # Lines of the pattern should not be longer than 70 characters
+        lines, line = [f"x = {self.width}, y = {self.height}, rule = {rule}"], ""
+        for token in tokens:
+            if len(line) + len(token) > 70:
+                lines.append(line)
+                line = ""
+            line += token
+        lines.append(line)
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def from_rle(klass, text, width=None, height=None):
+        """
+        Parse a world in the RLE file format. The world is the size in the header
+        unless a larger width or height is specified.
+        """
+        lines = [line.strip() for line in text.splitlines()]
+        lines = [line for line in lines if line and not line.startswith("#")]
+        header = RLE_HEADER.match(lines[0]) if lines else None
+        if header is None:
+            raise FastlifeValueError("RLE data must start with an 'x = , y =' header")
+
+        width = max(width or 0, int(header.group("x")))
+        height = max(height or 0, int(header.group("y")))
+        body = "".join(lines[1:])
+
+        rows, runs, i, j = {}, [], 0, 0
+        for count, tag in RLE_TOKEN.findall(body):
+            count = int(count) if count else 1
+            if tag == "o":
+                runs.append((j, j + count))
+            if tag in "bo":
+                j += count
+                continue
+
+            if runs:
+                rows[i] = np.asarray(runs, dtype=np.int64)
+            if tag == "!":
+                break
+            runs, i, j = [], i + count, 0
+
+        if any(runs[:, 1].max() > width for runs in rows.values()) or (
+            rows and max(rows) >= height
+        ):
+            raise FastlifeValueError("RLE pattern is larger than its header")
+        return klass(width, height, {k: _merge(v) for k, v in rows.items()})
+
+    def save(self, path):
+        """
+        Write the world to an RLE file, compressed if the path ends in .gz.
+        """
+        with _open(path, "wt") as f:
+            f.write(self.to_rle())
+
+    @classmethod
+    def load(klass, path, width=None, height=None):
+        """
+        Read a world from an RLE file, decompressed if the path ends in .gz.
+        """
+        with _open(path, "rt") as f:
+            return klass.from_rle(f.read(), width, height)
+
+    def __array__(self, dtype=None, copy=None):
+        world = self.to_array()
+        return world if dtype is None else world.astype(dtype)
+
+    def __getitem__(self, ij):
+        if not isinstance(ij, tuple) or len(ij) != 2:
+            raise FastlifeTypeError("specify i, j position as a two-tuple")
+
+        i, j = ij
+        runs = self.rows.get(i, EMPTY)
+        idx = np.searchsorted(runs[:, 0], j, side="right") - 1
+        return int(idx >= 0 and j < runs[idx, 1])
+
+    def __eq__(self, other):
+        if not isinstance(other, RowGrid) or self.shape != other.shape:
+            return False
+        if self.rows.keys() != other.rows.keys():
+            return False
+        return all(np.array_equal(runs, other.rows[i]) for i, runs in self.rows.items())
+
+
+def _merge(runs):
+    """
+    Merges adjacent runs of a row, e.g. "2o3o" in an RLE file.
+    """
+    if len(runs) < 2:
+        return runs
+    breaks = np.flatnonzero(runs[1:, 0] != runs[:-1, 1]) + 1
+    starts = runs[np.concatenate(([0], breaks)), 0]
+    ends = runs[np.concatenate((breaks - 1, [len(runs) - 1])), 1]
+    return np.column_stack((starts, ends))
+
+
+##########################################################################
+## Run-Length Encoded Life Simulation
+##########################################################################
+
+class RunLengthLife(SequentialLife):
+    """
+    A Game of Life simulation on a run-length encoded RowGrid, whose memory and
+    step cost depend on the number of runs of live cells rather than the size of the
+    world. The dense current frame is only decoded when it is accessed, and it is
+    read-only, so the world must be changed with ``populate``.
+
+    Parameters
+    ----------
+    width, height : int
+        The shape of the world.
+    """
+
+    def __init__(self, width=512, height=512):
+        # The dense frames of the other engines are never allocated
+        self.initialized = False
+        self.grid = RowGrid(width, height)
+        self.frame = 0
+        self.now = 0
+        self._cframe = None
+
+    @property
+    def cframe(self):
+        # The dense frame is decoded at most once per generation and is read-only,
+        # since writes to the decoded copy would never reach the run-length grid
+        if self._cframe is None or self._cframe[0] != self.now:
+            grid = Grid(0, 0)
+            grid._world = self.grid.to_array()
+            grid._world.flags.writeable = False
+            self._cframe = (self.now, grid)
+        return self._cframe[1]
+
+    @property
+    def nframe(self):
+        raise FastlifeTypeError("run-length encoded simulations have no next frame")
+
+    def load(self, path):
+        """
+        Load the simulation from an RLE file or a data file of live cell coordinates.
+        """
+        width, height = self.grid.width, self.grid.height
+        if path.endswith((".rle", ".rle.gz")):
+            self.grid = RowGrid.load(path, width, height)
+        else:
+            with gzip.open(path, "rb") as f:
+                cells = [tuple(map(int, line.split())) for line in f if line.strip()]
+            self.grid = RowGrid.from_cells(cells, width, height)
+
+        self._cframe = None
+        self.initialized = True
+
+    def randomize(self, seed=None):
+        """
+        Create a random initial state from a seed value (the same state as the dense
+        engines for the same seed).
+        """
+        np.random.seed(seed)
+        self.populate(np.random.randint(2, size=self.grid.shape))
+
+    def populate(self, world):
+        self.grid = RowGrid.from_array(world)
+        self._cframe = None
+        self.initialized = True
+
+    def step(self):
+        """
+        Execute the next step in the simulation.
+        """
+        self.grid = self.grid.step()
+        self.now += 1
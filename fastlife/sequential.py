@@ -22,10 +22,19 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from tqdm import tqdm
+from collections import namedtuple
 from matplotlib.animation import FuncAnimation
 
 from .grid import Grid
-from .exceptions import FastlifeError
+from .terminal import TerminalRenderer
+from .exceptions import FastlifeError, FastlifeValueError
+
+
+Generation = namedtuple("Generation", "now, world")
+Generation.__doc__ = "A read-only view of the world at the specified generation"
+
+Delta = namedtuple("Delta", "now, births, deaths")
+Delta.__doc__ = "The (rows, cols) of cells born and died since the last generation"
 
 
 ##########################################################################
@@ -57,9 +66,10 @@ class SequentialLife(object):
         """
         grid = self.frames[self.frame]
         with gzip.open(path, 'rb') as f:
-            for line in f:
-                i, j = tuple(map(int, line.split()))
-                grid[i,j] = 1
+            cells = [tuple(map(int, line.split())) for line in f if line.strip()]
+
+        if cells:
+            grid[np.asarray(cells)] = 1
 
         self.initialized = True
 
@@ -68,8 +78,18 @@ class SequentialLife(object):
         Create a random initial state from a seed value.
         """
         np.random.seed(seed)
-        grid = self.cframe
-        grid._world = np.random.randint(2, size=grid.shape)
+        grid = self.frames[self.frame]
+        grid._world[:] = np.random.randint(2, size=grid.shape)
+        grid.invalidate()
+        self.initialized = True
+
+    def populate(self, world):
+        """
+        Initialize the simulation from an array the shape of the world.
+        """
+        grid = self.frames[self.frame]
+        grid._world[:] = world
+        grid.invalidate()
         self.initialized = True
 
     def step(self):
@@ -100,8 +120,17 @@ class SequentialLife(object):
 
 
         # Swap the current frame to the next frame and increment the number of steps
-        self.now += 1
+        self.swap()
+
+    def swap(self, generations=1):
+        """
+        Make the next frame the current frame once the engine has written the next
+        generation into it, advancing the number of steps by the generations computed.
+        Engines write the world directly, so the whole frame is marked as changed.
+        """
+        self.now += generations
         self.frame = 0 if self.frame == 1 else 1
+        self.frames[self.frame].invalidate()
 
     def run(self, steps=100, progress=True):
         """
@@ -117,6 +146,56 @@ class SequentialLife(object):
             for _ in range(steps):
                 self.step()
 
+    def generations(self, stride=1, until=None, delta=False):
+        """
+        Lazily step the simulation, yielding the current generation first and then
+        every ``stride`` generations until the generation ``until`` (or forever).
+
+        Each generation is yielded as a read-only view of the current frame rather than
+        a copy, so the view is only valid until the simulation is stepped again;
+        consumers that need to keep a generation must copy it. If ``delta`` is True,
+        the coordinates of the cells born and died since the previously yielded
+        generation are yielded instead of the world (the first delta contains every
+        live cell as a birth).
+
+        Parameters
+        ----------
+        stride : int, default: 1
+            The number of generations to step between each yielded generation.
+
+        until : int, default: None
+            Stop once this generation has been yielded or would be stepped past.
+
+        delta : bool, default: False
+            Yield sparse births and deaths rather than views of the world.
+        """
+        if not self.initialized:
+            raise FastlifeError("the game of life simulation has not been initialized")
+
+        if stride < 1:
+            raise FastlifeValueError("the stride must be at least one generation")
+
+        previous = None
+        while True:
+            world = self.cframe._world
+            if delta:
+                if previous is None:
+                    # A single buffer holds the last generation for all deltas
+                    previous = np.zeros_like(world)
+                alive, was = world != 0, previous != 0
+                births = np.nonzero(alive & ~was)
+                deaths = np.nonzero(was & ~alive)
+                np.copyto(previous, world)
+                yield Delta(self.now, births, deaths)
+            else:
+                view = world.view()
+                view.flags.writeable = False
+                yield Generation(self.now, view)
+
+            if until is not None and self.now + stride > until:
+                return
+            self.run(stride, progress=False)
+
     def animate(self, steps=100):
         """
         Animate the simulation for the specified number of steps.
@@ -135,3 +214,22 @@ class SequentialLife(object):
             repeat=False, init_func=lambda: self.cframe.plot(ax),
         )
         plt.show()
+
+    def tty(self, steps=100, fps=10, mode="braille", stream=None):
+        """
+        Run the simulation for the specified number of steps, drawing it to the
+        terminal with unicode characters at no more than the specified frame rate.
+        """
+        if not self.initialized:
+            raise FastlifeError("the game of life simulation has not been initialized")
+
+        renderer = TerminalRenderer(stream=stream, mode=mode, fps=fps)
+        try:
+            renderer.render(self.cframe, f"Timestep {self.now}", force=True)
+            for _ in range(steps):
+                self.step()
+                if renderer.ready():
+                    renderer.render(self.cframe, f"Timestep {self.now}")
+            renderer.render(self.cframe, f"Timestep {self.now}", force=True)
+        finally:
+            renderer.close()
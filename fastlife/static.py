@@ -0,0 +1,253 @@
+# fastlife.static
+# Stops stepping the tiles of the world that have settled into ash.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Nov 04 09:55:21 2026 -0500
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: static.py [] benjamin@bengfort.com $
+
+"""
+Stops stepping the tiles of the world that have settled into ash.
+
+Random soups settle into ash: still lifes and oscillators that never change again but
+are stepped every generation forever. The world is divided into square tiles and the
+last ``period`` generations are kept in a ring of frames, so the frame that the next
+generation is written into holds the world as it was ``period`` generations earlier.
+A tile whose next generation is the same as it was a period ago, and whose neighbors'
+are as well, has settled: the tile and the ring of cells around it repeat, so every
+later generation of the tile is already in the frames and it is not stepped again.
+Still lifes and oscillators whose period divides ``period`` settle wherever they are,
+no matter how close they are to each other. Cells only interact with their neighbors,
+so any tile that changes wakes the tiles around it for the next generation, and
+settled tiles are stepped again as soon as activity comes near. Every generation is
+exactly the same as if every tile had been stepped. Since the engine only looks for
+changes in the tiles that it steps, the world that is read is read-only and must be
+changed with ``populate``.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .grid import Grid, Workspace
+from .vectorized import life_step
+from .sequential import SequentialLife
+from .exceptions import FastlifeValueError
+
+
+# The whole world is stepped at once when at least this fraction of tiles is awake
+DENSE = 0.75
+
+
+##########################################################################
+## Helpers
+##########################################################################
+
+def dilate(mask):
+    """
+    Returns the mask with every element that is next to (or on) a True element set,
+    i.e. the tiles that are in the neighborhood of the tiles in the mask.
+    """
+    # The 3x3 neighborhood is separable into a vertical and a horizontal pass
+    rows = mask.copy()
+    rows[1:] |= mask[:-1]
+    rows[:-1] |= mask[1:]
+    dilated = rows.copy()
+    dilated[:, 1:] |= rows[:, :-1]
+    dilated[:, :-1] |= rows[:, 1:]
+    return dilated
+
+
+##########################################################################
+## Static Life Simulation
+##########################################################################
+
+class StaticLife(SequentialLife):
+    """
+    A Game of Life simulation that only steps the tiles of the world that have changed
+    (or whose neighbors have changed) since the same phase of the last period, so the
+    still lifes and oscillators that a world settles into are not stepped at all until
+    activity comes near. Reading ``cframe`` returns a read-only grid, so writing to it
+    raises an exception rather than being missed by the settled tiles.
+
+    Parameters
+    ----------
+    width, height : int
+        The shape of the world.
+
+    tile : int, default: 32
+        The width and height of the tiles that are stepped or settled together.
+
+    period : int, default: 6
+        The number of generations kept in the frames; tiles settle once they repeat
+        with this period, which includes still lifes and oscillators with periods 1,
+        2, 3 and 6. One frame the size of the world is allocated per generation.
+    """
+
+    def __init__(self, width=512, height=512, tile=32, period=6):
+        super(StaticLife, self).__init__(width, height)
+        if tile < 1:
+            raise FastlifeValueError("the tile size must be at least one cell")
+        if period < 1:
+            raise FastlifeValueError("the period must be at least 1 generation")
+
+        self.tile = tile
+        self.period = period
+        self.stepped = 0
+
+        # Each frame has a dead border and is rounded up to whole tiles
+        t, (height, width) = tile, self.frames[0].shape
+        self.rows, self.cols = -(-height // t), -(-width // t)
+        self.history = np.zeros((period, self.rows*t + 2, self.cols*t + 2), np.int8)
+        self.windows = sliding_window_view(self.history, (t+2, t+2), axis=(1, 2))
+        self.windows = self.windows[:, ::t, ::t]
+        self.tiles = self.history[:, 1:-1, 1:-1].reshape(period, self.rows, t, -1, t)
+        self.tiles = self.tiles.swapaxes(2, 3)
+
+        # Cells outside of the world (including the border) must stay dead
+        self.inside = np.zeros(self.history.shape[1:], dtype=np.int8)
+        self.inside[1:height+1, 1:width+1] = 1
+        self.clip = None
+        if self.rows*t != height or self.cols*t != width:
+            self.clip = self.inside[1:-1, 1:-1].reshape(self.rows, t, -1, t)
+            self.clip = self.clip.swapaxes(1, 2)
+
+        # Scratch buffers for stepping the whole world when most tiles are awake
+        self.scratch = np.zeros_like(self.inside)
+        self.diff = np.zeros(self.inside.shape, dtype=bool)
+        self.workspace = Workspace(self.inside.shape)
+
+        self.frames = [self._frame(world, height, width) for world in self.history]
+        self.views = [self._readonly(grid) for grid in self.frames]
+        self._reset()
+
+    @property
+    def cframe(self):
+        return self.views[self.frame]
+
+    @property
+    def nframe(self):
+        return self.frames[(self.frame + 1) % self.period]
+
+    def load(self, path):
+        super(StaticLife, self).load(path)
+        self._reset()
+
+    def randomize(self, seed=None):
+        super(StaticLife, self).randomize(seed)
+        self._reset()
+
+    def populate(self, world):
+        super(StaticLife, self).populate(world)
+        self._reset()
+
+    def step(self):
+        """
+        Execute the next step of the tiles that have not settled, swap the current grid
+        and wake the tiles around the tiles that changed.
+        """
+        src, dst = self.frame, (self.frame + 1) % self.period
+        rows, cols = np.nonzero(self.awake)
+        if len(rows) >= DENSE * self.awake.size:
+            changed = self._step_world(src, dst)
+        elif len(rows):
+            changed = self._step_tiles(src, dst, rows, cols)
+        else:
+            changed = np.zeros_like(self.awake)
+        self.stepped += len(rows)
+
+        # Until every frame has been written there is nothing to compare the tiles to
+        if self.settling:
+            self.settling -= 1
+            changed.fill(True)
+
+        self.awake = dilate(changed)
+        self.swap()
+
+    def swap(self, generations=1):
+        """
+        Make the next frame in the ring the current frame once the engine has written
+        the next generation into it.
+        """
+        self.now += generations
+        self.frame = (self.frame + generations) % self.period
+        self.views[self.frame].invalidate()
+
+    def report(self):
+        """
+        Returns a summary of the settled tiles and the cell updates saved.
+        """
+        tiles = self.rows * self.cols
+        settled = tiles - np.count_nonzero(self.awake)
+        saved = 1 - self.stepped / (tiles * self.now) if self.now else 0
+        return (
+            f"{settled} of {tiles} {self.tile}x{self.tile} tiles settled: "
+            f"{saved:0.1%} of cell updates saved"
+        )
+
+    def compute(self, windows):
+        """
+        Computes the next generation of the cores of a stack of tiles with borders.
+        The tiles are laid side by side into a single world and stepped together: the
+        core of each tile only depends on its own window, so tiles cannot affect each
+        other's cores.
+        """
+        t, n = self.tile, len(windows)
+        wide = windows.transpose(1, 0, 2).reshape(t+2, -1)
+        scratch = np.empty_like(wide)
+        life_step(wide, scratch, Workspace(wide.shape))
+        return scratch.reshape(t+2, n, t+2)[1:-1, :, 1:-1].transpose(1, 0, 2)
+
+    def _step_world(self, src, dst):
+        # Settled tiles are stepped too, which writes the same cells they already have
+        t, scratch, diff = self.tile, self.scratch, self.diff
+        life_step(self.history[src], scratch, self.workspace)
+        np.bitwise_and(scratch, self.inside, out=scratch)
+        np.not_equal(scratch, self.history[dst], out=diff)
+        np.copyto(self.history[dst], scratch)
+
+        # Reduce the rows of each tile first, which is much faster than both at once
+        rows = diff[1:-1].reshape(self.rows, t, -1).any(axis=1)
+        return rows[:, 1:-1].reshape(self.rows, self.cols, t).any(axis=2)
+
+    def _step_tiles(self, src, dst, rows, cols):
+        cores = self.compute(self.windows[src, rows, cols])
+        return self._settle(dst, rows, cols, cores)
+
+    def _settle(self, dst, rows, cols, cores):
+        # Write the next generation of the tiles and return the tiles that changed
+        if self.clip is not None:
+            cores &= self.clip[rows, cols]
+
+        # The next frame holds each tile as it was a period ago
+        diff = cores != self.tiles[dst, rows, cols]
+        changed = np.zeros_like(self.awake)
+        changed[rows, cols] = diff.reshape(len(rows), -1).any(axis=1)
+        self.tiles[dst, rows, cols] = cores
+        return changed
+
+    @staticmethod
+    def _frame(world, height, width):
+        grid = Grid(0, 0)
+        grid._world = world[1:height+1, 1:width+1]
+        return grid
+
+    @staticmethod
+    def _readonly(grid):
+        view = Grid(0, 0, grid.adjacency)
+        view._world = grid._world.view()
+        view._world.flags.writeable = False
+        return view
+
+    def _reset(self):
+        # Changing the world wakes every tile until a full period has been stepped
+        self.awake = np.ones((self.rows, self.cols), dtype=bool)
+        self.settling = self.period - 1
+        self.views[self.frame].invalidate()
@@ -0,0 +1,187 @@
+# fastlife.terminal
+# Renders the game of life world in a terminal with unicode block characters.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Fri Oct 23 10:22:09 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: terminal.py [] benjamin@bengfort.com $
+
+"""
+Renders the game of life world in a terminal with unicode block characters.
+
+Several cells are packed into each character (2x4 with braille, 1x2 with half blocks)
+and worlds that are larger than the terminal are downsampled so that a character is
+lit if any cell it covers is alive. Only the characters that changed since the last
+frame are redrawn and frames are rate limited, so that watching a simulation over SSH
+costs almost nothing compared to the simulation itself.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import sys
+import time
+import shutil
+import numpy as np
+
+from .exceptions import FastlifeValueError
+
+
+BRAILLE = "braille"
+HALF = "half"
+
+# Bit of the braille character for each (row, col) dot of its 4x2 cells
+BRAILLE_DOTS = np.asarray([[0x01, 0x08], [0x02, 0x10], [0x04, 0x20], [0x40, 0x80]])
+BRAILLE_BASE = 0x2800
+
+# Half block characters indexed by (top << 1 | bottom) of the 2x1 cells
+HALF_BLOCKS = np.asarray([ord(" "), ord("▄"), ord("▀"), ord("█")])
+
+# Number of (rows, cols) of cells packed into a single character
+CELLS = {BRAILLE: (4, 2), HALF: (2, 1)}
+
+CSI = "\x1b["
+
+
+##########################################################################
+## Encoding
+##########################################################################
+
+def downsample(world, factor):
+    """
+    Reduce the world by an integer factor in both dimensions, where a reduced cell is
+    alive if any of the cells it covers are alive.
+    """
+    if factor == 1:
+        return world != 0
+
+    height, width = world.shape
+    ph, pw = -height % factor, -width % factor
+    world = np.pad(world != 0, ((0, ph), (0, pw)))
+    blocks = world.reshape(world.shape[0] // factor, factor, -1, factor)
+    return blocks.any(axis=(1, 3))
+
+
+def encode(world, mode=BRAILLE):
+    """
+    Pack the cells of the world into an array of unicode code points, one per
+    character of the terminal.
+    """
+    if mode not in CELLS:
+        raise FastlifeValueError(f"'{mode}' is not a valid terminal mode")
+
+    rows, cols = CELLS[mode]
+    height, width = world.shape
+    world = np.pad(world != 0, ((0, -height % rows), (0, -width % cols)))
+    cells = world.reshape(world.shape[0] // rows, rows, -1, cols).swapaxes(1, 2)
+
+    if mode == BRAILLE:
+        return BRAILLE_BASE + np.tensordot(cells, BRAILLE_DOTS, axes=([2, 3], [0, 1]))
+    return HALF_BLOCKS[cells[..., 0, 0] * 2 + cells[..., 1, 0]]
+
+
+##########################################################################
+## Terminal Renderer
+##########################################################################
+
+class TerminalRenderer(object):
+    """
+    Draws frames of the world to a terminal, redrawing only the characters that have
+    changed since the previous frame and at most ``fps`` frames per second.
+
+    Parameters
+    ----------
+    stream : file, default: sys.stdout
+        The terminal to write ANSI escape sequences and characters to.
+
+    mode : str, default: "braille"
+        Pack 2x4 cells per braille character or 1x2 cells per half block character.
+
+    fps : float, default: 10
+        The maximum number of frames drawn per second.
+
+    size : tuple of int, default: None
+        The (columns, lines) of the terminal, detected from the terminal if None.
+    """
+
+    def __init__(self, stream=None, mode=BRAILLE, fps=10, size=None):
+        if mode not in CELLS:
+            raise FastlifeValueError(f"'{mode}' is not a valid terminal mode")
+
+        self.stream = stream or sys.stdout
+        self.mode = mode
+        self.interval = 1.0 / fps if fps else 0.0
+        self.size = size
+        self.previous = None
+        self.last = None
+
+    def ready(self):
+        """
+        Returns True if enough time has passed since the last frame to draw another.
+        """
+        return self.last is None or time.monotonic() - self.last >= self.interval
+
+    def factor(self, shape):
+        """
+        Returns the downsampling factor required to fit the world in the terminal,
+        leaving the last line for the status.
+        """
+        columns, lines = self.size or shutil.get_terminal_size()
+        rows, cols = CELLS[self.mode]
+        height, width = shape
+        return max(
+            1,
+            -(-height // (max(1, lines-1) * rows)),
+            -(-width // (max(1, columns) * cols)),
+        )
+
+    def render(self, world, status=None, force=False):
+        """
+        Draw the world if the frame rate allows it (or if forced) and return True if
+        the frame was drawn.
+        """
+        if not force and not self.ready():
+            return False
+        self.last = time.monotonic()
+
+        world = np.asarray(world)
+        codes = encode(downsample(world, self.factor(world.shape)), self.mode)
+
+        out = []
+        if self.previous is None or self.previous.shape != codes.shape:
+            # Draw the full frame the first time or if the layout has changed
+            out.append(f"{CSI}?25l{CSI}2J")
+            changed = np.ones(codes.shape, dtype=bool)
+        else:
+            changed = codes != self.previous
+
+        # Group the changed characters of each line into runs to minimize cursor moves
+        rows, cols = np.nonzero(changed)
+        if len(rows):
+            breaks = np.flatnonzero((np.diff(rows) != 0) | (np.diff(cols) != 1)) + 1
+            starts = np.concatenate(([0], breaks))
+            ends = np.concatenate((breaks, [len(rows)]))
+            for start, end in zip(starts, ends):
+                row, col = rows[start], cols[start]
+                line = codes[row, col:cols[end-1]+1]
+                out.append(f"{CSI}{row+1};{col+1}H{''.join(map(chr, line))}")
+
+        if status is not None:
+            out.append(f"{CSI}{codes.shape[0]+1};1H{status}{CSI}K")
+
+        self.previous = codes
+        self.stream.write("".join(out))
+        self.stream.flush()
+        return True
+
+    def close(self):
+        """
+        Move the cursor below the last frame and show it again.
+        """
+        lines = self.previous.shape[0] + 2 if self.previous is not None else 1
+        self.stream.write(f"{CSI}{lines};1H{CSI}?25h\n")
+        self.stream.flush()
@@ -0,0 +1,155 @@
+# fastlife.tiled
+# Implements a cache-blocked Game of Life that advances tiles several generations.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 29 10:26:48 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: tiled.py [] benjamin@bengfort.com $
+
+"""
+Implements a cache-blocked Game of Life that advances tiles several generations.
+
+Stepping the whole world one generation at a time streams every frame through the
+cache twice per generation, so large worlds are bound by memory bandwidth rather
+than by computation. Instead, each tile of the world is copied into a small buffer
+along with a halo of k cells on every side and advanced k generations while it is
+in cache before its core is written back. Errors from the missing cells beyond the
+halo move inwards by one cell per generation, so after k generations the core of the
+tile is exact, and the full world is only read and written once every k generations.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+
+from tqdm import tqdm
+
+from .grid import Workspace
+from .vectorized import life_step
+from .sequential import SequentialLife
+from .exceptions import FastlifeError, FastlifeValueError
+
+
+##########################################################################
+## Tiled Life Simulation
+##########################################################################
+
+class TiledLife(SequentialLife):
+    """
+    A Game of Life simulation that computes up to ``depth`` generations per pass over
+    the world by advancing each tile in a cache-sized buffer with a halo of ``depth``
+    cells. The tile buffers are allocated once, so passes do not allocate.
+
+    Parameters
+    ----------
+    width, height : int
+        The shape of the world.
+
+    tile : int, default: 512
+        The width and height of the core of each tile; the buffers for a tile and its
+        halo should fit in the L2 cache.
+
+    depth : int, default: 8
+        The depth of the halo, which is the number of generations per pass.
+    """
+
+    def __init__(self, width=512, height=512, tile=512, depth=8):
+        super(TiledLife, self).__init__(width, height)
+        if tile < 1:
+            raise FastlifeValueError("the tile size must be at least one cell")
+        if depth < 1:
+            raise FastlifeValueError("the depth must be at least one generation")
+
+        self.tile = tile
+        self.depth = depth
+        self.passes = 0
+
+        size = tile + 2*depth
+        self.buffers = [
+            np.zeros((size, size), dtype=np.int8),
+            np.zeros((size, size), dtype=np.int8),
+        ]
+        self.workspace = Workspace((size, size))
+
+    @property
+    def nbytes(self):
+        """
+        The memory used by the buffers of a single tile, which should fit in cache.
+        """
+        return sum(buf.nbytes for buf in self.buffers) + self.workspace.nbytes
+
+    def tiles(self):
+        """
+        Yields the (r0, r1, c0, c1) bounds of the core of every tile of the world.
+        """
+        height, width = self.frames[0].shape
+        for r0 in range(0, height, self.tile):
+            for c0 in range(0, width, self.tile):
+                yield r0, min(r0+self.tile, height), c0, min(c0+self.tile, width)
+
+    def advance(self, generations):
+        """
+        Make a single pass over the world that advances every tile by the specified
+        number of generations, which must not be more than the depth.
+        """
+        if not 1 <= generations <= self.depth:
+            raise FastlifeValueError(
+                f"can only advance 1 to {self.depth} generations per pass"
+            )
+
+        k, adjacency = self.depth, self.cframe.adjacency
+        src, dst = self.cframe._world, self.nframe._world
+        height, width = src.shape
+
+        for r0, r1, c0, c1 in self.tiles():
+            # The buffer covers the tile and its halo, clipped to the world
+            w0, w1 = max(r0-k, 0), min(r1+k, height)
+            v0, v1 = max(c0-k, 0), min(c1+k, width)
+            top, left = w0 - (r0-k), v0 - (c0-k)
+            bottom, right = top + w1 - w0, left + v1 - v0
+
+            buf = self.buffers[0]
+            buf.fill(0)
+            buf[top:bottom, left:right] = src[w0:w1, v0:v1]
+
+            frame = 0
+            for _ in range(generations):
+                cur, nxt = self.buffers[frame], self.buffers[1-frame]
+                life_step(cur, nxt, self.workspace, adjacency)
+
+                # Cells beyond the boundary of the world can never come alive
+                nxt[:top], nxt[bottom:] = 0, 0
+                nxt[:, :left], nxt[:, right:] = 0, 0
+                frame = 1 - frame
+
+            dst[r0:r1, c0:c1] = self.buffers[frame][k:k+r1-r0, k:k+c1-c0]
+
+        self.passes += 1
+        self.swap(generations)
+
+    def step(self):
+        """
+        Execute the next step in the simulation and swap the current grid.
+        """
+        self.advance(1)
+
+    def run(self, steps=100, progress=True):
+        """
+        Run the simulation for the specified number of steps from the current state,
+        advancing by the depth of the halo in every pass.
+        """
+        if not self.initialized:
+            raise FastlifeError("the game of life simulation has not been initialized")
+
+        with tqdm(total=steps, disable=not progress) as pbar:
+            remaining = steps
+            while remaining > 0:
+                generations = min(self.depth, remaining)
+                self.advance(generations)
+                pbar.update(generations)
+                remaining -= generations
@@ -0,0 +1,408 @@
+# fastlife.topology
+# Runs Life-like rules on any topology described by a table of neighbor indices.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Nov 02 09:41:12 2026 -0500
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: topology.py [] benjamin@bengfort.com $
+
+"""
+Runs Life-like rules on any topology described by a table of neighbor indices.
+
+A topology is stored as a compressed sparse row (CSR) table: the neighbors of cell k
+are ``indices[indptr[k]:indptr[k+1]]``, where cells are numbered in row-major order.
+The table is computed once, and every generation gathers the state of all neighbors
+with a single ``np.take`` and sums the neighbors of each cell with
+``np.add.reduceat``, so the same kernel steps rectangular grids with or without
+wrapping, twisted tori, Klein bottles, hexagonal lattices and irregular graphs. The
+Moore and von Neumann grids of the other engines are the special cases with eight and
+four constant offsets.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import re
+import numpy as np
+
+from collections import namedtuple
+
+from .sequential import SequentialLife
+from .grid import MOORE, VON_NEUMANN, MRIP, MRJP, VNIP, VNJP
+from .exceptions import FastlifeValueError, FastlifeTypeError
+
+
+HEXAGONAL = "hexagonal"
+
+# Axial coordinates: row i of the array is shifted i/2 cells right of the row above
+HXIP = np.asarray([-1, -1, 0, 1, 1, 0])
+HXJP = np.asarray([0, 1, 1, 0, -1, -1])
+
+Rule = namedtuple("Rule", "birth, survive")
+Rule.__doc__ = "A Life-like rule with the neighbor counts for birth and survival"
+
+RULE_RE = re.compile(r"^B(?P<birth>[\d,]*)/S(?P<survive>[\d,]*)$", re.I)
+
+CONWAY = "B3/S23"
+
+
+def parse_rule(rule):
+    """
+    Parses a rule in B/S notation, e.g. "B3/S23" for Conway's Game of Life or
+    "B2/S34" for a hexagonal Life. Counts are single digits unless they are separated
+    by commas, e.g. "B3,12/S2,3" for graphs with more than nine neighbors.
+    """
+    if isinstance(rule, Rule):
+        return rule
+
+    match = RULE_RE.match(rule.replace(" ", ""))
+    if match is None:
+        raise FastlifeValueError(f"'{rule}' is not a valid B/S rule")
+
+    def counts(group):
+        if "," in group:
+            return frozenset(int(c) for c in group.split(",") if c)
+        return frozenset(int(c) for c in group)
+
+    return Rule(counts(match.group("birth")), counts(match.group("survive")))
+
+
+##########################################################################
+## Topologies
+##########################################################################
+
+class Topology(object):
+    """
+    The neighbors of every cell of a world stored as a compressed sparse row table.
+    Topologies are usually created with one of the constructors, e.g. ``moore``,
+    ``hexagonal`` or ``Topology.from_edges``, rather than directly.
+
+    Parameters
+    ----------
+    indptr : array of int
+        The offsets into indices of the neighbors of each cell, of length size + 1.
+
+    indices : array of int
+        The concatenated neighbors of every cell; a cell may be listed more than once
+        if it neighbors another cell more than once, e.g. on a very small torus.
+
+    shape : tuple of int, default: None
+        The shape of the world the cells are laid out in, by default (1, size).
+    """
+
+    def __init__(self, indptr, indices, shape=None):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        size = len(self.indptr) - 1
+        if size < 1 or self.indptr[0] != 0 or np.any(np.diff(self.indptr) < 0):
+            raise FastlifeValueError("indptr must be non-decreasing offsets from 0")
+
+        self.indices = np.asarray(indices, dtype=np.intp)
+        if len(self.indices) != self.indptr[-1]:
+            raise FastlifeValueError("indptr does not match the number of indices")
+        if len(self.indices) and (self.indices.min() < 0 or self.indices.max() >= size):
+            raise FastlifeValueError("neighbor indices must be cells of the topology")
+
+        self.shape = tuple(shape) if shape is not None else (1, size)
+        if int(np.prod(self.shape)) != size:
+            raise FastlifeValueError(f"{size} cells cannot be laid out as {self.shape}")
+
+        self.degree = np.diff(self.indptr)
+
+        # reduceat cannot sum empty rows, so cells without neighbors are summed apart
+        self.isolated = not self.degree.all()
+        self.connected = np.flatnonzero(self.degree) if self.isolated else None
+        self.starts = self.indptr[:-1][self.degree > 0]
+
+    @classmethod
+    def from_offsets(klass, shape, rows, cols, wrap=False, twist=0, flip=False):
+        """
+        Creates the topology of a lattice where the neighbors of cell (i, j) are
+        (i + rows[k], j + cols[k]) for every offset k.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            The (height, width) of the lattice.
+
+        rows, cols : array of int
+            The row and column offsets of the neighbors.
+
+        wrap : bool, default: False
+            Wrap the lattice into a torus, otherwise cells beyond the edge of the
+            world are not neighbors (they are always dead).
+
+        twist : int, default: 0
+            Shift columns by this many cells every time the top or bottom edge of a
+            wrapped lattice is crossed, producing a twisted (helical) torus.
+
+        flip : bool, default: False
+            Mirror the columns every time the top or bottom edge of a wrapped lattice
+            is crossed, producing a Klein bottle.
+        """
+        height, width = shape
+        if (twist or flip) and not wrap:
+            raise FastlifeValueError("only a wrapped lattice can be twisted or flipped")
+
+        i, j = np.indices(shape)
+        ni = i.reshape(-1, 1) + np.asarray(rows).reshape(1, -1)
+        nj = j.reshape(-1, 1) + np.asarray(cols).reshape(1, -1)
+
+        if wrap:
+            wraps = np.floor_divide(ni, height)
+            ni -= wraps * height
+            if flip:
+                nj = np.where(wraps % 2 == 1, width - 1 - nj, nj)
+            nj = (nj + twist * wraps) % width
+            valid = np.ones(ni.shape, dtype=bool)
+        else:
+            valid = (ni >= 0) & (ni < height) & (nj >= 0) & (nj < width)
+
+        # Row-major order keeps the neighbors of each cell together
+        indices = (ni * width + nj)[valid]
+        indptr = np.zeros(height * width + 1, dtype=np.int64)
+        np.cumsum(valid.sum(axis=1), out=indptr[1:])
+        return klass(indptr, indices, shape)
+
+    @classmethod
+    def from_edges(klass, size, edges, directed=False, shape=None):
+        """
+        Creates the topology of a graph of size cells from an (m, 2) array of edges;
+        an undirected edge (a, b) makes a and b neighbors of each other, a directed
+        edge makes b a neighbor of a.
+        """
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        src, dst = edges[:, 0], edges[:, 1]
+        if not directed:
+            src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+
+        if len(src) and (src.min() < 0 or src.max() >= size):
+            raise FastlifeValueError("edges must be between cells of the topology")
+
+        order = np.argsort(src, kind="stable")
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=size), out=indptr[1:])
+        return klass(indptr, dst[order], shape)
+
+    @classmethod
+    def from_neighbors(klass, neighbors, shape=None):
+        """
+        Creates a topology from a list of the neighbors of every cell.
+        """
+        indptr = np.zeros(len(neighbors) + 1, dtype=np.int64)
+        np.cumsum([len(n) for n in neighbors], out=indptr[1:])
+        indices = np.fromiter(
+            (k for n in neighbors for k in n), dtype=np.int64, count=indptr[-1]
+        )
+        return klass(indptr, indices, shape)
+
+    @property
+    def size(self):
+        return len(self.indptr) - 1
+
+    @property
+    def max_degree(self):
+        return int(self.degree.max())
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + self.starts.nbytes
+
+    def neighbors(self, cell):
+        """
+        Returns the neighbors of the cell, given as a number or an (i, j) position.
+        """
+        if isinstance(cell, tuple):
+            cell = np.ravel_multi_index(cell, self.shape)
+        return self.indices[self.indptr[cell]:self.indptr[cell+1]]
+
+    def count(self, state, out=None, gathered=None):
+        """
+        Returns the number of live neighbors of every cell of the flat state array.
+
+        Parameters
+        ----------
+        state : ndarray of int8
+            The state of every cell in row-major order.
+
+        out : ndarray of int, default: None
+            The buffer to write the counts into, allocated if not given; int8 counts
+            are fastest but can only be used if no cell has more than 127 neighbors.
+
+        gathered : ndarray of int8, default: None
+            A buffer with one element per index to gather the neighbor states into,
+            allocated if not given.
+        """
+        if out is None:
+            out = np.zeros(self.size, dtype=np.int32)
+        if gathered is None:
+            gathered = np.empty(len(self.indices), dtype=state.dtype)
+
+        # The indices were checked when the table was built, and clip avoids buffering
+        np.take(state, self.indices, out=gathered, mode="clip")
+        if not self.isolated:
+            np.add.reduceat(gathered, self.starts, out=out, dtype=out.dtype)
+            return out
+
+        out.fill(0)
+        if len(self.starts):
+            sums = np.add.reduceat(gathered, self.starts, dtype=out.dtype)
+            out[self.connected] = sums
+        return out
+
+    def __repr__(self):
+        return f"<Topology {self.size} cells {self.shape} {len(self.indices)} edges>"
+
+
+def moore(shape, wrap=False, twist=0, flip=False):
+    """
+    The rectangular lattice of the other engines, where every cell has eight
+    neighbors including diagonals.
+    """
+    return Topology.from_offsets(shape, MRIP, MRJP, wrap, twist, flip)
+
+
+def von_neumann(shape, wrap=False, twist=0, flip=False):
+    """
+    The rectangular lattice where every cell has four orthogonal neighbors.
+    """
+    return Topology.from_offsets(shape, VNIP, VNJP, wrap, twist, flip)
+
+
+def hexagonal(shape, wrap=False, twist=0, flip=False):
+    """
+    The hexagonal lattice in axial coordinates, where every cell has six neighbors:
+    two in the row above, two in its own row and two in the row below.
+    """
+    return Topology.from_offsets(shape, HXIP, HXJP, wrap, twist, flip)
+
+
+TOPOLOGIES = {
+    MOORE: moore,
+    VON_NEUMANN: von_neumann,
+    HEXAGONAL: hexagonal,
+}
+
+
+##########################################################################
+## Topology Kernel
+##########################################################################
+
+def rule_table(rule, max_degree):
+    """
+    Returns the lookup table of the next state of a cell indexed by its state times
+    (max_degree + 1) plus its number of live neighbors.
+    """
+    rule = parse_rule(rule)
+    table = np.zeros((2, max_degree + 1), dtype=np.int8)
+    table[0, [c for c in rule.birth if c <= max_degree]] = 1
+    table[1, [c for c in rule.survive if c <= max_degree]] = 1
+    return table.reshape(-1)
+
+
+class TopologyWorkspace(object):
+    """
+    The preallocated buffers used to step a topology, so that stepping does not
+    allocate any arrays the size of the world or of the neighbor table.
+    """
+
+    __slots__ = ["gathered", "counts", "index"]
+
+    def __init__(self, topology):
+        # The rule table index of a cell is at most 2 * (max_degree + 1) - 1
+        dtype = np.int8 if topology.max_degree < 63 else np.int32
+        self.gathered = np.zeros(len(topology.indices), dtype=np.int8)
+        self.counts = np.zeros(topology.size, dtype=dtype)
+        self.index = np.zeros(topology.size, dtype=dtype)
+
+    @property
+    def nbytes(self):
+        return self.gathered.nbytes + self.counts.nbytes + self.index.nbytes
+
+
+def topology_step(src, dst, topology, table, workspace):
+    """
+    Computes the next generation of the flat ``src`` state on the topology and writes
+    it into ``dst`` using the rule table (see ``rule_table``) and the buffers of the
+    workspace.
+    """
+    counts = topology.count(src, workspace.counts, workspace.gathered)
+    index = workspace.index
+    np.copyto(index, src, casting="unsafe")
+    np.multiply(index, topology.max_degree + 1, out=index)
+    np.add(index, counts, out=index)
+    np.take(table, index, out=dst, mode="clip")
+    return dst
+
+
+##########################################################################
+## Topology Life Simulation
+##########################################################################
+
+class TopologyLife(SequentialLife):
+    """
+    A simulation of a Life-like rule on any topology, stepped with a single gather
+    and reduce over the precomputed neighbor table of the topology. Graphs that are
+    not lattices are laid out in a world of the specified width and height in the
+    order their cells are numbered.
+
+    Parameters
+    ----------
+    width, height : int
+        The shape of the world.
+
+    topology : str or Topology, default: "moore"
+        Either a Topology with width * height cells or the name of a lattice: "moore",
+        "von neumann" or "hexagonal".
+
+    rule : str or Rule, default: "B3/S23"
+        The rule in B/S notation.
+
+    wrap, twist, flip : default: False, 0, False
+        Wrap, twist or flip the named lattice, see ``Topology.from_offsets``.
+    """
+
+    def __init__(self, width=512, height=512, topology=MOORE, rule=CONWAY, wrap=False,
+                 twist=0, flip=False):
+        super(TopologyLife, self).__init__(width, height)
+        shape = self.frames[0].shape
+
+        if isinstance(topology, str):
+            name = topology.lower().replace("_", " ").strip()
+            if name not in TOPOLOGIES:
+                raise FastlifeValueError(f"'{topology}' is not a known topology")
+            topology = TOPOLOGIES[name](shape, wrap, twist, flip)
+        elif not isinstance(topology, Topology):
+            raise FastlifeTypeError("topology must be a Topology or a lattice name")
+
+        if topology.size != width * height:
+            raise FastlifeValueError(
+                f"the topology has {topology.size} cells but the world has "
+                f"{width * height}"
+            )
+
+        self.topology = topology
+        self.rule = parse_rule(rule)
+        self.table = rule_table(self.rule, topology.max_degree)
+        self.workspace = TopologyWorkspace(topology)
+
+    @property
+    def nbytes(self):
+        """
+        The memory used by the neighbor table and the workspace.
+        """
+        return self.topology.nbytes + self.workspace.nbytes
+
+    def step(self):
+        """
+        Execute the next step in the simulation and swap the current grid.
+        """
+        src = self.cframe._world.reshape(-1)
+        dst = self.nframe._world.reshape(-1)
+        topology_step(src, dst, self.topology, self.table, self.workspace)
+
+        # Swap the current frame to the next frame and increment the number of steps
+        self.swap()
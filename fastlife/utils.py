@@ -61,7 +61,7 @@ def load_mprofile(path, name=None):
         for line in f:
             if line.startswith("CMDLINE"):
                 if name is None:
-                    name = line.rstrip("CMDLINE").strip()
+                    name = line[len("CMDLINE"):].strip()
 
             if line.startswith("MEM"):
                 parts = line.split()
@@ -0,0 +1,105 @@
+# fastlife.vectorized
+# Implements a Game of Life cellular automata using whole-array numpy operations.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 14:12:40 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: vectorized.py [] benjamin@bengfort.com $
+
+"""
+Implements a Game of Life cellular automata using whole-array numpy operations.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+
+from .sequential import SequentialLife
+from .grid import MOORE, MRIP, MRJP, VNIP, VNJP
+
+
+##########################################################################
+## Vectorized Kernel
+##########################################################################
+
+def shift(delta):
+    """
+    Returns the pair of slices (dst, src) along a single axis such that
+    ``dst[k] == src[k] + delta`` for every index that is inside the world. Cells that
+    would be shifted in from outside of the world are treated as dead.
+    """
+    if delta < 0:
+        return slice(-delta, None), slice(None, delta)
+    if delta > 0:
+        return slice(None, -delta), slice(delta, None)
+    return slice(None), slice(None)
+
+
+def life_step(src, dst, workspace, adjacency=MOORE):
+    """
+    Computes the next generation of the ``src`` world and writes it into ``dst``. All
+    intermediate results are written into the preallocated buffers of the workspace
+    so that the kernel performs no full-size allocations of its own. Cells outside of
+    the world are considered dead.
+
+    Parameters
+    ----------
+    src, dst : ndarray of int8
+        The current world and the buffer to write the next generation into; these
+        must be distinct arrays of the same shape.
+
+    workspace : Workspace
+        The scratch buffers for the shape of the world, see ``Grid.workspace``.
+
+    adjacency : str, default: "moore"
+        The type of neighborhood, either "von neumann" or "moore"
+    """
+    counts, born, survive = workspace.counts, workspace.born, workspace.survive
+    ip, jp = (MRIP, MRJP) if adjacency == MOORE else (VNIP, VNJP)
+
+    # Accumulate the neighbor counts by adding shifted views of the world
+    counts.fill(0)
+    for id, jd in zip(ip, jp):
+        (ci, si), (cj, sj) = shift(id), shift(jd)
+        np.add(counts[ci, cj], src[si, sj], out=counts[ci, cj])
+
+    # Cells are born with exactly three neighbors and survive with two or three
+    np.equal(counts, 3, out=born)
+    np.equal(counts, 2, out=survive)
+    np.logical_and(survive, src, out=survive)
+    np.logical_or(born, survive, out=born)
+    np.copyto(dst, born, casting="unsafe")
+    return dst
+
+
+##########################################################################
+## Vectorized Life Simulation
+##########################################################################
+
+class VectorizedLife(SequentialLife):
+    """
+    A single process Game of Life simulation that computes each generation for the
+    entire world at once with numpy rather than looping over every cell in Python.
+    Both frames and the scratch workspace are allocated up front, so stepping the
+    simulation does not allocate any full-size arrays.
+    """
+
+    @property
+    def workspace(self):
+        # Both frames are the same shape so only the first frame's workspace is used
+        return self.frames[0].workspace
+
+    def step(self):
+        """
+        Execute the next step in the simulation and swap the current grid.
+        """
+        cframe = self.cframe
+        life_step(cframe._world, self.nframe._world, self.workspace, cframe.adjacency)
+
+        # Swap the current frame to the next frame and increment the number of steps
+        self.swap()
@@ -0,0 +1,138 @@
+# tests.test_autotune
+# Tests for the autotuned game of life simulation.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 27 13:42:19 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_autotune.py [] benjamin@bengfort.com $
+
+"""
+Tests for the autotuned game of life simulation.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import numpy as np
+
+from fastlife.autotune import *
+from fastlife.vectorized import VectorizedLife
+from fastlife.exceptions import FastlifeValueError
+
+
+VECTORIZED = make_config("vectorized")
+DISTRIBUTED = make_config("distributed", workers=2, halo=2)
+
+
+def test_candidates():
+    """
+    Test small worlds are never distributed
+    """
+    assert candidates((64, 64), 8) == [VECTORIZED]
+
+    configs = candidates((512, 512), 4)
+    assert VECTORIZED in configs
+    assert make_config("distributed", workers=4, halo=4) in configs
+    assert all(dict(c.options).get("workers", 0) <= 4 for c in configs)
+
+    with pytest.raises(FastlifeValueError):
+        make_config("sequential")
+
+
+def test_world_key():
+    """
+    Test worlds of the same shape and similar density share a cache key
+    """
+    node = machine()
+    world = np.zeros((30, 40), dtype=np.int8)
+    world[:15] = 1
+
+    similar = np.zeros((30, 40), dtype=np.int8)
+    similar[:14] = 1
+    assert world_key(world, node) == world_key(similar, node)
+    assert world_key(world, node).endswith(":30x40:d-1")
+    assert world_key(world, node) != world_key(world[:20], node)
+    assert world_key(np.zeros((30, 40)), node) != world_key(world, node)
+
+
+def test_calibrate_and_cache(tmp_path):
+    """
+    Test calibration ranks the configurations and decisions are cached on disk
+    """
+    world = np.random.default_rng(3).integers(0, 2, (30, 40)).astype(np.int8)
+    timings = calibrate(world, [VECTORIZED, DISTRIBUTED], steps=2)
+    assert {config for _, config in timings} == {VECTORIZED, DISTRIBUTED}
+    assert timings[0][0] <= timings[1][0]
+
+    path = tmp_path / "tuning.json"
+    cache = TuningCache(path)
+    cache.put("key", DISTRIBUTED, 0.1)
+    assert TuningCache(path).get("key") == DISTRIBUTED
+    assert TuningCache(path).get("other") is None
+
+
+class TestAutoLife(object):
+
+    def test_matches_vectorized(self, tmp_path):
+        """
+        Test the autotuned simulation computes the same world and caches its decision
+        """
+        expected = VectorizedLife(40, 30)
+        expected.randomize(42)
+        expected.run(25, progress=False)
+
+        path = tmp_path / "tuning.json"
+        with AutoLife(40, 30, cache=path, steps=2, interval=10) as sim:
+            sim.randomize(42)
+            sim.run(20, progress=False)
+            sim.step()
+            for _ in sim.generations(stride=2, until=25):
+                pass
+
+            assert sim.now == 25
+            assert sim.config == VECTORIZED
+            assert (sim.cframe._world == expected.cframe._world).all()
+        assert len(TuningCache(path).decisions) >= 1
+
+    def test_switch_on_density(self, tmp_path):
+        """
+        Test the world moves to another engine when its density changes
+        """
+        world = np.random.default_rng(7).integers(0, 2, (30, 40)).astype(np.int8)
+        sparse = np.zeros_like(world)
+        sparse[10:13, 10:13] = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+
+        # Seed the cache so that dense and sparse worlds use different engines
+        cache = TuningCache(tmp_path / "tuning.json")
+        cache.put(world_key(world), VECTORIZED, 0.1)
+        cache.put(world_key(sparse), DISTRIBUTED, 0.1)
+
+        expected = VectorizedLife(40, 30)
+        expected.populate(sparse)
+        expected.run(12, progress=False)
+
+        with AutoLife(40, 30, cache=cache.path, interval=4) as sim:
+            sim.populate(world)
+            sim.run(4, progress=False)
+            assert sim.config == VECTORIZED
+
+            sim.cframe._world[:] = sparse
+            sim.run(12, progress=False)
+
+            assert sim.config == DISTRIBUTED
+            assert [config for _, config in sim.switches] == [VECTORIZED, DISTRIBUTED]
+            assert "from generation 8: distributed halo=2 workers=2" in sim.report()
+            assert (sim.cframe._world == expected.cframe._world).all()
+
+            # Writes to the distributed frame would never reach the workers
+            with pytest.raises(ValueError):
+                sim.cframe[0, 0] = 1
+
+        # Closing moves the world back to the simulation itself
+        assert sim.engine is None
+        assert (sim.cframe._world == expected.cframe._world).all()
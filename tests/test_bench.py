@@ -0,0 +1,66 @@
+# tests.test_bench
+# Tests for the micro-benchmark suite.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 26 11:20:37 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_bench.py [] benjamin@bengfort.com $
+
+"""
+Tests for the micro-benchmark suite.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import csv
+import pytest
+
+from fastlife.bench import *
+from fastlife.utils import load_mprofile
+from fastlife.exceptions import FastlifeValueError
+
+
+def test_run_and_write(tmp_path):
+    """
+    Test every benchmark is timed on every size and written to CSV
+    """
+    results = run(sizes=(8, 16), repeat=2, progress=False)
+    assert len(results) == 2 * (len(ACCESS_PATHS) + len(ENGINES))
+    assert all(r.best > 0 and r.best <= r.mean for r in results)
+    assert {(r.group, r.size) for r in results} == {
+        (ACCESS, 8), (ACCESS, 16), (ENGINE, 8), (ENGINE, 16),
+    }
+
+    path = tmp_path / "results.csv"
+    write(results, path)
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == len(results)
+    assert "access:neighborhood_sum" in report(results)
+
+    with pytest.raises(FastlifeValueError):
+        run(groups=("foo",))
+
+
+def test_mprofile_and_figures(tmp_path):
+    """
+    Test memory profiles can be loaded with load_mprofile and plotted
+    """
+    pytest.importorskip("pandas")
+
+    path = mprofile(ACCESS, "neighborhood_sum", 16, tmp_path / "ns.dat")
+    series = load_mprofile(path)
+    assert series.name == "access:neighborhood_sum 16x16"
+    assert len(series) > 0 and series.index[0] == 0
+
+    results = run(sizes=(8,), repeat=1, groups=(ACCESS,), progress=False)
+    saved = figures(results, {(ACCESS, "neighborhood_sum"): path}, tmp_path)
+    assert [p.name for p in map(tmp_path.joinpath, saved)] == [
+        "micro_benchmarks.png", "neighborhood_memory_usage.png",
+    ]
+    assert all(tmp_path.joinpath(p).exists() for p in saved)
@@ -0,0 +1,135 @@
+# tests.test_census
+# Tests for the random soup census.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 22 12:05:14 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_census.py [] benjamin@bengfort.com $
+
+"""
+Tests for the random soup census.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import json
+import pytest
+import numpy as np
+
+from collections import Counter
+
+from fastlife.census import *
+from fastlife.patterns import LIBRARY, classify, parse
+from fastlife.exceptions import FastlifeValueError
+
+
+def test_soup():
+    """
+    Test soups are deterministic for a seed
+    """
+    assert (soup(42) == soup(42)).all()
+    assert (soup(42) != soup(43)).any()
+    assert soup(7, size=8).shape == (8, 8)
+
+
+def test_stabilize():
+    """
+    Test stabilization detects still lifes and oscillators
+    """
+    world = np.zeros((10, 10), dtype=np.int8)
+    world[4, 3:6] = 1
+    generations, period = stabilize(world)
+    assert (generations, period) == (2, 2)
+    assert world[4, 3:6].all()
+
+    # A glider in a large world does not stabilize quickly
+    world = np.zeros((40, 40), dtype=np.int8)
+    world[1:4, 1:4] = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+    assert stabilize(world, max_generations=20) == (20, None)
+
+
+def test_escapes():
+    """
+    Test spaceships are removed and counted before they crash into the boundary
+    """
+    # Without removal a glider turns into a block at the boundary
+    glider = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+    world = np.zeros((40, 40), dtype=np.int8)
+    world[15:18, 15:18] = glider
+    stabilize(world)
+    assert classify(world) == {"block": 1}
+
+    escapes = Counter()
+    world = np.zeros((40, 40), dtype=np.int8)
+    world[15:18, 15:18] = glider
+    world[28:32, 20:25] = parse(LIBRARY["lwss"][0])
+    world[5:7, 32:34] = 1
+    generations, period = stabilize(world, escapes=escapes)
+    assert period == 1 and generations < 100
+    assert escapes == {"glider": 1, "lwss": 1}
+    assert classify(world) == {"block": 1}
+
+
+def test_run_soup():
+    """
+    Test soups tally the spaceships that escape along with the objects they leave
+    """
+    result = run_soup(7)
+    assert result.tally["glider"] == 9
+    assert result.period is not None
+
+
+def test_compact():
+    """
+    Test seeds are compacted into runs and expanded again
+    """
+    seeds = [0, 1, 2, 3, 7, 9, 10]
+    runs = compact(seeds)
+    assert runs == [[0, 3], [7, 7], [9, 10]]
+    assert expand(runs) == set(seeds)
+
+
+class TestCensus(object):
+
+    def test_run_and_resume(self, tmp_path):
+        """
+        Test a census merges results and resumes from the results file
+        """
+        path = str(tmp_path / "census.json")
+        census = Census(path, max_generations=2000)
+        rate = census.run(range(6), processes=2, progress=False)
+        assert rate > 0
+        assert census.soups == 6
+
+        with open(path) as f:
+            data = json.load(f)
+        assert data["soups"] == 6
+        assert data["seeds"] == [[0, 5]]
+        assert data["objects"] == dict(census.objects)
+
+        expected = Counter()
+        for seed in range(6):
+            expected.update(run_soup(seed, max_generations=2000).tally)
+        assert census.objects == expected
+
+        resumed = Census(path, max_generations=2000)
+        assert resumed.soups == 6
+        assert resumed.run(range(6), processes=2, progress=False) == 0.0
+
+        resumed.run(range(8), processes=2, progress=False)
+        assert resumed.soups == 8
+        assert Census(path, max_generations=2000).seeds == set(range(8))
+
+    def test_mismatched_settings(self, tmp_path):
+        """
+        Test a results file cannot be resumed with different soup settings
+        """
+        path = str(tmp_path / "census.json")
+        Census(path, size=8).save()
+        with pytest.raises(FastlifeValueError):
+            Census(path, size=16)
@@ -0,0 +1,89 @@
+# tests.test_differential
+# Tests for the cross-engine differential testing harness.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Fri Oct 30 13:27:04 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_differential.py [] benjamin@bengfort.com $
+
+"""
+Tests for the cross-engine differential testing harness.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import pytest
+
+from functools import partial
+
+from fastlife.differential import *
+from fastlife.ltl import LargerThanLife, CONWAY
+from fastlife.rle import RunLengthLife
+from fastlife.topology import TopologyLife
+from fastlife.tiled import TiledLife
+from fastlife.memoized import MemoizedLife
+from fastlife.static import StaticLife
+from fastlife.sequential import SequentialLife
+from fastlife.vectorized import VectorizedLife
+from fastlife.exceptions import FastlifeValueError
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures")
+LIFE1 = os.path.join(FIXTURES, "life1.dat.gz")
+
+
+class FaultyLife(VectorizedLife):
+    """
+    A broken engine that flips a cell at every generation from generation 7
+    """
+
+    def step(self):
+        super(FaultyLife, self).step()
+        if self.now >= 7:
+            self.cframe._world[5, 9] ^= 1
+
+
+def test_engines_agree():
+    """
+    Test every Game of Life engine computes identical generations from the fixture
+    """
+    engines = {
+        "sequential": SequentialLife,
+        "vectorized": VectorizedLife,
+        "tiled": partial(TiledLife, tile=16, depth=3),
+        "memoized": partial(MemoizedLife, block=4),
+        "ltl": partial(LargerThanLife, rule=CONWAY),
+        "rle": RunLengthLife,
+        "topology": TopologyLife,
+        "static": partial(StaticLife, tile=16, period=2),
+    }
+    assert diverge(engines, 64, 64, 60, path=LIFE1) is None
+
+
+@pytest.mark.parametrize("stride", [1, 4, 10])
+def test_first_divergence(stride):
+    """
+    Test the exact generation and region of a divergence is reported
+    """
+    engines = {"vectorized": VectorizedLife, "faulty": FaultyLife}
+    divergence = diverge(engines, 30, 20, 12, seed=42, stride=stride)
+
+    assert divergence == Divergence(7, "vectorized", "faulty", (5, 6, 9, 10), 1)
+    assert "faulty diverged from vectorized at generation 7" in describe(divergence)
+
+
+def test_diverge_validation():
+    """
+    Test at least two engines and a positive stride are required
+    """
+    with pytest.raises(FastlifeValueError):
+        diverge({"vectorized": VectorizedLife}, 10, 10, 10)
+
+    with pytest.raises(FastlifeValueError):
+        diverge({"a": VectorizedLife, "b": VectorizedLife}, 10, 10, 10, stride=0)
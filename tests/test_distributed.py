@@ -0,0 +1,170 @@
+# tests.test_distributed
+# Tests for the distributed game of life simulation.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 11:02:45 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_distributed.py [] benjamin@bengfort.com $
+
+"""
+Tests for the distributed game of life simulation.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import pytest
+import numpy as np
+
+from fastlife.distributed import *
+from fastlife.exceptions import FastlifeValueError
+from fastlife.vectorized import VectorizedLife
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures")
+LIFE1 = os.path.join(FIXTURES, "life1.dat.gz")
+
+
+@pytest.mark.parametrize("n,expected", [
+    (1, (1, 1)), (4, (2, 2)), (6, (2, 3)), (7, (1, 7)),
+])
+def test_layout(n, expected):
+    """
+    Test domains are arranged as close to square as possible
+    """
+    assert layout(n) == expected
+
+
+def test_decompose():
+    """
+    Test domains cover the world without overlapping
+    """
+    domains = decompose((30, 40), 2, 3)
+    assert len(domains) == 6
+
+    covered = np.zeros((30, 40), dtype=int)
+    for r0, r1, c0, c1 in domains.values():
+        covered[r0:r1, c0:c1] += 1
+    assert (covered == 1).all()
+
+    with pytest.raises(FastlifeValueError):
+        decompose((3, 40), 4, 1)
+
+
+@pytest.mark.parametrize("region", [(0, 30, 0, 40), (7, 19, 11, 40), (29, 30, 0, 1)])
+def test_random_domain(region, monkeypatch):
+    """
+    Test domains are generated from the random stream of the whole world
+    """
+    monkeypatch.setattr("fastlife.distributed.RANDOM_CHUNK", 100)
+    np.random.seed(42)
+    world = np.random.randint(2, size=(30, 40))
+
+    r0, r1, c0, c1 = region
+    domain = random_domain(42, (30, 40), region)
+    assert domain.dtype == np.int8
+    np.testing.assert_array_equal(domain, world[r0:r1, c0:c1])
+
+
+def test_serve_requires_authkey():
+    """
+    Test workers cannot listen without authenticating coordinators
+    """
+    with pytest.raises(FastlifeValueError):
+        serve(("localhost", 0), authkey=None)
+
+    with pytest.raises(FastlifeValueError):
+        DistributedLife(20, 20, addresses=[("localhost", 7331)])
+
+
+class TestDistributedLife(object):
+
+    @pytest.mark.parametrize("workers,halo", [(1, 1), (4, 1), (4, 3), (6, 5)])
+    def test_matches_vectorized(self, workers, halo):
+        """
+        Test localhost workers compute the same world as a single process
+        """
+        expected = VectorizedLife(40, 30)
+        expected.randomize(42)
+        expected.run(17, progress=False)
+
+        with DistributedLife(40, 30, workers=workers, halo=halo) as sim:
+            sim.randomize(42)
+            sim.run(17, progress=False)
+
+            assert sim.now == 17
+            assert sim.stats["rounds"] == -(-17 // halo)
+            assert (sim.cframe._world == expected.cframe._world).all()
+
+    def test_step_and_report(self):
+        """
+        Test single steps and the communication report
+        """
+        with DistributedLife(20, 20, workers=2) as sim:
+            sim.randomize(7)
+            sim.step()
+            sim.step()
+
+            assert sim.now == 2
+            assert sim.stats["compute"] > 0
+            assert sim.stats["communication"] > 0
+            assert "2 rounds across 2 workers" in sim.report()
+
+    def test_halo_too_deep(self):
+        """
+        Test the halo cannot be deeper than a domain
+        """
+        sim = DistributedLife(8, 8, workers=4, halo=5)
+        try:
+            with pytest.raises(FastlifeValueError):
+                sim.randomize(1)
+        finally:
+            sim.close()
+
+        with pytest.raises(FastlifeValueError):
+            DistributedLife(8, 8, halo=0)
+
+    def test_world_stays_on_workers(self):
+        """
+        Test the coordinator only allocates the world when it is gathered
+        """
+        expected = VectorizedLife(64, 64)
+        expected.load(LIFE1)
+        expected.run(6, progress=False)
+
+        with DistributedLife(64, 64, workers=4, halo=3) as sim:
+            sim.load(LIFE1)
+            sim.run(6, progress=False)
+            assert sim._grid is None
+
+            np.testing.assert_array_equal(sim.cframe._world, expected.cframe._world)
+
+    def test_advance_beyond_halo(self):
+        """
+        Test rounds cannot advance more generations than the depth of the halo
+        """
+        with DistributedLife(20, 20, workers=2, halo=2) as sim:
+            sim.randomize(3)
+            with pytest.raises(FastlifeValueError):
+                sim.advance(3)
+
+    def test_readonly_cframe(self):
+        """
+        Test writing to the gathered frame fails rather than being lost
+        """
+        with DistributedLife(20, 20, workers=2) as sim:
+            sim.populate(np.zeros((20, 20), dtype=np.int8))
+            with pytest.raises(ValueError):
+                sim.cframe[5, 4:7] = 1
+
+            world = np.zeros((20, 20), dtype=np.int8)
+            world[5, 4:7] = 1
+            sim.populate(world)
+            sim.step()
+            assert sim.cframe._world[4:7, 5].all()
+            assert sim.cframe._world.sum() == 3
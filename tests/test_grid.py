@@ -17,13 +17,26 @@ Tests for the grid world helper functionality.
 ## Imports
 ##########################################################################
 
+import sys
+import pickle
 import pytest
 import numpy as np
+import multiprocessing as mp
 
 from fastlife.grid import *
 from fastlife.exceptions import *
 
 
+def mark_cell(grid):
+    """
+    Helper to modify a grid in another process and return its population
+    """
+    grid[1, 1] = 1
+    population = int(np.asarray(grid).sum())
+    grid.close()
+    return population
+
+
 class TestGrid(object):
 
     @pytest.mark.parametrize("adjacency", [VON_NEUMANN, MOORE])
@@ -76,6 +89,51 @@ class TestGrid(object):
         with pytest.raises(FastlifeValueError):
             grid[32, 78] = 1292
 
+    def test_bulk_indexing(self):
+        """
+        Test slices, boolean masks and coordinate arrays
+        """
+        grid = Grid(16, 12)
+
+        # Slices are views of the world
+        block = grid[2:5, 3:7]
+        assert block.shape == (3, 4)
+        grid[2:5, 3:7] = 1
+        assert block.sum() == 12
+        grid[:, :] = 0
+
+        # Coordinates are an (n, 2) array of i, j positions
+        coords = np.array([[0, 0], [3, 4], [11, 15]])
+        grid[coords] = 1
+        assert grid[coords].tolist() == [1, 1, 1]
+        assert grid[3, 4] == 1 and grid._world.sum() == 3
+
+        # Masks select every cell where the mask is True
+        mask = grid._world == 1
+        grid[mask] = np.array([0, 1, 0], dtype=np.int8)
+        assert grid._world.sum() == 1 and grid[3, 4] == 1
+        assert grid[mask].tolist() == [0, 1, 0]
+
+    def test_bad_bulk_indexing(self):
+        """
+        Test bad slice, mask and coordinate access
+        """
+        grid = Grid(16, 12)
+        with pytest.raises(FastlifeTypeError):
+            grid[np.zeros((4, 4), dtype=bool)]
+
+        with pytest.raises(FastlifeTypeError):
+            grid[np.zeros((4, 3), dtype=int)]
+
+        with pytest.raises(FastlifeValueError):
+            grid[2:5, 3:7] = 0.5
+
+        with pytest.raises(FastlifeValueError):
+            grid[np.array([[1, 1], [2, 2]])] = np.array([1, 300])
+
+        with pytest.raises(FastlifeValueError):
+            grid[2:5, 3:7] = "foo"
+
     @pytest.mark.parametrize("adjacency,expected", [
         (VON_NEUMANN, np.asarray([2, 6, 8, 4])),
         (MOORE, np.asarray([2, 3, 6, 9, 8, 7, 4, 1])),
@@ -136,3 +194,148 @@ class TestGrid(object):
 
         assert (list(grid.neighborhood(99, 50)) == expected).all()
         assert (grid.neighborhood_array(99, 50) == expected).all()
+
+    @pytest.mark.parametrize("adjacency", [VON_NEUMANN, MOORE])
+    def test_neighborhood_no_wrap(self, adjacency):
+        """
+        Test neighbors on the top and left edges do not wrap around the world
+        """
+        grid = Grid(adjacency=adjacency)
+        grid._world[:] = 1
+        grid._world[:2, :2] = 0
+
+        zeros = np.zeros(4 if adjacency == VON_NEUMANN else 8)
+        assert (list(grid.neighborhood(0, 0)) == zeros).all()
+        assert (grid.neighborhood_array(0, 0) == zeros).all()
+        assert grid.neighborhood_sum(0, 0) == 0
+
+    def test_fingerprint(self):
+        """
+        Test fingerprints depend only on the shape and live cells of the world
+        """
+        grid = Grid(20, 10)
+        grid[3, 4] = 1
+        digest = grid.fingerprint()
+
+        assert fingerprint(grid._world.astype(bool)) == digest
+        assert fingerprint(np.asfortranarray(grid._world)) == digest
+        assert fingerprint(grid._world.T) != digest
+
+        grid[3, 5] = 1
+        assert grid.fingerprint() != digest
+
+
+class TestSharedGrid(object):
+
+    def test_array_interface(self):
+        """
+        Test that numpy can view the grid without copying
+        """
+        grid = Grid(10, 10)
+        assert np.asarray(grid) is grid._world
+        assert np.asarray(grid, dtype=bool).dtype == bool
+        assert np.array(grid) is not grid._world
+        assert np.array(grid, copy=False) is grid._world
+        assert memoryview(np.asarray(grid)).nbytes == 100
+
+        # Views cannot change the dtype of the world
+        with pytest.raises(ValueError):
+            np.array(grid, dtype=bool, copy=False)
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="requires PEP 688")
+    def test_buffer_protocol(self):
+        """
+        Test that the grid exposes its world through the buffer protocol
+        """
+        grid = Grid(10, 10)
+        grid[3, 4] = 1
+        view = memoryview(grid)
+        assert view.nbytes == 100 and view.shape == (10, 10)
+        assert view[3, 4] == 1
+
+    def test_pickle_array(self):
+        """
+        Test that private grids still pickle their world
+        """
+        grid = Grid(64, 32, adjacency=VON_NEUMANN)
+        grid[3, 4] = 1
+        clone = pickle.loads(pickle.dumps(grid))
+        assert clone.shape == (32, 64)
+        assert clone.adjacency == VON_NEUMANN
+        assert clone[3, 4] == 1
+        assert clone._world is not grid._world
+
+    def test_shared_requires_shared_memory(self, monkeypatch):
+        """
+        Test that grids work without shared memory, which Python < 3.8 lacks
+        """
+        monkeypatch.setitem(sys.modules, "multiprocessing.shared_memory", None)
+        grid = Grid(10, 10)
+        grid[1, 1] = 1
+        assert pickle.loads(pickle.dumps(grid))[1, 1] == 1
+
+        with pytest.raises(FastlifeError):
+            Grid.shared(10, 10)
+
+        with pytest.raises(FastlifeError):
+            grid.share()
+
+    def test_pickle_shared(self):
+        """
+        Test that shared grids pickle only a handle to the shared memory
+        """
+        grid = Grid.shared(1000, 1000)
+        try:
+            grid[0, 0] = 1
+            data = pickle.dumps(grid)
+            assert len(data) < 1024
+
+            clone = pickle.loads(data)
+            clone[5, 5] = 1
+            assert grid[5, 5] == 1
+            clone.close()
+            assert grid[5, 5] == 1
+        finally:
+            grid.close()
+
+        # The owner keeps a private copy of the world when it is closed
+        assert grid[0, 0] == 1
+        assert grid._shm is None
+
+    def test_share_across_processes(self):
+        """
+        Test that other processes modify the shared world in place
+        """
+        grid = Grid(50, 50)
+        grid[0, 0] = 1
+        assert grid.share() is grid
+
+        try:
+            with mp.get_context().Pool(2) as pool:
+                assert pool.map(mark_cell, [grid, grid]) == [2, 2]
+            assert grid[1, 1] == 1
+        finally:
+            grid.close()
+
+    def test_memmap(self, tmp_path):
+        """
+        Test that memory mapped grids pickle the path to the world
+        """
+        path = str(tmp_path / "world.npy")
+        grid = Grid.memmap(path, 40, 30)
+        grid[3, 3] = 1
+
+        clone = pickle.loads(pickle.dumps(grid))
+        assert str(path) in str(pickle.dumps(grid))
+        assert clone.shape == (30, 40)
+        assert clone[3, 3] == 1
+
+        clone[4, 4] = 1
+        assert grid[4, 4] == 1
+
+        grid.close()
+        clone.close()
+        reopened = Grid.memmap(path)
+        assert reopened.shape == (30, 40)
+        assert reopened._world.sum() == 2
+        reopened.close()
@@ -0,0 +1,76 @@
+# tests.test_lightcone
+# Tests for region of interest evaluation with light cones.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Sun Nov 01 12:20:41 2026 -0500
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_lightcone.py [] benjamin@bengfort.com $
+
+"""
+Tests for region of interest evaluation with light cones.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import numpy as np
+
+from fastlife.lightcone import *
+from fastlife.grid import MOORE, VON_NEUMANN
+from fastlife.vectorized import VectorizedLife
+from fastlife.exceptions import FastlifeValueError
+
+
+def test_light_cone():
+    """
+    Test the light cone is the window expanded by the generations within the world
+    """
+    assert light_cone((100, 80), (40, 50, 30, 35), 5) == (35, 55, 25, 40)
+    assert light_cone((100, 80), (2, 50, 30, 78), 5) == (0, 55, 25, 80)
+    assert light_cone((100, 80), (2, 50, 30, 78), 0) == (2, 50, 30, 78)
+
+    with pytest.raises(FastlifeValueError):
+        light_cone((100, 80), (40, 40, 30, 35), 5)
+
+    with pytest.raises(FastlifeValueError):
+        light_cone((100, 80), (40, 50, 30, 81), 5)
+
+
+@pytest.mark.parametrize("adjacency", [MOORE, VON_NEUMANN])
+@pytest.mark.parametrize("window,generations", [
+    ((10, 20, 12, 18), 7),
+    ((0, 5, 30, 37), 12),
+    ((20, 29, 0, 37), 30),
+    ((14, 15, 18, 19), 0),
+])
+def test_evaluate(adjacency, window, generations):
+    """
+    Test the window matches the window of the entire world stepped forward
+    """
+    sim = VectorizedLife(37, 29)
+    sim.randomize(13)
+    for grid in sim.frames:
+        grid.adjacency = adjacency
+
+    r0, r1, c0, c1 = window
+    before = sim.cframe._world.copy()
+    actual = evaluate(sim, window, generations)
+    assert (sim.cframe._world == before).all()
+
+    sim.run(generations, progress=False)
+    assert (actual == sim.cframe._world[r0:r1, c0:c1]).all()
+
+
+def test_evaluate_huge_world():
+    """
+    Test the cost does not depend on the size of the world
+    """
+    world = np.broadcast_to(np.int8(0), (10**6, 10**6))
+    window = evaluate(world, (5000, 5004, 5000, 5008), 20)
+    assert window.shape == (4, 8)
+    assert window.sum() == 0
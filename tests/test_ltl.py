@@ -0,0 +1,123 @@
+# tests.test_ltl
+# Tests for the larger than life simulation.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Sun Oct 25 15:40:02 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_ltl.py [] benjamin@bengfort.com $
+
+"""
+Tests for the larger than life simulation.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import numpy as np
+
+from fastlife.ltl import *
+from fastlife.grid import MOORE, VON_NEUMANN
+from fastlife.vectorized import VectorizedLife
+from fastlife.exceptions import FastlifeValueError
+
+
+def naive_counts(world, radius, adjacency):
+    """
+    Helper to count neighborhoods (including the cell) by looping over every cell
+    """
+    height, width = world.shape
+    counts = np.zeros(world.shape, dtype=int)
+    for i in range(height):
+        for j in range(width):
+            for a in range(max(0, i-radius), min(height, i+radius+1)):
+                for b in range(max(0, j-radius), min(width, j+radius+1)):
+                    if adjacency == MOORE or abs(a-i) + abs(b-j) <= radius:
+                        counts[i, j] += world[a, b]
+    return counts
+
+
+def test_parse_rule():
+    """
+    Test parsing rules in Evans' notation
+    """
+    rule = parse_rule(BOSCO)
+    assert rule == Rule(5, True, (34, 58), (34, 45), MOORE)
+    assert parse_rule(rule) is rule
+    assert parse_rule("r2, c0, m0, s1..4, b2..3, nn").adjacency == VON_NEUMANN
+
+    bad_rules = [
+        "R5,C0,M1,S34..58,NM", "R0,C0,M1,S1..2,B1..2,NM", "R2,C3,M1,S1..2,B1..2,NM",
+    ]
+    for bad in bad_rules:
+        with pytest.raises(FastlifeValueError):
+            parse_rule(bad)
+
+
+@pytest.mark.parametrize("adjacency", [MOORE, VON_NEUMANN])
+@pytest.mark.parametrize("radius", [1, 2, 4])
+def test_neighborhood_counter(adjacency, radius):
+    """
+    Test summed-area counts match counting every neighborhood directly
+    """
+    world = np.random.RandomState(radius).randint(2, size=(13, 17)).astype(np.int8)
+    counter = NeighborhoodCounter(world.shape, radius, adjacency)
+    expected = naive_counts(world, radius, adjacency)
+
+    assert (counter(world) == expected).all()
+    assert (counter(world) == expected).all(), "counter buffers were not reset"
+
+
+@pytest.mark.parametrize("shape", [(3, 41), (41, 3), (1, 9)])
+def test_diamond_counter_shapes(shape):
+    """
+    Test diamonds are counted in narrow worlds with buffers the size of the world
+    """
+    world = np.random.RandomState(7).randint(2, size=shape).astype(np.int8)
+    counter = NeighborhoodCounter(shape, 3, VON_NEUMANN)
+    assert (counter(world) == naive_counts(world, 3, VON_NEUMANN)).all()
+
+    # Memory grows with the number of cells rather than the perimeter squared
+    counter = NeighborhoodCounter((shape[0] * 100, shape[1] * 100), 3, VON_NEUMANN)
+    assert counter.nbytes < 32 * world.size * 100 * 100
+
+
+class TestLargerThanLife(object):
+
+    @pytest.mark.parametrize("rule,adjacency", [
+        (CONWAY, MOORE), ("R1,C0,M0,S2..3,B3..3,NN", VON_NEUMANN),
+    ])
+    def test_radius_one(self, rule, adjacency):
+        """
+        Test that radius one rules match the vectorized game of life
+        """
+        expected = VectorizedLife(30, 30)
+        sim = LargerThanLife(30, 30, rule=rule)
+        for world in (expected, sim):
+            for grid in world.frames:
+                grid.adjacency = adjacency
+            world.randomize(42)
+
+        for _ in range(5):
+            expected.step()
+            sim.step()
+            assert (sim.cframe._world == expected.cframe._world).all()
+
+    def test_bosco(self):
+        """
+        Test a generation of Bosco's rule against direct neighborhood counts
+        """
+        sim = LargerThanLife(40, 40, rule=BOSCO)
+        sim.randomize(7)
+        world = sim.cframe._world.copy()
+        sim.step()
+
+        counts = naive_counts(world, 5, MOORE)
+        survive = (world == 1) & (counts >= 34) & (counts <= 58)
+        born = (world == 0) & (counts >= 34) & (counts <= 45)
+        assert (sim.cframe._world == (survive | born)).all()
+        assert sim.cframe.adjacency == MOORE
@@ -0,0 +1,149 @@
+# tests.test_memoized
+# Tests for the memoized block-transition game of life simulation.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Oct 28 12:10:52 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_memoized.py [] benjamin@bengfort.com $
+
+"""
+Tests for the memoized block-transition game of life simulation.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import time
+import pytest
+import numpy as np
+
+from fastlife.memoized import *
+from fastlife.census import soup
+from fastlife.vectorized import VectorizedLife
+from fastlife.exceptions import FastlifeValueError
+
+
+def test_transition_cache():
+    """
+    Test the least recently used transitions are evicted
+    """
+    keys = np.arange(3, dtype=np.uint8).reshape(3, 1)
+    values = np.arange(12, dtype=np.int8).reshape(3, 2, 2)
+
+    cache = TransitionCache(capacity=2)
+    cache.put(keys[:2], values[:2])
+    found, slots = cache.get(keys[[0, 2]])
+    assert found.tolist() == [True, False]
+    assert (cache.values[slots[0]] == values[0]).all()
+    cache.put(keys[2:], values[2:])
+
+    assert len(cache) == 2
+    found, slots = cache.get(keys)
+    assert found.tolist() == [True, False, True]
+    assert (cache.values[slots[2]] == values[2]).all()
+    assert cache.evictions == 1
+    assert cache.hit_rate == 0.6
+    assert cache.nbytes > 0
+
+    with pytest.raises(FastlifeValueError):
+        TransitionCache(capacity=0)
+
+
+def test_digest_collisions():
+    """
+    Test keys that share a hash are not confused with each other
+    """
+    keys = np.arange(8, dtype=np.uint8).reshape(4, 2)
+    assert len(set(digest(keys).tolist())) == 4
+
+    cache = TransitionCache()
+    cache.put(keys[:1], np.ones((1, 2, 2), dtype=np.int8))
+    cache.index[:] = digest(keys[1:2])
+    found, _ = cache.get(keys[:2])
+    assert not found.any()
+
+
+class TestMemoizedLife(object):
+
+    @pytest.mark.parametrize("block,capacity", [(8, 65536), (3, 65536), (4, 16)])
+    def test_matches_vectorized(self, block, capacity):
+        """
+        Test blocks that do not divide the world and evictions give the same world
+        """
+        expected = VectorizedLife(37, 29)
+        expected.randomize(11)
+
+        sim = MemoizedLife(37, 29, block=block, capacity=capacity)
+        sim.randomize(11)
+
+        for _ in range(60):
+            expected.step()
+            sim.step()
+            assert (sim.cframe._world == expected.cframe._world).all()
+
+        assert len(sim.cache) <= capacity
+        assert sim.cache.hits > 0
+
+    def test_repetitive_world(self):
+        """
+        Test a world of repeated still lifes and blinkers is served from the cache
+        """
+        world = np.zeros((64, 128), dtype=np.int8)
+        for i in range(2, 64, 16):
+            for j in range(2, 64, 16):
+                world[i:i+2, j:j+2] = 1
+                world[i+8, j+7:j+10] = 1
+
+        # A glider keeps flying through empty blocks that are all alike
+        world[1:4, 70:73] = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+
+        sim = MemoizedLife(128, 64, block=8)
+        sim.populate(world)
+        sim.run(2, progress=False)
+        assert (sim.cframe._world[:, :64] == world[:, :64]).all()
+
+        sim.run(198, progress=False)
+        assert sim.cache.hit_rate > 0.8
+        assert len(sim.cache) < 100
+        assert sim.skipped > 0.9 * 128 * 200
+        assert "hit rate" in sim.report()
+
+        with pytest.raises(FastlifeValueError):
+            MemoizedLife(8, 8, block=0)
+
+    def test_readonly_cframe(self):
+        """
+        Test writing to the current frame fails rather than being skipped
+        """
+        sim = MemoizedLife(16, 16, block=4)
+        with pytest.raises(ValueError):
+            sim.cframe[0, 0] = 1
+
+    def test_faster_than_vectorized(self):
+        """
+        Test settled ash is faster to step than the whole world with default settings
+        """
+        world = np.zeros((256, 256), dtype=np.int8)
+        for seed in range(4):
+            i, j = divmod(seed, 2)
+            world[56+128*i:72+128*i, 56+128*j:72+128*j] = soup(seed)
+
+        sim, expected = MemoizedLife(256, 256), VectorizedLife(256, 256)
+        for engine in (sim, expected):
+            engine.populate(world)
+            engine.run(1500, progress=False)
+
+        def pace(engine):
+            start = time.perf_counter()
+            engine.run(100, progress=False)
+            return time.perf_counter() - start
+
+        # Settled blocks are skipped, so only the blocks that still change are looked up
+        memoized = min(pace(sim) for _ in range(3))
+        vectorized = min(pace(expected) for _ in range(3))
+        assert memoized < vectorized / 2
+        assert (sim.cframe._world == expected.cframe._world).all()
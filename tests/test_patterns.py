@@ -0,0 +1,170 @@
+# tests.test_patterns
+# Tests for pattern search and object classification.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Oct 21 13:48:20 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_patterns.py [] benjamin@bengfort.com $
+
+"""
+Tests for pattern search and object classification.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import numpy as np
+
+from fastlife.grid import Grid
+from fastlife.patterns import *
+from fastlife.exceptions import FastlifeValueError
+
+
+def place(grid, name, i, j, phase=0, k=0, flip=False):
+    """
+    Helper to place a library pattern on the grid in some orientation and phase
+    """
+    rows, period = LIBRARY[name]
+    pattern = phases(parse(rows), period)[phase]
+    pattern = np.rot90(np.fliplr(pattern) if flip else pattern, k)
+    grid._world[i:i+pattern.shape[0], j:j+pattern.shape[1]] = pattern
+    return pattern
+
+
+def test_phases():
+    """
+    Test oscillator and spaceship phases are generated from the first phase
+    """
+    blinker = phases(parse(LIBRARY["blinker"][0]), 2)
+    assert [p.shape for p in blinker] == [(1, 3), (3, 1)]
+
+    glider = phases(parse(LIBRARY["glider"][0]), 4)
+    assert len(glider) == 4
+    assert all(p.sum() == 5 for p in glider)
+
+
+def test_canonical():
+    """
+    Test the canonical key is the same for every orientation
+    """
+    boat = parse(LIBRARY["boat"][0])
+    keys = {canonical(o) for o in orientations(boat)}
+    assert len(orientations(boat)) == 4
+    assert len(keys) == 1
+    assert canonical(np.pad(boat, 2)) in keys
+
+
+class TestSearch(object):
+
+    def test_search_orientations(self):
+        """
+        Test that every rotation and reflection of a pattern is found
+        """
+        grid = Grid(60, 60)
+        expected = []
+        for n, (k, flip) in enumerate([(0, False), (1, False), (2, True), (3, True)]):
+            place(grid, "glider", 5 + n*12, 5, phase=n, k=k, flip=flip)
+            expected.append((5 + n*12, 5))
+
+        found = search(grid, "glider")
+        assert [tuple(p) for p in found] == expected
+
+    def test_search_isolated(self):
+        """
+        Test that patterns touching other live cells are not found
+        """
+        grid = Grid(20, 20)
+        place(grid, "block", 0, 0)
+        place(grid, "block", 10, 10)
+        grid[12, 12] = 1
+
+        assert [tuple(p) for p in search(grid, "block")] == [(0, 0)]
+        assert [tuple(p) for p in search(grid, ["oo", "oo"])] == [(0, 0)]
+
+    def test_search_chunks(self, monkeypatch):
+        """
+        Test that windows compared in chunks find the same occurrences
+        """
+        grid = Grid(100, 100)
+        for n in range(5):
+            place(grid, "beehive", 4 + n*18, 10 + n*3)
+            place(grid, "pulsar", 4 + n*18, 40, phase=n % 3)
+        grid[10:13, 70:73] = 1
+
+        expected = search(grid, "beehive"), search(grid, "pulsar")
+        monkeypatch.setattr("fastlife.patterns.SEARCH_CELLS", 40)
+        assert len(expected[0]) == 5 and len(expected[1]) == 5
+        np.testing.assert_array_equal(search(grid, "beehive"), expected[0])
+        np.testing.assert_array_equal(search(grid, "pulsar"), expected[1])
+
+    def test_search_unknown(self):
+        """
+        Test that unknown pattern names raise an exception
+        """
+        with pytest.raises(FastlifeValueError):
+            search(Grid(), "foo")
+
+
+class TestClassify(object):
+
+    def test_label(self):
+        """
+        Test connected component labeling with different distances
+        """
+        grid = Grid(20, 20)
+        place(grid, "beehive", 2, 2)
+        place(grid, "block", 2, 7)
+        place(grid, "glider", 12, 12)
+
+        labels, count = label(grid)
+        assert count == 3
+        assert labels.max() == 3
+        assert (labels > 0).sum() == grid._world.sum()
+
+        # The block is one dead cell away from the beehive
+        _, count = label(grid, distance=2)
+        assert count == 2
+
+    def test_label_winding(self):
+        """
+        Test labeling a component whose labels must propagate a long way
+        """
+        world = np.zeros((41, 41), dtype=np.int8)
+        world[::4, :] = 1
+        world[:, 0] = 1
+        world[:, -1] = 1
+
+        labels, count = label(world)
+        assert count == 1
+        assert (labels[world == 1] == 1).all()
+
+    def test_classify(self):
+        """
+        Test classifying objects by name in any orientation and phase
+        """
+        grid = Grid(40, 40)
+        place(grid, "block", 1, 1)
+        place(grid, "blinker", 1, 10, phase=1)
+        place(grid, "boat", 10, 1, k=3)
+        place(grid, "glider", 10, 10, phase=2, flip=True)
+        place(grid, "toad", 20, 20, phase=1, k=1)
+        grid[30, 30] = 1
+
+        tally = classify(grid)
+        assert tally == {
+            "block": 1, "blinker": 1, "boat": 1, "glider": 1, "toad": 1, "unknown": 1,
+        }
+
+        names = {obj.name: (obj.top, obj.left) for obj in objects(grid)}
+        assert names["block"] == (1, 1)
+
+    def test_classify_empty(self):
+        """
+        Test classifying an empty world
+        """
+        assert classify(Grid()) == {}
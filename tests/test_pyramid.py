@@ -0,0 +1,156 @@
+# tests.test_pyramid
+# Tests for the density pyramid used to plot giant worlds.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Nov 03 13:47:05 2026 -0500
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_pyramid.py [] benjamin@bengfort.com $
+
+"""
+Tests for the density pyramid used to plot giant worlds.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import numpy as np
+import matplotlib.pyplot as plt
+
+from fastlife.grid import Grid
+from fastlife.tiled import TiledLife
+from fastlife.sequential import SequentialLife
+from fastlife.vectorized import VectorizedLife
+from fastlife.pyramid import *
+from fastlife.exceptions import FastlifeValueError
+
+
+def random_world(shape, seed=42):
+    rng = np.random.default_rng(seed)
+    return (rng.random(shape) < 0.3).astype(np.int8)
+
+
+def test_block_sums():
+    """
+    Test block sums include the partial blocks at the edges
+    """
+    world = np.arange(35, dtype=np.int64).reshape(5, 7)
+    sums = block_sums(world, 2, np.int64)
+    assert sums.shape == (3, 4)
+    assert sums[0, 0] == 0 + 1 + 7 + 8
+    assert sums[2, 3] == 34
+    assert sums.sum() == world.sum()
+
+    # Only the requested blocks are summed
+    partial = block_sums(world, 2, np.int64, 1, 3, 2, 4)
+    np.testing.assert_array_equal(partial, sums[1:, 2:])
+
+
+@pytest.mark.parametrize("shape", [(64, 64), (101, 37), (1, 300)])
+def test_levels(shape):
+    """
+    Test every level counts the live cells of its blocks
+    """
+    world = random_world(shape)
+    pyramid = DensityPyramid(world)
+    assert pyramid.levels[-1].shape == (1, 1)
+    assert pyramid.levels[-1][0, 0] == world.sum()
+
+    for level, counts in enumerate(pyramid.levels):
+        b = pyramid.blocksize(level)
+        assert counts.sum() == world.sum()
+        assert counts[0, 0] == world[:b, :b].sum()
+        assert np.iinfo(counts.dtype).max >= b * b
+
+
+def test_incremental_update():
+    """
+    Test only marked regions are recounted and match a rebuilt pyramid
+    """
+    world = random_world((300, 500))
+    pyramid = DensityPyramid(world, tile=32)
+
+    world[40:90, 200:260] = 1
+    world[299, 0] = 1 - world[299, 0]
+    pyramid.mark((40, 90, 200, 260))
+    pyramid.mark((299, 300, 0, 1))
+    assert pyramid.dirty.sum() == 2 * 3 + 1
+
+    pyramid.refresh()
+    assert not pyramid.dirty.any()
+    for counts, expected in zip(pyramid.levels, DensityPyramid(world).levels):
+        np.testing.assert_array_equal(counts, expected)
+
+    # Changes that are not marked are not counted
+    world[:] = 0
+    assert pyramid.levels[-1][0, 0] > 0
+
+
+def test_render():
+    """
+    Test windows are rendered from the coarsest level with enough blocks
+    """
+    world = random_world((1000, 600))
+    pyramid = DensityPyramid(world)
+
+    image, extent = pyramid.render(pixels=100)
+    assert pyramid.select((0, 1000, 0, 600), 100) == 2
+    assert image.shape == (125, 75)
+    assert extent == (0, 600, 1000, 0)
+    assert 0.25 < image.mean() < 0.35
+
+    # Zooming into a small window shows the cells themselves
+    image, extent = pyramid.render((10, 60, 20, 40), pixels=100)
+    np.testing.assert_array_equal(image, world[10:60, 20:40])
+    assert extent == (20, 40, 60, 10)
+
+    with pytest.raises(FastlifeValueError):
+        pyramid.render((10, 1060, 20, 40))
+
+
+def test_grid_plot():
+    """
+    Test plotting a grid keeps its pyramid up to date with cells set on the grid
+    """
+    grid = Grid(600, 400)
+    ax = grid.plot(pixels=1000)
+    assert grid._pyramid is None
+
+    ax = grid.plot(pixels=100)
+    assert grid._pyramid is not None
+    assert ax.images[-1].get_array().max() == 0
+
+    grid[0:8, 0:8] = 1
+    grid[np.array([[399, 599]])] = 1
+    image, _ = grid.pyramid.render(pixels=100)
+    assert image[0, 0] == 1 and image[-1, -1] == 1 / 16
+
+    grid._world[:] = 0
+    grid.invalidate()
+    image, _ = grid.pyramid.render(pixels=100)
+    assert image.max() == 0
+    plt.close("all")
+
+
+@pytest.mark.parametrize("engine", [SequentialLife, VectorizedLife, TiledLife])
+def test_plot_after_run(engine):
+    """
+    Test plotting the current frame after running shows the current generation
+    """
+    sim = engine(120, 90)
+    sim.randomize(42)
+    for grid in sim.frames:
+        grid.plot(pixels=30)
+    sim.run(3, progress=False)
+
+    image, _ = sim.cframe.pyramid.render(pixels=30)
+    expected, _ = DensityPyramid(sim.cframe._world).render(pixels=30)
+    np.testing.assert_array_equal(image, expected)
+
+    ax = sim.cframe.plot(pixels=30)
+    np.testing.assert_array_equal(ax.images[-1].get_array(), expected)
+    plt.close("all")
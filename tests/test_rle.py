@@ -0,0 +1,130 @@
+# tests.test_rle
+# Tests for the run-length encoded world and simulation.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Sat Oct 31 14:48:20 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_rle.py [] benjamin@bengfort.com $
+
+"""
+Tests for the run-length encoded world and simulation.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import numpy as np
+
+from fastlife.rle import *
+from fastlife.vectorized import VectorizedLife
+from fastlife.exceptions import FastlifeValueError
+
+
+GLIDER = "x = 3, y = 3, rule = B3/S23\nbo$2bo$3o!\n"
+
+
+class TestRowGrid(object):
+
+    def test_encode_decode(self):
+        """
+        Test dense worlds round trip through runs and the RLE format
+        """
+        world = np.random.RandomState(8).randint(2, size=(30, 45))
+        grid = RowGrid.from_array(world)
+
+        assert (grid.to_array() == world).all()
+        assert grid.population == world.sum()
+        assert RowGrid.from_rle(grid.to_rle()) == grid
+        assert grid[3, 4] == world[3, 4]
+
+        cells = np.argwhere(world)
+        assert RowGrid.from_cells(cells, 45, 30) == grid
+
+        with pytest.raises(FastlifeValueError):
+            RowGrid.from_cells([(30, 0)], 45, 30)
+
+    def test_rle_format(self, tmp_path):
+        """
+        Test reading and writing the RLE file format
+        """
+        grid = RowGrid.from_rle(GLIDER)
+        assert grid.rows[2].tolist() == [[0, 3]]
+        assert grid.to_rle() == GLIDER
+
+        # Empty rows, adjacent runs and a larger world than the header
+        grid = RowGrid.from_rle("#C comment\nx = 4, y = 4\n2o2o2$o!", 10, 8)
+        assert grid.shape == (8, 10)
+        assert grid.rows == {0: grid.rows[0], 2: grid.rows[2]}
+        assert grid.rows[0].tolist() == [[0, 4]]
+        assert grid.runs == 2
+
+        path = str(tmp_path / "pattern.rle.gz")
+        grid.save(path)
+        assert RowGrid.load(path) == RowGrid.from_rle(grid.to_rle())
+
+        with pytest.raises(FastlifeValueError):
+            RowGrid.from_rle("bo$2bo$3o!")
+
+    def test_huge_sparse_world(self):
+        """
+        Test a glider far from the origin of a huge world moves diagonally
+        """
+        glider = RowGrid.from_rle(GLIDER)
+        rows = {500000 + i: runs + 700000 for i, runs in glider.rows.items()}
+        grid = RowGrid(10**6, 10**6, rows)
+        for _ in range(4):
+            grid = grid.step()
+
+        expected = {500001 + i: runs + 700001 for i, runs in glider.rows.items()}
+        assert grid == RowGrid(10**6, 10**6, expected)
+        assert grid.nbytes == 3 * 16
+
+
+class TestRunLengthLife(object):
+
+    def test_matches_vectorized(self):
+        """
+        Test the run-length encoded simulation computes the same generations
+        """
+        expected = VectorizedLife(37, 29)
+        expected.randomize(5)
+
+        sim = RunLengthLife(37, 29)
+        sim.randomize(5)
+        for _ in range(40):
+            expected.step()
+            sim.step()
+            assert (sim.cframe._world == expected.cframe._world).all()
+
+    def test_load_rle(self, tmp_path):
+        """
+        Test loading an RLE file into the simulation
+        """
+        path = tmp_path / "glider.rle"
+        path.write_text(GLIDER)
+
+        sim = RunLengthLife(10, 10)
+        sim.load(str(path))
+        sim.run(4, progress=False)
+        assert sim.grid.population == 5
+        assert sim.cframe._world[1:4, 1:4].sum() == 5
+
+    def test_readonly_cframe(self):
+        """
+        Test writing to the decoded frame fails rather than being lost
+        """
+        sim = RunLengthLife(10, 10)
+        sim.populate(np.eye(10, dtype=np.int8))
+        with pytest.raises(ValueError):
+            sim.cframe[0, 1] = 1
+
+        world = np.zeros((10, 10), dtype=np.int8)
+        world[4, 3:6] = 1
+        sim.populate(world)
+        sim.step()
+        assert sim.cframe._world[3:6, 4].all()
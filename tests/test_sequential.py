@@ -0,0 +1,112 @@
+# tests.test_sequential
+# Tests for the sequential game of life simulation.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Sat Oct 24 10:05:37 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_sequential.py [] benjamin@bengfort.com $
+
+"""
+Tests for the sequential game of life simulation.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import numpy as np
+
+from fastlife.sequential import *
+from fastlife.vectorized import VectorizedLife
+from fastlife.distributed import DistributedLife
+from fastlife.exceptions import FastlifeError, FastlifeValueError
+
+
+ENGINES = [SequentialLife, VectorizedLife]
+
+
+class TestGenerations(object):
+
+    def test_not_initialized(self):
+        """
+        Test generations cannot be iterated before the world is initialized
+        """
+        with pytest.raises(FastlifeError):
+            next(SequentialLife(8, 8).generations())
+
+        sim = SequentialLife(8, 8)
+        sim.randomize(1)
+        with pytest.raises(FastlifeValueError):
+            next(sim.generations(stride=0))
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_read_only_views(self, engine):
+        """
+        Test that generations are lazy read-only views of the current frame
+        """
+        sim = engine(16, 16)
+        sim.randomize(42)
+
+        stream = sim.generations()
+        gen = next(stream)
+        assert gen.now == 0 and sim.now == 0
+        assert np.shares_memory(gen.world, sim.cframe._world)
+        assert not gen.world.flags.writeable
+        with pytest.raises(ValueError):
+            gen.world[0, 0] = 1
+
+        gen = next(stream)
+        assert gen.now == 1 and sim.now == 1
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_stride_until(self, engine):
+        """
+        Test the generations that are yielded with a stride and stop generation
+        """
+        # Keep activity away from the edges of the world for the stepped generations
+        soup = np.random.RandomState(42).randint(2, size=(16, 16))
+        expected, sim = VectorizedLife(40, 40), engine(40, 40)
+        for world in (expected, sim):
+            world.cframe._world[12:28, 12:28] = soup
+            world.initialized = True
+
+        for gen in sim.generations(stride=3, until=10):
+            assert (gen.world == expected.cframe._world).all()
+            expected.run(3, progress=False)
+
+        assert gen.now == 9
+        assert sim.now == 9
+
+    def test_delta(self):
+        """
+        Test sparse births and deaths between generations
+        """
+        sim = VectorizedLife(5, 5)
+        sim.cframe._world[2, 1:4] = 1
+        sim.initialized = True
+
+        deltas = list(sim.generations(until=2, delta=True))
+        assert [d.now for d in deltas] == [0, 1, 2]
+        assert list(zip(*deltas[0].births)) == [(2, 1), (2, 2), (2, 3)]
+        assert list(zip(*deltas[1].births)) == [(1, 2), (3, 2)]
+        assert list(zip(*deltas[1].deaths)) == [(2, 1), (2, 3)]
+        assert list(zip(*deltas[2].births)) == [(2, 1), (2, 3)]
+
+    def test_distributed(self):
+        """
+        Test generations work the same way for the distributed engine
+        """
+        expected = VectorizedLife(20, 20)
+        expected.randomize(7)
+        expected = [gen.world.copy() for gen in expected.generations(2, until=8)]
+
+        with DistributedLife(20, 20, workers=2, halo=2) as sim:
+            sim.randomize(7)
+            actual = [gen.world.copy() for gen in sim.generations(2, until=8)]
+
+        assert len(actual) == len(expected) == 5
+        assert all((a == e).all() for a, e in zip(actual, expected))
@@ -0,0 +1,189 @@
+# tests.test_static
+# Tests for skipping the tiles of the world that have settled into ash.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Nov 04 14:26:40 2026 -0500
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_static.py [] benjamin@bengfort.com $
+
+"""
+Tests for skipping the tiles of the world that have settled into ash.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import time
+import pytest
+import numpy as np
+
+from functools import partial
+
+from fastlife.static import *
+from fastlife.census import soup
+from fastlife.patterns import LIBRARY, parse
+from fastlife.vectorized import VectorizedLife
+from fastlife.differential import diverge
+from fastlife.exceptions import FastlifeValueError
+
+
+def place(world, name, i, j):
+    pattern = parse(LIBRARY[name][0])
+    height, width = pattern.shape
+    world[i:i+height, j:j+width] |= pattern
+    return world
+
+
+def test_dilate():
+    """
+    Test tiles wake the tiles around them, including across corners
+    """
+    mask = np.zeros((4, 5), dtype=bool)
+    mask[0, 0] = mask[3, 3] = True
+    assert dilate(mask).astype(int).tolist() == [
+        [1, 1, 0, 0, 0],
+        [1, 1, 0, 0, 0],
+        [0, 0, 1, 1, 1],
+        [0, 0, 1, 1, 1],
+    ]
+
+
+def test_ash_settles():
+    """
+    Test still lifes and oscillators settle no matter how close they are
+    """
+    world = np.zeros((64, 64), dtype=np.int8)
+    place(world, "block", 10, 10)
+    place(world, "blinker", 10, 14)
+    place(world, "beehive", 20, 45)
+    place(world, "pulsar", 40, 20)
+
+    sim = StaticLife(64, 64, tile=16)
+    sim.populate(world)
+    expected = VectorizedLife(64, 64)
+    expected.populate(world)
+
+    for _ in range(20):
+        expected.step()
+        sim.step()
+        np.testing.assert_array_equal(sim.cframe._world, expected.cframe._world)
+
+    # Every tile is stepped for a period after populate and then settles
+    assert not sim.awake.any()
+    assert sim.stepped == 16 * sim.period
+    assert sim.report().startswith("16 of 16 16x16 tiles settled")
+
+
+def test_activity_wakes_tiles():
+    """
+    Test settled tiles are stepped again when activity comes near
+    """
+    world = np.zeros((64, 64), dtype=np.int8)
+    place(world, "block", 40, 40)
+    place(world, "glider", 2, 2)
+
+    sim = StaticLife(64, 64, tile=8)
+    sim.populate(world)
+    expected = VectorizedLife(64, 64)
+    expected.populate(world)
+
+    awake = []
+    for _ in range(200):
+        sim.step()
+        expected.step()
+        awake.append(np.count_nonzero(sim.awake))
+        np.testing.assert_array_equal(sim.cframe._world, expected.cframe._world)
+
+    # Only the tiles around the glider (at most 4x4 of 8x8) are stepped for a while
+    assert max(awake[10:100]) <= 16
+    assert not sim.awake.any()
+
+
+@pytest.mark.parametrize("tile, period", [(8, 1), (7, 2), (16, 6), (32, 6)])
+def test_matches_vectorized(tile, period):
+    """
+    Test random worlds evolve exactly as they do when every tile is stepped
+    """
+    engines = {
+        "vectorized": VectorizedLife,
+        "static": partial(StaticLife, tile=tile, period=period),
+    }
+    assert diverge(engines, 80, 70, 150, seed=tile) is None
+
+
+def test_tiles_outside_world():
+    """
+    Test cells of tiles that extend beyond the world stay dead
+    """
+    world = np.zeros((20, 30), dtype=np.int8)
+    world[0, 10:13] = 1
+    world[18:20, 28] = world[19, 27] = 1
+
+    sim = StaticLife(30, 20, tile=16)
+    sim.populate(world)
+    sim.run(4, progress=False)
+    assert sim.cframe._world.sum() == 4
+    assert not sim.history[:, 21:, :].any() and not sim.history[:, :, 31:].any()
+
+
+def test_settled_ash_is_cheap():
+    """
+    Test settled ash is faster to step than the whole world with default settings
+    """
+    world = np.zeros((256, 256), dtype=np.int8)
+    for seed in range(4):
+        i, j = divmod(seed, 2)
+        world[56+128*i:72+128*i, 56+128*j:72+128*j] = soup(seed)
+
+    sim, expected = StaticLife(256, 256), VectorizedLife(256, 256)
+    for engine in (sim, expected):
+        engine.populate(world)
+        engine.run(1500, progress=False)
+
+    np.testing.assert_array_equal(sim.cframe._world, expected.cframe._world)
+    assert not sim.awake.any()
+
+    def pace(engine):
+        start = time.perf_counter()
+        engine.run(100, progress=False)
+        return time.perf_counter() - start
+
+    # Settled tiles are not stepped at all, so it should be many times faster
+    assert min(pace(sim) for _ in range(3)) < min(pace(expected) for _ in range(3)) / 2
+    np.testing.assert_array_equal(sim.cframe._world, expected.cframe._world)
+
+
+def test_readonly_cframe():
+    """
+    Test writing to the current frame fails rather than being lost on the next step
+    """
+    sim = StaticLife(32, 32)
+    sim.populate(place(np.zeros((32, 32), dtype=np.int8), "blinker", 10, 10))
+    with pytest.raises(ValueError):
+        sim.cframe[np.array([[20, 20], [20, 21], [20, 22]])] = 1
+
+    sim.run(16, progress=False)
+    assert not sim.awake.any()
+    with pytest.raises(ValueError):
+        sim.cframe[0, 0] = 1
+
+    # The read-only frames are still plotted from an up to date pyramid
+    sim.cframe.pyramid
+    sim.step()
+    image, _ = sim.cframe.pyramid.render(pixels=8)
+    assert image.sum() * 16 == 3
+
+
+def test_bad_parameters():
+    """
+    Test invalid tile sizes and periods raise exceptions
+    """
+    with pytest.raises(FastlifeValueError):
+        StaticLife(32, 32, tile=0)
+
+    with pytest.raises(FastlifeValueError):
+        StaticLife(32, 32, period=0)
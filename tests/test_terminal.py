@@ -0,0 +1,132 @@
+# tests.test_terminal
+# Tests for the diff-only terminal renderer.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Fri Oct 23 12:31:55 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_terminal.py [] benjamin@bengfort.com $
+
+"""
+Tests for the diff-only terminal renderer.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import io
+import pytest
+import numpy as np
+
+from fastlife.terminal import *
+from fastlife.vectorized import VectorizedLife
+from fastlife.exceptions import FastlifeValueError
+
+
+def test_encode_braille():
+    """
+    Test cells are packed into braille characters
+    """
+    world = np.zeros((4, 4), dtype=np.int8)
+    world[0, 0] = 1
+    world[3, 3] = 1
+
+    codes = encode(world, BRAILLE)
+    assert codes.shape == (1, 2)
+    assert "".join(map(chr, codes[0])) == "⠁⢀"
+
+    world[:, :2] = 1
+    assert chr(encode(world, BRAILLE)[0, 0]) == "⣿"
+
+
+def test_encode_half():
+    """
+    Test cells are packed into half block characters
+    """
+    world = np.asarray([[1, 0, 1], [0, 1, 1]], dtype=np.int8)
+    assert "".join(map(chr, encode(world, HALF)[0])) == "▀▄█"
+
+    with pytest.raises(FastlifeValueError):
+        encode(world, "foo")
+
+
+def test_downsample():
+    """
+    Test worlds are downsampled so that any live cell lights the reduced cell
+    """
+    world = np.zeros((7, 7), dtype=np.int8)
+    world[6, 6] = 1
+    reduced = downsample(world, 3)
+    assert reduced.shape == (3, 3)
+    assert reduced.sum() == 1 and reduced[2, 2]
+
+
+class TestTerminalRenderer(object):
+
+    def test_redraw_changes_only(self):
+        """
+        Test that only changed characters are redrawn
+        """
+        stream = io.StringIO()
+        renderer = TerminalRenderer(stream, fps=None, size=(20, 10))
+
+        world = np.zeros((16, 16), dtype=np.int8)
+        world[0, 0] = 1
+        assert renderer.render(world, "first")
+        first = stream.getvalue()
+        assert "\x1b[2J" in first
+        assert first.count("⠁") == 1
+        assert first.count("⠀") == 31
+
+        # An identical frame only updates the status line
+        stream.seek(0)
+        stream.truncate()
+        renderer.render(world, "second")
+        assert stream.getvalue() == "\x1b[5;1Hsecond\x1b[K"
+
+        # Changing two adjacent characters draws them with a single cursor move
+        stream.seek(0)
+        stream.truncate()
+        world[4, 3:5] = 1
+        renderer.render(world)
+        assert stream.getvalue() == "\x1b[2;2H⠈⠁"
+
+    def test_fits_terminal(self):
+        """
+        Test large worlds are downsampled to the size of the terminal
+        """
+        renderer = TerminalRenderer(io.StringIO(), size=(20, 11))
+        assert renderer.factor((400, 40)) == 10
+        assert renderer.factor((40, 400)) == 10
+        assert renderer.factor((8, 8)) == 1
+
+        renderer.render(np.ones((400, 400), dtype=np.int8))
+        assert renderer.previous.shape[0] <= 10
+        assert renderer.previous.shape[1] <= 20
+
+    def test_frame_rate(self):
+        """
+        Test frames are dropped to cap the frame rate unless forced
+        """
+        renderer = TerminalRenderer(io.StringIO(), fps=0.001, size=(20, 10))
+        world = np.zeros((8, 8), dtype=np.int8)
+        assert renderer.render(world)
+        assert not renderer.ready()
+        assert not renderer.render(world)
+        assert renderer.render(world, force=True)
+
+    def test_tty(self):
+        """
+        Test a simulation can be watched in the terminal
+        """
+        stream = io.StringIO()
+        sim = VectorizedLife(32, 32)
+        sim.randomize(42)
+        sim.tty(steps=5, fps=None, stream=stream)
+
+        assert sim.now == 5
+        assert "Timestep 5" in stream.getvalue()
+        assert stream.getvalue().endswith("\x1b[?25h\n")
@@ -0,0 +1,59 @@
+# tests.test_tiled
+# Tests for the cache-blocked game of life simulation.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 29 13:05:22 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_tiled.py [] benjamin@bengfort.com $
+
+"""
+Tests for the cache-blocked game of life simulation.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+
+from fastlife.tiled import *
+from fastlife.vectorized import VectorizedLife
+from fastlife.exceptions import FastlifeValueError
+
+
+class TestTiledLife(object):
+
+    @pytest.mark.parametrize("tile,depth", [(8, 3), (5, 1), (64, 4), (4, 6)])
+    def test_matches_vectorized(self, tile, depth):
+        """
+        Test tiles that do not divide the world and deep halos give the same world
+        """
+        expected = VectorizedLife(37, 29)
+        expected.randomize(42)
+        expected.run(50, progress=False)
+
+        sim = TiledLife(37, 29, tile=tile, depth=depth)
+        sim.randomize(42)
+        sim.run(49, progress=False)
+        sim.step()
+
+        assert sim.now == 50
+        assert sim.passes == -(-49 // depth) + 1
+        assert (sim.cframe._world == expected.cframe._world).all()
+
+    def test_advance(self):
+        """
+        Test a pass cannot advance more generations than the depth
+        """
+        sim = TiledLife(16, 16, tile=8, depth=2)
+        sim.randomize(1)
+        assert sim.nbytes == 5 * 12 * 12
+
+        with pytest.raises(FastlifeValueError):
+            sim.advance(3)
+
+        with pytest.raises(FastlifeValueError):
+            TiledLife(16, 16, tile=8, depth=0)
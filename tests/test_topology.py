@@ -0,0 +1,180 @@
+# tests.test_topology
+# Tests for Life-like rules on arbitrary topologies.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Nov 02 11:02:37 2026 -0500
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_topology.py [] benjamin@bengfort.com $
+
+"""
+Tests for Life-like rules on arbitrary topologies.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import numpy as np
+
+from fastlife.topology import *
+from fastlife.grid import MOORE, VON_NEUMANN
+from fastlife.vectorized import VectorizedLife
+from fastlife.exceptions import FastlifeValueError, FastlifeTypeError
+
+
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+def world_with(shape, cells):
+    world = np.zeros(shape, dtype=np.int8)
+    for i, j in cells:
+        world[i, j] = 1
+    return world
+
+
+def test_parse_rule():
+    """
+    Test parsing rules in B/S notation
+    """
+    assert parse_rule("B3/S23") == Rule(frozenset([3]), frozenset([2, 3]))
+    assert parse_rule("b2/s") == Rule(frozenset([2]), frozenset())
+    assert parse_rule("B3,12/S2,3") == Rule(frozenset([3, 12]), frozenset([2, 3]))
+
+    with pytest.raises(FastlifeValueError):
+        parse_rule("R5,C0,M1,S34..58,B34..45,NM")
+
+
+@pytest.mark.parametrize("adjacency", [MOORE, VON_NEUMANN])
+def test_lattice_special_cases(adjacency):
+    """
+    Test the Moore and von Neumann topologies match the vectorized engine
+    """
+    expected = VectorizedLife(37, 29)
+    expected.randomize(11)
+    for grid in expected.frames:
+        grid.adjacency = adjacency
+
+    sim = TopologyLife(37, 29, topology=adjacency)
+    sim.populate(expected.cframe._world)
+    for _ in range(25):
+        expected.step()
+        sim.step()
+        np.testing.assert_array_equal(sim.cframe._world, expected.cframe._world)
+
+
+def test_moore_degrees():
+    """
+    Test the neighbors of the corners, edges and interior of a Moore lattice
+    """
+    topology = moore((5, 6))
+    assert topology.size == 30 and topology.shape == (5, 6)
+    assert len(topology.neighbors((0, 0))) == 3
+    assert len(topology.neighbors((0, 3))) == 5
+    assert len(topology.neighbors((2, 3))) == 8
+    assert sorted(topology.neighbors((0, 0))) == [1, 6, 7]
+
+    wrapped = moore((5, 6), wrap=True)
+    assert (wrapped.degree == 8).all()
+    assert sorted(wrapped.neighbors((0, 0))) == [1, 5, 6, 7, 11, 24, 25, 29]
+
+
+def test_torus_glider():
+    """
+    Test a glider returns to its starting position on a torus
+    """
+    world = world_with((10, 10), GLIDER)
+    sim = TopologyLife(10, 10, wrap=True)
+    sim.populate(world)
+    sim.run(40, progress=False)
+    np.testing.assert_array_equal(sim.cframe._world, world)
+
+
+def test_twisted_torus():
+    """
+    Test crossing the edge of a twisted torus shifts columns by the twist
+    """
+    topology = moore((5, 6), wrap=True, twist=2)
+    assert sorted(topology.neighbors((4, 3))) == [0, 4, 5, 20, 21, 22, 26, 28]
+
+    # The glider travels down and right so wraps shift it right by two columns
+    world = world_with((10, 10), GLIDER)
+    sim = TopologyLife(10, 10, wrap=True, twist=2)
+    sim.populate(world)
+    sim.run(40, progress=False)
+    np.testing.assert_array_equal(sim.cframe._world, np.roll(world, 2, axis=1))
+
+    with pytest.raises(FastlifeValueError):
+        moore((5, 6), twist=2)
+
+
+def test_klein_bottle():
+    """
+    Test crossing the edge of a Klein bottle mirrors the columns
+    """
+    topology = von_neumann((4, 5), wrap=True, flip=True)
+    assert sorted(topology.neighbors((0, 1))) == [0, 2, 6, 18]
+    assert sorted(topology.neighbors((3, 1))) == [3, 11, 15, 17]
+
+
+def test_hexagonal():
+    """
+    Test hexagonal lattices have six neighbors and support hexagonal rules
+    """
+    topology = hexagonal((6, 6), wrap=True)
+    assert (topology.degree == 6).all()
+    assert sorted(topology.neighbors((2, 2))) == [8, 9, 13, 15, 19, 20]
+
+    # Each of three mutually adjacent cells has two neighbors, so they survive
+    world = world_with((6, 6), [(2, 2), (2, 3), (3, 2)])
+    sim = TopologyLife(6, 6, topology=HEXAGONAL, rule="B2/S12")
+    sim.populate(world)
+    sim.step()
+    assert sim.cframe._world[world == 1].all()
+
+
+def test_graph():
+    """
+    Test rules on an irregular graph with isolated cells
+    """
+    # A star with four leaves and an isolated cell
+    topology = Topology.from_edges(6, [(0, 1), (0, 2), (0, 3), (0, 4)])
+    assert topology.isolated and topology.max_degree == 4
+    counts = topology.count(np.array([0, 1, 1, 1, 0, 1], dtype=np.int8))
+    assert counts.tolist() == [3, 0, 0, 0, 0, 0]
+
+    sim = TopologyLife(6, 1, topology=topology, rule="B3/S1")
+    sim.populate(np.array([[0, 1, 1, 1, 0, 1]], dtype=np.int8))
+    sim.step()
+    assert sim.cframe._world.tolist() == [[1, 0, 0, 0, 0, 0]]
+    sim.step()
+    assert sim.cframe._world.tolist() == [[0, 0, 0, 0, 0, 0]]
+
+    directed = Topology.from_neighbors([[1], [], [0, 1]])
+    assert directed.count(np.array([1, 1, 0], dtype=np.int8)).tolist() == [1, 0, 2]
+
+
+def test_bad_topologies():
+    """
+    Test invalid topologies and worlds raise exceptions
+    """
+    with pytest.raises(FastlifeValueError):
+        Topology([0, 2, 1], [0, 1])
+
+    with pytest.raises(FastlifeValueError):
+        Topology([0, 1, 2], [1, 2])
+
+    with pytest.raises(FastlifeValueError):
+        Topology([0, 1, 2], [1, 0], shape=(3, 1))
+
+    with pytest.raises(FastlifeValueError):
+        TopologyLife(10, 10, topology=moore((5, 5)))
+
+    with pytest.raises(FastlifeValueError):
+        TopologyLife(10, 10, topology="triangular")
+
+    with pytest.raises(FastlifeTypeError):
+        TopologyLife(10, 10, topology=42)
@@ -0,0 +1,112 @@
+# tests.test_vectorized
+# Tests for the vectorized game of life simulation.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 14:40:12 2026 -0400
+#
+# Copyright (C) 2020 Bengfort.com
+# For license information, see LICENSE
+#
+# ID: test_vectorized.py [] benjamin@bengfort.com $
+
+"""
+Tests for the vectorized game of life simulation.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import tracemalloc
+import numpy as np
+
+from fastlife.grid import *
+from fastlife.vectorized import *
+from fastlife.sequential import SequentialLife
+
+
+GLIDER = np.asarray([[0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=np.int8)
+
+
+class TestVectorizedLife(object):
+
+    def test_blinker(self):
+        """
+        Test a blinker oscillates with period two
+        """
+        sim = VectorizedLife(5, 5)
+        sim.cframe._world[2, 1:4] = 1
+        initial = sim.cframe._world.copy()
+
+        sim.step()
+        assert sim.now == 1
+        assert sim.cframe._world[1:4, 2].all()
+        assert sim.cframe._world.sum() == 3
+
+        sim.step()
+        assert (sim.cframe._world == initial).all()
+
+    def test_edges_are_dead(self):
+        """
+        Test that cells outside the world are treated as dead
+        """
+        sim = VectorizedLife(4, 4)
+        sim.cframe._world[0:2, 0:2] = 1
+        sim.step()
+        assert sim.cframe._world.sum() == 4
+        assert sim.cframe._world[0:2, 0:2].all()
+
+    @pytest.mark.parametrize("adjacency", [VON_NEUMANN, MOORE])
+    def test_matches_sequential(self, adjacency):
+        """
+        Test the vectorized step matches the sequential step away from the edges
+        """
+        seq, vec = SequentialLife(24, 24), VectorizedLife(24, 24)
+        rng = np.random.RandomState(42)
+        seed = rng.randint(2, size=(16, 16)).astype(np.int8)
+
+        for sim in (seq, vec):
+            for grid in sim.frames:
+                grid.adjacency = adjacency
+            sim.cframe._world[4:20, 4:20] = seed
+
+        for _ in range(3):
+            seq.step()
+            vec.step()
+            assert (seq.cframe._world == vec.cframe._world).all()
+
+    def test_glider(self):
+        """
+        Test a glider translates one cell diagonally every four steps
+        """
+        sim = VectorizedLife(12, 12)
+        sim.cframe._world[1:4, 1:4] = GLIDER
+        sim.initialized = True
+        sim.run(8, progress=False)
+
+        expected = np.zeros((12, 12), dtype=np.int8)
+        expected[3:6, 3:6] = GLIDER
+        assert (sim.cframe._world == expected).all()
+        assert sim.cframe._world.dtype == np.int8
+
+    def test_steady_state_allocations(self):
+        """
+        Test that steady state generations do not allocate full-size arrays
+        """
+        sim = VectorizedLife(1024, 1024)
+        sim.randomize(42)
+        sim.step()
+
+        world = sim.cframe._world.nbytes
+        # Starting tracemalloc resets the peak, so no reset_peak (Python 3.9+) needed
+        tracemalloc.start()
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
+            for _ in range(5):
+                sim.step()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak - baseline < world // 16, "step allocated a large temporary"